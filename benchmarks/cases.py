@@ -0,0 +1,214 @@
+"""
+벤치마크 케이스
+CPU를 많이 쓰는 경로(MIME 조립과 base64, 일정 변환, 업로드 디코딩, 요청 검증, 결과 직렬화)를
+실제와 비슷한 크기의 입력으로 측정한다
+"""
+import base64
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict
+
+from src.google_services.calendar_service import CalendarEvent
+from src.google_services.gmail_service import EmailMessage, GmailService
+from src.http_server import TaskRequest, _spool_b64_content
+
+
+# 케이스 이름 -> 준비 함수 (측정할 인자 없는 함수를 반환)
+CASES: Dict[str, Callable[[], Callable[[], Any]]] = {}
+
+MB = 1024 * 1024
+
+_workdir = tempfile.TemporaryDirectory(prefix="law_mate_bench_")
+
+
+def case(name: str):
+    """벤치마크 케이스 등록 데코레이터"""
+
+    def decorator(setup: Callable[[], Callable[[], Any]]):
+        CASES[name] = setup
+        return setup
+
+    return decorator
+
+
+def _attachment(size: int) -> str:
+    """size 바이트짜리 임시 첨부파일 경로 (한 번만 만든다)"""
+    path = os.path.join(_workdir.name, f"attachment_{size}.pdf")
+    if not os.path.exists(path):
+        with open(path, "wb") as f:
+            f.write(os.urandom(size))
+    return path
+
+
+def _gmail_service() -> GmailService:
+    # create_message는 API를 호출하지 않으므로 인증/서비스 생성 없이 만든다
+    return GmailService.__new__(GmailService)
+
+
+def _korean_body(size: int) -> str:
+    line = "임대차 계약 만료일이 다가와 갱신 여부를 확인 부탁드립니다. Contract renewal notice.\n"
+    return (line * (size // len(line.encode("utf-8")) + 1))[:size // 2]
+
+
+# --- Gmail ---
+
+@case("gmail.create_message[small]")
+def _create_message_small():
+    service = _gmail_service()
+    email = EmailMessage(to="client@example.com", subject="계약서 검토 요청", body="첨부한 계약서 검토 부탁드립니다.")
+    return lambda: service.create_message(email)
+
+
+@case("gmail.create_message[html_64KB]")
+def _create_message_html():
+    service = _gmail_service()
+    body = "<html><body>" + "<p>" + _korean_body(64 * 1024) + "</p></body></html>"
+    email = EmailMessage(
+        to="client@example.com",
+        subject="계약 만료 안내",
+        body=body,
+        cc=["lawyer@example.com", "assistant@example.com"],
+        html=True,
+    )
+    return lambda: service.create_message(email)
+
+
+def _create_message_attachment(size: int):
+    service = _gmail_service()
+    email = EmailMessage(
+        to="client@example.com",
+        subject="계약서 사본",
+        body=_korean_body(2 * 1024),
+        attachments=[_attachment(size)],
+    )
+    return lambda: service.create_message(email)
+
+
+@case("gmail.create_message[attachment_1MB]")
+def _create_message_1mb():
+    return _create_message_attachment(1 * MB)
+
+
+@case("gmail.create_message[attachment_25MB]")
+def _create_message_25mb():
+    # Gmail 첨부파일 최대 크기
+    return _create_message_attachment(25 * MB)
+
+
+# --- Calendar ---
+
+@case("calendar.to_google_event[simple]")
+def _to_google_event_simple():
+    start = datetime(2026, 3, 2, 10, 0)
+    event = CalendarEvent(summary="계약 검토 미팅", start_time=start, end_time=start + timedelta(hours=1))
+    return event.to_google_event
+
+
+@case("calendar.to_google_event[50_attendees]")
+def _to_google_event_attendees():
+    start = datetime(2026, 3, 2, 10, 0)
+    event = CalendarEvent(
+        summary="분기 계약 갱신 회의",
+        start_time=start,
+        end_time=start + timedelta(hours=2),
+        description=_korean_body(4 * 1024),
+        location="서울시 강남구 테헤란로 123",
+        attendees=[f"member{i}@example.com" for i in range(50)],
+        reminders=[10, 30, 60, 24 * 60],
+    )
+    return event.to_google_event
+
+
+# --- Drive 업로드 디코딩 ---
+
+def _spool(size: int):
+    content_b64 = base64.b64encode(os.urandom(size)).decode("ascii")
+
+    def run():
+        _spool_b64_content(content_b64).close()
+
+    return run
+
+
+@case("http._spool_b64_content[64KB]")
+def _spool_64kb():
+    return _spool(64 * 1024)
+
+
+@case("http._spool_b64_content[1MB]")
+def _spool_1mb():
+    return _spool(1 * MB)
+
+
+@case("http._spool_b64_content[25MB]")
+def _spool_25mb():
+    return _spool(25 * MB)
+
+
+# --- 요청 검증 ---
+
+@case("http.TaskRequest[email]")
+def _task_request_email():
+    data = {
+        "type": "email",
+        "payload": {"to": "client@example.com", "subject": "계약서 검토 요청", "body": _korean_body(2 * 1024)},
+    }
+    return lambda: TaskRequest.model_validate(data)
+
+
+@case("http.TaskRequest[calendar_bulk_100]")
+def _task_request_calendar_bulk():
+    events = [
+        {
+            "summary": f"계약 마감 {i}",
+            "start_time": "2026-03-02T10:00:00",
+            "end_time": "2026-03-02T11:00:00",
+            "attendees": ["client@example.com"],
+        }
+        for i in range(100)
+    ]
+    data = {"type": "calendar_bulk", "timezone": "Asia/Seoul", "payload": {"events": events}}
+    return lambda: TaskRequest.model_validate(data)
+
+
+@case("http.TaskRequest[drive_1MB_json]")
+def _task_request_drive():
+    # 실제 경로와 같이 원시 JSON 본문에서 검증
+    body = json.dumps({
+        "type": "drive",
+        "payload": {
+            "contract_name": "2026년 임대차 계약서",
+            "file_name": "lease.pdf",
+            "file_content_b64": base64.b64encode(os.urandom(1 * MB)).decode("ascii"),
+            "contract_date": "2026-03-02",
+            "parties": ["회사A", "회사B"],
+        },
+    })
+    return lambda: TaskRequest.model_validate_json(body)
+
+
+# --- MCP 결과 직렬화 ---
+
+def _event_result(i: int) -> Dict[str, Any]:
+    return {
+        "success": True,
+        "event_id": f"evt{i:06d}abcdef",
+        "html_link": f"https://www.google.com/calendar/event?eid=evt{i:06d}",
+        "summary": f"계약 마감 {i}",
+        "start": "2026-03-02T10:00:00+09:00",
+        "end": "2026-03-02T11:00:00+09:00",
+    }
+
+
+@case("mcp.json_dumps[single]")
+def _json_dumps_single():
+    result = _event_result(0)
+    return lambda: json.dumps(result, ensure_ascii=False, indent=2)
+
+
+@case("mcp.json_dumps[bulk_500]")
+def _json_dumps_bulk():
+    results = [_event_result(i) for i in range(500)]
+    return lambda: json.dumps(results, ensure_ascii=False, indent=2)
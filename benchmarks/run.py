@@ -0,0 +1,208 @@
+"""
+벤치마크 실행기
+케이스별 호출 시간(반복 측정 중 최솟값/중앙값)과 최대 메모리 사용량을 측정하고
+저장된 기준값(baseline.json)과 비교한다
+
+사용법 (저장소 루트에서):
+    python -m benchmarks.run                  # 측정 후 기준값과 비교 (회귀가 있으면 종료 코드 1)
+    python -m benchmarks.run -k gmail         # 이름에 gmail이 들어간 케이스만
+    python -m benchmarks.run --save           # 측정 결과를 기준값으로 저장
+"""
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.cases import CASES
+
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+# 반복 한 번이 최소 이 시간은 걸리도록 호출 횟수를 늘린다
+MIN_REPEAT_SECONDS = 0.2
+DEFAULT_REPEATS = 5
+
+# 기준값 대비 이 비율을 넘으면 회귀로 판단
+DEFAULT_TIME_THRESHOLD = 1.25
+DEFAULT_MEMORY_THRESHOLD = 1.10
+# 메모리 차이가 이보다 작으면 비율과 관계없이 회귀로 보지 않는다 (1KB 안팎 할당의 잡음 방지)
+DEFAULT_MEMORY_FLOOR_BYTES = 4 * 1024
+
+
+def _calibrate(func: Callable[[], Any]) -> int:
+    """반복 한 번이 MIN_REPEAT_SECONDS 이상 걸리는 호출 횟수 (timeit.autorange 방식)"""
+    number = 1
+    while True:
+        elapsed = _time_loop(func, number)
+        if elapsed >= MIN_REPEAT_SECONDS:
+            return number
+        number *= 10 if elapsed < MIN_REPEAT_SECONDS / 10 else 2
+
+
+def _time_loop(func: Callable[[], Any], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+
+def _peak_memory(func: Callable[[], Any]) -> int:
+    """한 번 호출하는 동안 새로 할당된 메모리의 최댓값 (바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - baseline)
+
+
+def measure(func: Callable[[], Any], repeats: int = DEFAULT_REPEATS) -> Dict[str, Any]:
+    """
+    함수 하나 측정
+
+    시간과 메모리는 따로 잰다 (tracemalloc이 켜져 있으면 실행이 느려진다).
+
+    Returns:
+        min_s/median_s(호출 1회 시간), loops, repeats, peak_bytes
+    """
+    func()  # 캐시/지연 import 워밍업
+    number = _calibrate(func)
+    timings = [_time_loop(func, number) / number for _ in range(repeats)]
+    return {
+        "min_s": min(timings),
+        "median_s": statistics.median(timings),
+        "loops": number,
+        "repeats": repeats,
+        "peak_bytes": _peak_memory(func),
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    time_threshold: float,
+    memory_threshold: float,
+    memory_floor: int = DEFAULT_MEMORY_FLOOR_BYTES
+) -> List[str]:
+    """기준값 대비 회귀한 항목 설명 목록 (시간은 min_s 기준, 메모리는 memory_floor 바이트 이상 늘어난 경우만)"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if base["min_s"] > 0 and result["min_s"] / base["min_s"] > time_threshold:
+            regressions.append(
+                f"{name}: 시간 {_format_time(base['min_s'])} -> {_format_time(result['min_s'])} "
+                f"(x{result['min_s'] / base['min_s']:.2f})"
+            )
+        if (
+            base["peak_bytes"] > 0
+            and result["peak_bytes"] - base["peak_bytes"] >= memory_floor
+            and result["peak_bytes"] / base["peak_bytes"] > memory_threshold
+        ):
+            regressions.append(
+                f"{name}: 메모리 {_format_bytes(base['peak_bytes'])} -> {_format_bytes(result['peak_bytes'])} "
+                f"(x{result['peak_bytes'] / base['peak_bytes']:.2f})"
+            )
+    return regressions
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+def _ratio(value: float, base: Optional[float]) -> str:
+    if not base:
+        return "-"
+    return f"x{value / base:.2f}"
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, Dict[str, Any]]:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("cases", {})
+
+
+def save_baseline(results: Dict[str, Dict[str, Any]], path: Path = BASELINE_PATH):
+    """측정 결과를 기준값으로 저장 (기존 기준값의 다른 케이스는 유지)"""
+    cases = load_baseline(path)
+    cases.update(results)
+    data = {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "cases": dict(sorted(cases.items())),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Law Mate Agent 벤치마크")
+    parser.add_argument("-k", "--filter", default="", help="이름에 이 문자열이 들어간 케이스만 실행")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="반복 측정 횟수")
+    parser.add_argument("--save", action="store_true", help="측정 결과를 기준값으로 저장")
+    parser.add_argument("--time-threshold", type=float, default=DEFAULT_TIME_THRESHOLD,
+                        help="시간 회귀 판단 비율 (기본 1.25)")
+    parser.add_argument("--memory-threshold", type=float, default=DEFAULT_MEMORY_THRESHOLD,
+                        help="메모리 회귀 판단 비율 (기본 1.10)")
+    parser.add_argument("--memory-floor", type=int, default=DEFAULT_MEMORY_FLOOR_BYTES,
+                        help="회귀로 볼 최소 메모리 증가량 (바이트, 기본 4096)")
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline()
+    names = [name for name in CASES if args.filter in name]
+    if not names:
+        print(f"No benchmark matches '{args.filter}'")
+        return 1
+
+    results: Dict[str, Dict[str, Any]] = {}
+    print(f"{'case':<42} {'min':>10} {'median':>10} {'peak mem':>10} {'time':>7} {'mem':>7}")
+    for name in names:
+        func = CASES[name]()
+        result = measure(func, repeats=args.repeats)
+        results[name] = result
+        base = baseline.get(name, {})
+        print(
+            f"{name:<42} {_format_time(result['min_s']):>10} {_format_time(result['median_s']):>10} "
+            f"{_format_bytes(result['peak_bytes']):>10} "
+            f"{_ratio(result['min_s'], base.get('min_s')):>7} {_ratio(result['peak_bytes'], base.get('peak_bytes')):>7}"
+        )
+
+    if args.save:
+        save_baseline(results)
+        print(f"Baseline saved: {BASELINE_PATH}")
+        return 0
+
+    regressions = compare(results, baseline, args.time_threshold, args.memory_threshold, args.memory_floor)
+    if regressions:
+        print("\nRegressions:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
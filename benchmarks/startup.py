@@ -0,0 +1,88 @@
+"""
+기동 시간 점검
+진입점 모듈을 새 인터프리터에서 import해 시간 예산을 넘는지,
+지연 로딩해야 할 무거운 Google 클라이언트 모듈을 불러오는지 확인한다
+예산은 tests/test_startup.py가 pytest로 강제하며, 이 스크립트는 수동으로 측정값을 보고하는 용도다
+
+사용법 (저장소 루트에서):
+    python -m benchmarks.startup                  # 예산 초과 또는 금지 모듈 로드 시 종료 코드 1
+    python -m benchmarks.startup --budget-scale 2 # 느린 머신(CI 등)에서 예산 완화
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# 진입점별 import 시간 예산 (초, 반복 측정 중 최솟값 기준)
+IMPORT_BUDGETS: Dict[str, float] = {
+    "src.http_server": 0.6,
+    "src.mcp_server": 1.2,
+}
+
+# 진입점 import만으로 불러오면 안 되는 모듈 (첫 작업이나 워밍업에서 불러온다)
+LAZY_MODULES = (
+    "googleapiclient",
+    "google_auth_oauthlib",
+    "google.oauth2.credentials",
+    "google_auth_httplib2",
+    "src.google_services.gmail_service",
+    "src.google_services.drive_service",
+    "src.google_services.calendar_service",
+)
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [name for name in {lazy!r} if name in sys.modules]}}))
+"""
+
+
+def probe(module: str) -> Dict[str, Any]:
+    """새 인터프리터에서 module을 import하고 걸린 시간과 불러온 지연 모듈 목록 반환"""
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, lazy=LAZY_MODULES)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="진입점 import 시간 점검")
+    parser.add_argument("--repeats", type=int, default=5, help="반복 측정 횟수 (첫 실행은 디스크 캐시 워밍업으로 제외)")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="예산 배율")
+    args = parser.parse_args(argv)
+
+    failures = []
+    for module, budget in IMPORT_BUDGETS.items():
+        probe(module)
+        results = [probe(module) for _ in range(args.repeats)]
+        seconds = min(result["seconds"] for result in results)
+        loaded = results[0]["loaded"]
+        limit = budget * args.budget_scale
+        print(f"{module:<20} {seconds * 1000:8.1f}ms  (budget {limit * 1000:.0f}ms)")
+
+        if seconds > limit:
+            failures.append(f"{module}: {seconds * 1000:.1f}ms > {limit * 1000:.0f}ms")
+        if loaded:
+            failures.append(f"{module}: loads {', '.join(loaded)} at import time")
+
+    if failures:
+        print("\nStartup check failed:")
+        for line in failures:
+            print(f"  {line}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,41 +1,340 @@
 import asyncio
+import json
 import shlex
-from typing import Any, List, Optional
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, List, Optional, Set, Tuple
 
+import anyio
 from mcp.client.session import ClientSession
-from mcp.types import Tool
+from mcp.client.stdio import StdioServerParameters, stdio_client
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, ServerNotification, Tool, ToolListChangedNotification
+
+
+class _SessionRunner:
+    """stdio MCP 세션 하나를 전용 태스크에서 유지.
+
+    stdio_client/ClientSession 컨텍스트는 연 태스크에서 닫아야 하므로
+    호출자 태스크가 아닌 전용 태스크가 세션 수명을 관리한다.
+    """
+
+    def __init__(self, params: StdioServerParameters, message_handler: Optional[Callable] = None):
+        self.params = params
+        self.message_handler = message_handler
+        self.session: Optional[ClientSession] = None
+        self.in_flight = 0
+        self._task: Optional[asyncio.Task] = None
+        self._closed = asyncio.Event()
+
+    @property
+    def alive(self) -> bool:
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    async def start(self) -> ClientSession:
+        """서버 프로세스를 띄우고 initialize까지 마친 세션 반환"""
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(ready))
+        return await ready
+
+    async def _run(self, ready: asyncio.Future):
+        try:
+            async with stdio_client(self.params) as (read_stream, write_stream):
+                async with ClientSession(
+                    read_stream,
+                    write_stream,
+                    message_handler=self.message_handler,
+                ) as session:
+                    await session.initialize()
+                    self.session = session
+                    ready.set_result(session)
+                    await self._closed.wait()
+        except Exception as exc:
+            if not ready.done():
+                ready.set_exception(exc)
+        finally:
+            self.session = None
+
+    async def ping(self, timeout: float) -> bool:
+        """ping 요청으로 서버 응답 확인"""
+        if not self.alive:
+            return False
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout=timeout)
+        except Exception:
+            return False
+        return True
+
+    async def close(self):
+        self._closed.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+class _TTLCache:
+    """크기 제한 LRU + 항목별 만료 시간 캐시."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float):
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+def _result_cache_key(name: str, arguments: Any) -> Tuple[str, str]:
+    """도구 이름 + 정규화한 인자 (키 순서와 공백 차이를 무시)"""
+    canonical = json.dumps(arguments or {}, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return name, canonical
+
+
+def _is_connection_error(exc: BaseException) -> bool:
+    """서버 프로세스/연결이 끊겨 세션을 버려야 하는 오류인지 확인"""
+    if isinstance(exc, (anyio.ClosedResourceError, anyio.BrokenResourceError, BrokenPipeError)):
+        return True
+    return isinstance(exc, McpError) and exc.error.code == CONNECTION_CLOSED
 
 
 class MCPClient:
-    """MCP 서버와 통신하는 경량 클라이언트."""
+    """MCP 서버와 통신하는 경량 클라이언트.
+
+    서버 프로세스 pool_size개를 세션 풀로 유지하고 진행 중인 요청이 가장 적은
+    세션으로 호출을 보낸다 (같으면 라운드 로빈). 세션마다 여러 요청을 동시에 보내며,
+    JSON-RPC 요청 ID별 응답 매칭은 ClientSession이 한다.
+
+    주기적으로 ping을 보내 응답하지 않는 세션을 교체하고, warm_standby가 켜져 있으면
+    미리 띄워 둔 대기 세션을 바로 투입해 교체 중에도 콜드 스타트가 없다.
+
+    도구 목록은 tools_ttl이 지나거나 서버가 tools/list_changed를 보내면 다시 조회한다.
+    cached_tools에 지정한 읽기 전용 도구(예: {"search_contracts": 60})는 도구 이름과
+    인자가 같으면 TTL 동안 결과를 재사용하며, 그 밖의 도구를 호출하면 결과 캐시를 비운다.
+    """
 
-    def __init__(self, server_cmd: str, workdir: Optional[str] = None):
+    def __init__(
+        self,
+        server_cmd: str,
+        workdir: Optional[str] = None,
+        pool_size: int = 2,
+        warm_standby: bool = True,
+        health_check_interval: float = 30.0,
+        ping_timeout: float = 5.0,
+        tools_ttl: float = 300.0,
+        cached_tools: Optional[Dict[str, float]] = None,
+        result_cache_size: int = 256,
+    ):
         self.server_cmd = server_cmd
         self.workdir = workdir
-        self._session: Optional[ClientSession] = None
+        self.pool_size = max(1, pool_size)
+        self.warm_standby = warm_standby
+        self.health_check_interval = health_check_interval
+        self.ping_timeout = ping_timeout
+        self._pool: List[_SessionRunner] = []
+        self._standby: Optional[_SessionRunner] = None
+        self._next = 0
+        self.tools_ttl = tools_ttl
+        self.cached_tools = dict(cached_tools or {})
         self._tools_cache: Optional[List[Tool]] = None
+        self._tools_fetched_at = 0.0
+        self._result_cache = _TTLCache(result_cache_size)
+        # 서버 프로세스 생성만 직렬화 (풀 목록 변경은 await 없이 이루어진다)
         self._lock = asyncio.Lock()
+        self._health_task: Optional[asyncio.Task] = None
+        self._background: Set[asyncio.Task] = set()
+        self._closed = False
 
-    async def _ensure_session(self):
-        """세션이 없으면 초기화"""
-        if self._session:
-            return
+    async def start(self):
+        """풀과 대기 세션을 미리 띄우고 상태 점검 시작 (앱 시작 시 호출하면 첫 요청에 콜드 스타트가 없다)"""
+        self._closed = False
+        await self._fill()
+        if self._health_task is None and self.health_check_interval > 0:
+            self._health_task = asyncio.create_task(self._health_loop())
 
+    def _server_params(self) -> StdioServerParameters:
         args = shlex.split(self.server_cmd)
-        session = ClientSession()
-        await session.initialize(stdio_cmd=args, cwd=self.workdir or None)
-        self._session = session
+        return StdioServerParameters(command=args[0], args=args[1:], cwd=self.workdir or None)
 
-    async def list_tools(self) -> List[Tool]:
-        """도구 목록 조회 (캐시)"""
+    async def _handle_message(self, message: Any):
+        """서버 알림 처리 (도구 목록 변경 시 캐시 무효화)"""
+        if isinstance(message, ServerNotification) and isinstance(message.root, ToolListChangedNotification):
+            self._tools_cache = None
+
+    async def _fill(self):
+        """죽은 세션을 정리하고 풀과 대기 세션을 목표 수까지 채움"""
         async with self._lock:
-            await self._ensure_session()
-            if self._tools_cache is None:
-                self._tools_cache = await self._session.list_tools()
-            return self._tools_cache
+            if self._closed:
+                return
+            for runner in [r for r in self._pool if not r.alive]:
+                self._discard(runner, refill=False)
+            if self._standby is not None and not self._standby.alive:
+                self._discard(self._standby, refill=False)
+
+            missing = self.pool_size - len(self._pool)
+            if self.warm_standby and self._standby is None:
+                missing += 1
+            if missing <= 0:
+                return
+
+            runners = [_SessionRunner(self._server_params(), self._handle_message) for _ in range(missing)]
+            results = await asyncio.gather(*(runner.start() for runner in runners), return_exceptions=True)
+
+            error: Optional[BaseException] = None
+            for runner, result in zip(runners, results):
+                if isinstance(result, BaseException):
+                    error = result
+                elif len(self._pool) < self.pool_size:
+                    self._pool.append(runner)
+                elif self.warm_standby and self._standby is None:
+                    self._standby = runner
+                else:
+                    self._spawn(runner.close())
+
+            if not self._pool and error is not None:
+                raise error
+
+    def _discard(self, runner: _SessionRunner, refill: bool = True):
+        """세션을 풀에서 빼고 종료 (풀 세션이면 대기 세션을 대신 투입)"""
+        if runner in self._pool:
+            self._pool.remove(runner)
+            standby = self._standby
+            if standby is not None and standby.alive:
+                self._pool.append(standby)
+                self._standby = None
+        elif runner is self._standby:
+            self._standby = None
+        self._spawn(runner.close())
+        if refill:
+            self._spawn(self._fill())
+
+    def _spawn(self, coro):
+        """백그라운드 태스크 실행 (참조 유지, 예외는 조용히 버린다)"""
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def _health_loop(self):
+        """주기적으로 ping을 보내 응답 없는 세션 교체"""
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            runners = list(self._pool)
+            if self._standby is not None:
+                runners.append(self._standby)
+            healthy = await asyncio.gather(*(runner.ping(self.ping_timeout) for runner in runners))
+            for runner, ok in zip(runners, healthy):
+                if not ok:
+                    self._discard(runner, refill=False)
+            try:
+                await self._fill()
+            except Exception:
+                # 다음 점검 때 다시 시도
+                pass
+
+    async def _acquire(self) -> _SessionRunner:
+        """진행 중인 요청이 가장 적은 살아 있는 세션 선택"""
+        alive = [runner for runner in self._pool if runner.alive]
+        if not alive:
+            await self.start()
+            alive = [runner for runner in self._pool if runner.alive]
+            if not alive:
+                raise RuntimeError("MCP 서버 세션을 시작하지 못했습니다")
+        elif len(alive) < len(self._pool):
+            for runner in [r for r in self._pool if not r.alive]:
+                self._discard(runner)
+
+        self._next = (self._next + 1) % len(alive)
+        rotated = alive[self._next:] + alive[:self._next]
+        return min(rotated, key=lambda runner: runner.in_flight)
+
+    @asynccontextmanager
+    async def _lease(self) -> AsyncIterator[ClientSession]:
+        """세션 하나를 빌려 요청 수를 집계하고, 연결 오류가 나면 세션 교체"""
+        runner = await self._acquire()
+        runner.in_flight += 1
+        try:
+            yield runner.session
+        except BaseException as exc:
+            if _is_connection_error(exc):
+                self._discard(runner)
+            raise
+        finally:
+            runner.in_flight -= 1
+
+    async def list_tools(self) -> List[Tool]:
+        """도구 목록 조회 (tools_ttl 동안 또는 list_changed 알림 전까지 캐시)"""
+        expired = time.monotonic() - self._tools_fetched_at > self.tools_ttl
+        if self._tools_cache is None or expired:
+            async with self._lease() as session:
+                result = await session.list_tools()
+            self._tools_cache = result.tools
+            self._tools_fetched_at = time.monotonic()
+        return self._tools_cache
+
+    async def call_tool(self, name: str, arguments: Any, use_cache: bool = True):
+        """MCP 도구 호출 (다른 호출과 동시에 진행)
+
+        Args:
+            name: 도구 이름
+            arguments: 도구 인자
+            use_cache: False면 cached_tools 도구라도 서버에서 새로 조회 (결과는 캐시에 반영)
+        """
+        ttl = self.cached_tools.get(name)
+        if ttl is None:
+            try:
+                async with self._lease() as session:
+                    return await session.call_tool(name, arguments)
+            finally:
+                # 쓰기 도구 호출 후에는 이전 조회 결과가 낡았을 수 있다
+                self._result_cache.clear()
+
+        key = _result_cache_key(name, arguments)
+        if use_cache:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                return cached
+
+        async with self._lease() as session:
+            result = await session.call_tool(name, arguments)
+        # 서버는 알 수 없는 도구, 인자 오류, {"success": false} 결과를 isError로 표시한다
+        if not result.isError:
+            self._result_cache.set(key, result, ttl)
+        return result
+
+    def invalidate_results(self):
+        """결과 캐시 비우기"""
+        self._result_cache.clear()
+
+    async def close(self):
+        """모든 세션과 서버 프로세스 종료"""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            await asyncio.gather(self._health_task, return_exceptions=True)
+            self._health_task = None
 
-    async def call_tool(self, name: str, arguments: Any):
-        """MCP 도구 호출"""
         async with self._lock:
-            await self._ensure_session()
-            return await self._session.call_tool(name, arguments)
+            self._closed = True
+            runners = list(self._pool)
+            if self._standby is not None:
+                runners.append(self._standby)
+            self._pool = []
+            self._standby = None
+
+        await asyncio.gather(*(runner.close() for runner in runners), return_exceptions=True)
+        await asyncio.gather(*self._background, return_exceptions=True)
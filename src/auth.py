@@ -4,11 +4,13 @@ Google OAuth 인증 관리
 import os
 import json
 from pathlib import Path
-from typing import Optional
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
+from typing import TYPE_CHECKING, Optional
 from src.config import Config
+from src.tracing import traced
+
+# google-auth/oauthlib는 import 비용이 커서 실제 인증 시점에 불러온다
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 
 class GoogleAuthManager:
@@ -18,9 +20,10 @@ class GoogleAuthManager:
         self.token_file = Config.TOKEN_FILE
         self.credentials_file = Config.CREDENTIALS_FILE
         self.scopes = Config.ALL_SCOPES
-        self.credentials: Optional[Credentials] = None
+        self.credentials: Optional["Credentials"] = None
 
-    def get_credentials(self) -> Credentials:
+    @traced("auth.get_credentials")
+    def get_credentials(self) -> "Credentials":
         """
         OAuth 인증 정보 가져오기
         토큰이 없거나 만료된 경우 새로 인증
@@ -28,6 +31,9 @@ class GoogleAuthManager:
         Returns:
             Credentials: Google OAuth 인증 정보
         """
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+
         # 기존 토큰 로드
         if self.token_file.exists():
             self.credentials = Credentials.from_authorized_user_file(
@@ -51,8 +57,10 @@ class GoogleAuthManager:
 
         return self.credentials
 
-    def _authenticate_new(self) -> Credentials:
+    def _authenticate_new(self) -> "Credentials":
         """새로운 OAuth 인증 플로우"""
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
         if not self.credentials_file.exists():
             raise FileNotFoundError(
                 f"Credentials file not found: {self.credentials_file}\n"
@@ -87,6 +95,8 @@ class GoogleAuthManager:
     def revoke_credentials(self):
         """인증 취소"""
         if self.credentials:
+            from google.auth.transport.requests import Request
+
             self.credentials.revoke(Request())
 
         # 토큰 파일 삭제
@@ -100,6 +110,8 @@ class GoogleAuthManager:
         if not self.token_file.exists():
             return False
 
+        from google.oauth2.credentials import Credentials
+
         try:
             credentials = Credentials.from_authorized_user_file(
                 str(self.token_file),
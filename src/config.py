@@ -25,6 +25,56 @@ class Config:
     PORT: int = int(os.getenv("PORT", "8080"))
     HOST: str = os.getenv("HOST", "localhost")
 
+    # 타임존 없는 시각을 해석할 기본 타임존 (HTTP 요청의 timezone 기본값, MCP 도구 인자)
+    DEFAULT_TIMEZONE: str = os.getenv("DEFAULT_TIMEZONE", "Asia/Seoul")
+
+    # Drive 업로드: 이 크기(바이트)까지는 메모리에서 처리하고, 초과분만 임시 파일로 기록
+    DRIVE_UPLOAD_SPOOL_MAX_BYTES: int = int(os.getenv("DRIVE_UPLOAD_SPOOL_MAX_BYTES", str(8 * 1024 * 1024)))
+
+    # Drive 변경 피드 동기화 주기 (초, 0이면 비활성화)
+    DRIVE_SYNC_INTERVAL_SECONDS: float = float(os.getenv("DRIVE_SYNC_INTERVAL_SECONDS", "300"))
+
+    # share_files가 기존 권한 목록을 다시 조회하기 전까지 재사용하는 시간 (초, 0이면 매번 조회)
+    DRIVE_PERMISSION_CACHE_TTL_SECONDS: float = float(os.getenv("DRIVE_PERMISSION_CACHE_TTL_SECONDS", "60"))
+
+    # 캘린더 로컬 미러 (조회를 syncToken 증분 동기화된 미러에서 처리)
+    CALENDAR_MIRROR_ENABLED: bool = os.getenv("CALENDAR_MIRROR_ENABLED", "true").lower() == "true"
+    CALENDAR_MIRROR_MAX_STALENESS_SECONDS: float = float(os.getenv("CALENDAR_MIRROR_MAX_STALENESS_SECONDS", "60"))
+
+    # 조회 작업 캐시 (TTL이 지나면 Google에 ETag 조건부 요청으로 변경 여부 확인)
+    READ_CACHE_MAX_ENTRIES: int = int(os.getenv("READ_CACHE_MAX_ENTRIES", "512"))
+    READ_CACHE_TTL_SECONDS: float = float(os.getenv("READ_CACHE_TTL_SECONDS", "30"))
+
+    # 기동 직후 백그라운드에서 Google 클라이언트 모듈 미리 import
+    STARTUP_WARM_UP: bool = os.getenv("STARTUP_WARM_UP", "true").lower() == "true"
+
+    # HTTP 게이트웨이에서 MCP SSE 엔드포인트(/mcp/sse) 제공 여부
+    MCP_HTTP_ENABLED: bool = os.getenv("MCP_HTTP_ENABLED", "true").lower() == "true"
+
+    # 작업 스케줄러: 전체 동시 실행 수, 우선순위 레인별 "이름:가중치:최대동시실행"
+    SCHEDULER_MAX_CONCURRENCY: int = int(os.getenv("SCHEDULER_MAX_CONCURRENCY", "16"))
+    SCHEDULER_LANES: str = os.getenv("SCHEDULER_LANES", "interactive:8:16,normal:4:8,batch:1:4")
+
+    # 영속 작업 큐 (켜면 /tasks가 작업을 큐에 넣고 202로 응답, 결과는 GET /tasks/{request_id})
+    TASK_QUEUE_ENABLED: bool = os.getenv("TASK_QUEUE_ENABLED", "false").lower() == "true"
+    TASK_QUEUE_LEASE_SECONDS: float = float(os.getenv("TASK_QUEUE_LEASE_SECONDS", "60"))
+    TASK_QUEUE_MAX_ATTEMPTS: int = int(os.getenv("TASK_QUEUE_MAX_ATTEMPTS", "3"))
+    TASK_QUEUE_POLL_SECONDS: float = float(os.getenv("TASK_QUEUE_POLL_SECONDS", "1"))
+    TASK_QUEUE_RETENTION_SECONDS: float = float(os.getenv("TASK_QUEUE_RETENTION_SECONDS", str(7 * 24 * 3600)))
+    # HTTP 서버 안에서 처리할 동시 작업 수 (0이면 별도 워커 프로세스만 처리)
+    TASK_QUEUE_LOCAL_WORKERS: int = int(os.getenv("TASK_QUEUE_LOCAL_WORKERS", "4"))
+    # 워커 프로세스(python -m src.task_worker) 하나의 동시 작업 수
+    TASK_WORKER_CONCURRENCY: int = int(os.getenv("TASK_WORKER_CONCURRENCY", "4"))
+
+    # 추적 span 내보내기 (none | file | otlp)
+    TRACING_EXPORTER: str = os.getenv("TRACING_EXPORTER", "none").lower()
+    TRACING_FILE: Path = Path(os.getenv(
+        "TRACING_FILE",
+        str(Path(__file__).parent.parent / "config" / "traces.jsonl")
+    ))
+    TRACING_OTLP_ENDPOINT: str = os.getenv("TRACING_OTLP_ENDPOINT", "http://localhost:4318/v1/traces")
+    TRACING_SERVICE_NAME: str = os.getenv("TRACING_SERVICE_NAME", "law-mate-agent")
+
     # OAuth Scopes
     GMAIL_SCOPES = [
         'https://www.googleapis.com/auth/gmail.send',
@@ -48,6 +98,26 @@ class Config:
     TOKEN_FILE = Path(__file__).parent.parent / "config" / "token.json"
     CREDENTIALS_FILE = Path(__file__).parent.parent / "config" / "credentials.json"
 
+    # 로컬 데이터 저장소
+    CONTRACT_INDEX_DB = Path(os.getenv(
+        "CONTRACT_INDEX_DB",
+        str(Path(__file__).parent.parent / "config" / "contract_index.db")
+    ))
+    TASK_QUEUE_DB = Path(os.getenv(
+        "TASK_QUEUE_DB",
+        str(Path(__file__).parent.parent / "config" / "task_queue.db")
+    ))
+    DRIVE_DOWNLOAD_CACHE_DIR = Path(os.getenv(
+        "DRIVE_DOWNLOAD_CACHE_DIR",
+        str(Path(__file__).parent.parent / "config" / "download_cache")
+    ))
+    DRIVE_DOWNLOAD_CACHE_MAX_BYTES: int = int(os.getenv("DRIVE_DOWNLOAD_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+    # drive_download/download_contract의 destination_path가 가리킬 수 있는 디렉토리 (밖으로 나가는 경로는 거부)
+    DRIVE_DOWNLOAD_DIR = Path(os.getenv(
+        "DRIVE_DOWNLOAD_DIR",
+        str(Path(__file__).parent.parent / "config" / "downloads")
+    ))
+
     @classmethod
     def validate(cls) -> bool:
         """설정 유효성 검사"""
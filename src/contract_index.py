@@ -0,0 +1,330 @@
+"""
+계약서 메타데이터 로컬 인덱스
+업로드된 계약서를 SQLite에 기록하고 당사자/날짜/이름으로 빠르게 검색
+"""
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterable
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contracts (
+    file_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    folder_id TEXT,
+    folder_name TEXT,
+    contract_date TEXT,
+    md5_checksum TEXT,
+    mime_type TEXT,
+    size INTEGER,
+    web_view_link TEXT,
+    download_link TEXT,
+    created_time TEXT,
+    indexed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_contracts_date ON contracts (contract_date);
+CREATE INDEX IF NOT EXISTS idx_contracts_name ON contracts (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_contracts_folder ON contracts (folder_id);
+
+CREATE TABLE IF NOT EXISTS parties (
+    party_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    normalized TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS contract_parties (
+    file_id TEXT NOT NULL REFERENCES contracts (file_id) ON DELETE CASCADE,
+    party_id INTEGER NOT NULL REFERENCES parties (party_id),
+    PRIMARY KEY (file_id, party_id)
+);
+CREATE INDEX IF NOT EXISTS idx_contract_parties_party ON contract_parties (party_id);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# 접두사 검색 상한값 (유니코드 최대 문자)
+_PREFIX_UPPER = "\U0010ffff"
+
+
+def normalize_party(name: str) -> str:
+    """당사자 이름 정규화 (공백 정리 + 대소문자 무시)"""
+    return " ".join(name.split()).casefold()
+
+
+def join_parties(parties: Iterable[str]) -> str:
+    """당사자 리스트를 Drive 속성에 저장할 JSON 배열 문자열로 변환 (이름 안의 콤마 보존)"""
+    return json.dumps(list(parties), ensure_ascii=False, separators=(",", ":"))
+
+
+def split_parties(parties: Any) -> List[str]:
+    """리스트, JSON 배열 문자열(join_parties) 또는 콤마로 연결된 예전 문자열을 당사자 리스트로 변환"""
+    if not parties:
+        return []
+    if isinstance(parties, str):
+        try:
+            decoded = json.loads(parties) if parties.lstrip().startswith("[") else None
+        except ValueError:
+            decoded = None
+        parties = decoded if isinstance(decoded, list) else parties.split(",")
+    return [party.strip() for party in parties if isinstance(party, str) and party.strip()]
+
+
+class ContractIndex:
+    """업로드된 계약서 메타데이터 인덱스"""
+
+    def __init__(self, db_path: Path):
+        """
+        인덱스 초기화
+
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 커넥션 반환 (asyncio.to_thread 워커마다 하나씩)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path))
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    conn.executescript(_SCHEMA)
+                    self._schema_ready = True
+        return conn
+
+    def record_upload(
+        self,
+        upload_result: Dict[str, Any],
+        folder_name: Optional[str] = None,
+        contract_metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        업로드 결과를 인덱스에 기록
+
+        Args:
+            upload_result: DriveService.upload_file 결과
+            folder_name: 저장된 폴더 이름
+            contract_metadata: 계약서 메타데이터 (contract_date, parties)
+        """
+        metadata = contract_metadata or {}
+        self.upsert(
+            file_id=upload_result["file_id"],
+            name=upload_result.get("file_name") or "",
+            folder_id=upload_result.get("folder_id"),
+            folder_name=folder_name,
+            contract_date=metadata.get("contract_date"),
+            parties=split_parties(metadata.get("parties")),
+            md5_checksum=upload_result.get("md5_checksum"),
+            mime_type=upload_result.get("mime_type"),
+            size=upload_result.get("size"),
+            web_view_link=upload_result.get("web_view_link"),
+            download_link=upload_result.get("download_link"),
+            created_time=upload_result.get("created_time"),
+        )
+
+    def upsert(
+        self,
+        file_id: str,
+        name: str,
+        folder_id: Optional[str] = None,
+        folder_name: Optional[str] = None,
+        contract_date: Optional[str] = None,
+        parties: Optional[Iterable[str]] = None,
+        md5_checksum: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        size: Optional[Any] = None,
+        web_view_link: Optional[str] = None,
+        download_link: Optional[str] = None,
+        created_time: Optional[str] = None
+    ) -> None:
+        """계약서 한 건을 추가하거나 갱신 (당사자 목록은 교체)"""
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO contracts (
+                    file_id, name, folder_id, folder_name, contract_date, md5_checksum,
+                    mime_type, size, web_view_link, download_link, created_time, indexed_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (file_id) DO UPDATE SET
+                    name = excluded.name,
+                    folder_id = COALESCE(excluded.folder_id, contracts.folder_id),
+                    folder_name = CASE
+                        WHEN excluded.folder_id IS NOT NULL AND excluded.folder_id IS NOT contracts.folder_id
+                        THEN excluded.folder_name
+                        ELSE COALESCE(excluded.folder_name, contracts.folder_name)
+                    END,
+                    contract_date = excluded.contract_date,
+                    md5_checksum = COALESCE(excluded.md5_checksum, contracts.md5_checksum),
+                    mime_type = COALESCE(excluded.mime_type, contracts.mime_type),
+                    size = COALESCE(excluded.size, contracts.size),
+                    web_view_link = COALESCE(excluded.web_view_link, contracts.web_view_link),
+                    download_link = COALESCE(excluded.download_link, contracts.download_link),
+                    created_time = COALESCE(excluded.created_time, contracts.created_time),
+                    indexed_at = excluded.indexed_at
+                """,
+                (
+                    file_id, name, folder_id, folder_name, contract_date, md5_checksum,
+                    mime_type, int(size) if size is not None else None,
+                    web_view_link, download_link, created_time,
+                    datetime.now(timezone.utc).isoformat(),
+                )
+            )
+
+            conn.execute("DELETE FROM contract_parties WHERE file_id = ?", (file_id,))
+            for party in parties or []:
+                normalized = normalize_party(party)
+                conn.execute(
+                    "INSERT INTO parties (name, normalized) VALUES (?, ?) "
+                    "ON CONFLICT (normalized) DO NOTHING",
+                    (party, normalized)
+                )
+                conn.execute(
+                    "INSERT OR IGNORE INTO contract_parties (file_id, party_id) "
+                    "SELECT ?, party_id FROM parties WHERE normalized = ?",
+                    (file_id, normalized)
+                )
+
+    def remove(self, file_id: str) -> None:
+        """계약서를 인덱스에서 제거"""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM contracts WHERE file_id = ?", (file_id,))
+
+    def contains(self, file_id: str) -> bool:
+        """인덱스에 기록된 계약서인지 확인"""
+        row = self._connect().execute(
+            "SELECT 1 FROM contracts WHERE file_id = ?", (file_id,)
+        ).fetchone()
+        return row is not None
+
+    def get_state(self, key: str) -> Optional[str]:
+        """동기화 상태 값 조회 (예: 변경 피드 커서)"""
+        row = self._connect().execute(
+            "SELECT value FROM sync_state WHERE key = ?", (key,)
+        ).fetchone()
+        return row["value"] if row else None
+
+    def set_state(self, key: str, value: str) -> None:
+        """동기화 상태 값 저장"""
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT INTO sync_state (key, value) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (key, value)
+            )
+
+    def search(
+        self,
+        party: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        name: Optional[str] = None,
+        folder_name: Optional[str] = None,
+        limit: int = 50
+    ) -> Dict[str, Any]:
+        """
+        계약서 검색
+
+        Args:
+            party: 당사자 이름 (정규화 후 접두사 일치)
+            date_from: 계약 날짜 하한 (YYYY-MM-DD, 포함)
+            date_to: 계약 날짜 상한 (YYYY-MM-DD, 포함)
+            name: 계약서 이름 부분 일치
+            folder_name: 폴더 이름
+            limit: 최대 결과 수
+
+        Returns:
+            검색 결과
+        """
+        clauses = []
+        params: List[Any] = []
+
+        if party:
+            normalized = normalize_party(party)
+            clauses.append(
+                "c.file_id IN (SELECT cp.file_id FROM contract_parties cp "
+                "JOIN parties p ON p.party_id = cp.party_id "
+                "WHERE p.normalized >= ? AND p.normalized < ?)"
+            )
+            params.extend([normalized, normalized + _PREFIX_UPPER])
+        if date_from:
+            clauses.append("c.contract_date >= ?")
+            params.append(date_from)
+        if date_to:
+            clauses.append("c.contract_date <= ?")
+            params.append(date_to)
+        if name:
+            clauses.append("c.name LIKE ? ESCAPE '\\'")
+            escaped = name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params.append(f"%{escaped}%")
+        if folder_name:
+            clauses.append("c.folder_name = ?")
+            params.append(folder_name)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        conn = self._connect()
+        rows = conn.execute(
+            f"SELECT c.* FROM contracts c {where} "
+            "ORDER BY c.contract_date DESC, c.name LIMIT ?",
+            (*params, limit)
+        ).fetchall()
+
+        parties_by_file = self._parties_for([row["file_id"] for row in rows])
+        contracts = [
+            {
+                "file_id": row["file_id"],
+                "name": row["name"],
+                "folder_id": row["folder_id"],
+                "folder_name": row["folder_name"],
+                "contract_date": row["contract_date"],
+                "parties": parties_by_file.get(row["file_id"], []),
+                "md5_checksum": row["md5_checksum"],
+                "mime_type": row["mime_type"],
+                "size": row["size"],
+                "web_view_link": row["web_view_link"],
+                "download_link": row["download_link"],
+                "created_time": row["created_time"],
+            }
+            for row in rows
+        ]
+
+        return {
+            "success": True,
+            "count": len(contracts),
+            "contracts": contracts
+        }
+
+    def _parties_for(self, file_ids: List[str]) -> Dict[str, List[str]]:
+        """파일 ID별 당사자 이름 목록"""
+        if not file_ids:
+            return {}
+        placeholders = ",".join("?" * len(file_ids))
+        rows = self._connect().execute(
+            "SELECT cp.file_id, p.name FROM contract_parties cp "
+            "JOIN parties p ON p.party_id = cp.party_id "
+            f"WHERE cp.file_id IN ({placeholders}) ORDER BY p.name",
+            file_ids
+        ).fetchall()
+
+        result: Dict[str, List[str]] = {}
+        for row in rows:
+            result.setdefault(row["file_id"], []).append(row["name"])
+        return result
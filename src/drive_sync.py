@@ -0,0 +1,136 @@
+"""
+Drive 변경 피드 증분 동기화
+changes.list 커서를 저장해 두고 주기적으로 폴더/계약서 캐시에 변경분만 반영
+"""
+import asyncio
+import logging
+from typing import Optional, Dict, Any
+
+from src.contract_index import ContractIndex, split_parties
+
+
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+
+# sync_state 테이블에 저장하는 커서 키
+CURSOR_KEY = "drive_changes_page_token"
+
+# stdio MCP 모드에서는 stdout이 JSON-RPC 채널이므로 logging(기본 stderr)으로 남긴다
+logger = logging.getLogger(__name__)
+
+
+class DriveChangeSync:
+    """Drive 변경 피드 동기화기"""
+
+    def __init__(self, drive_service, contract_index: ContractIndex):
+        """
+        동기화기 초기화
+
+        Args:
+            drive_service: DriveService 객체
+            contract_index: 커서와 계약서 메타데이터를 저장하는 ContractIndex
+        """
+        self.drive_service = drive_service
+        self.contract_index = contract_index
+
+    def sync_once(self) -> Dict[str, Any]:
+        """
+        저장된 커서부터 변경 피드를 끝까지 읽어 캐시에 반영
+
+        처음 실행 시에는 현재 시점의 시작 커서만 저장한다.
+        페이지마다 커서를 저장하므로 중간에 종료되어도 다음 실행에서 이어서 처리한다.
+
+        Returns:
+            동기화 결과 (적용한 변경 수)
+        """
+        page_token = self.contract_index.get_state(CURSOR_KEY)
+
+        if page_token is None:
+            start = self.drive_service.get_start_page_token()
+            if not start['success']:
+                return start
+            self.contract_index.set_state(CURSOR_KEY, start['start_page_token'])
+            return {"success": True, "applied": 0, "initialized": True}
+
+        applied = 0
+        while True:
+            page = self.drive_service.list_changes(page_token)
+            if not page['success']:
+                return {**page, "applied": applied}
+
+            for change in page['changes']:
+                self._apply_change(change)
+                applied += 1
+
+            page_token = page['next_page_token'] or page['new_start_page_token']
+            self.contract_index.set_state(CURSOR_KEY, page_token)
+
+            if not page['next_page_token']:
+                break
+
+        return {"success": True, "applied": applied}
+
+    def _apply_change(self, change: Dict[str, Any]):
+        """변경 한 건을 폴더 캐시와 계약서 인덱스에 반영 (파일 변경이 아니면 건너뛴다)"""
+        file_id = change.get('fileId')
+        if change.get('changeType', 'file') != 'file' or not file_id:
+            # 공유 드라이브 자체의 변경(changeType == 'drive')에는 fileId가 없다
+            return
+        file = change.get('file') or {}
+
+        # 공유 설정 변경도 파일 변경으로 들어오므로 권한 캐시는 항상 비운다
+        self.drive_service.invalidate_permissions(file_id)
+
+        if change.get('removed') or file.get('trashed'):
+            self.drive_service.invalidate_folder(file_id)
+            self.contract_index.remove(file_id)
+            return
+
+        if file.get('mimeType') == FOLDER_MIME_TYPE:
+            # 이름이 바뀌었을 수 있으므로 캐시에서 빼고 다음 조회 때 다시 찾는다
+            self.drive_service.invalidate_folder(file_id)
+            return
+
+        properties = file.get('properties') or {}
+        is_contract = 'contract_date' in properties or 'parties' in properties
+        if not is_contract and not self.contract_index.contains(file_id):
+            return
+
+        parents = file.get('parents') or []
+        folder_id: Optional[str] = parents[0] if parents else None
+
+        self.contract_index.upsert(
+            file_id=file_id,
+            name=file.get('name') or "",
+            folder_id=folder_id,
+            folder_name=self.drive_service.cached_folder_name(folder_id) if folder_id else None,
+            contract_date=properties.get('contract_date'),
+            parties=split_parties(properties.get('parties')),
+            md5_checksum=file.get('md5Checksum'),
+            mime_type=file.get('mimeType'),
+            size=file.get('size'),
+            web_view_link=file.get('webViewLink'),
+            download_link=file.get('webContentLink'),
+            created_time=file.get('createdTime'),
+        )
+
+    async def run(self, interval_seconds: float, stop_event: Optional[asyncio.Event] = None):
+        """
+        주기적으로 sync_once 실행 (백그라운드 태스크용)
+
+        Args:
+            interval_seconds: 동기화 주기 (초)
+            stop_event: 설정되면 루프 종료
+        """
+        stop_event = stop_event or asyncio.Event()
+        while not stop_event.is_set():
+            try:
+                result = await asyncio.to_thread(self.sync_once)
+                if not result['success']:
+                    logger.warning("Drive sync failed: %s", result.get('error'))
+            except Exception as exc:
+                logger.warning("Drive sync error: %s", exc)
+
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=interval_seconds)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,111 @@
+"""
+디스크 LRU 캐시
+다운로드한 파일을 크기 제한 내에서 로컬 디스크에 보관
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, BinaryIO, Iterator
+
+
+class DiskLRUCache:
+    """최근 사용 순서로 제거되는 디스크 캐시
+
+    사용 시각은 파일 mtime으로 기록하므로 재시작 후에도 LRU 순서가 유지된다.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        """
+        캐시 초기화
+
+        Args:
+            directory: 캐시 디렉토리
+            max_bytes: 캐시 전체 최대 크기 (바이트)
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _path_for(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.directory / digest
+
+    def get(self, key: str) -> Optional[Path]:
+        """
+        캐시된 파일 경로 조회 (조회 시 최근 사용으로 갱신)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시 파일 경로 (없으면 None)
+        """
+        path = self._path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def copy_to(self, key: str, sink: BinaryIO, chunk_size: int = 1024 * 1024) -> bool:
+        """캐시된 내용을 sink로 복사 (없으면 False)"""
+        path = self.get(key)
+        if path is None:
+            return False
+        try:
+            with open(path, 'rb') as cached:
+                shutil.copyfileobj(cached, sink, chunk_size)
+        except FileNotFoundError:
+            # 조회 직후 다른 스레드가 제거한 경우
+            return False
+        return True
+
+    @contextmanager
+    def writer(self, key: str) -> Iterator[BinaryIO]:
+        """
+        캐시 항목 쓰기 컨텍스트
+
+        블록이 정상 종료되면 원자적으로 캐시에 반영하고, 예외가 나면 버린다.
+
+        Args:
+            key: 캐시 키
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp_")
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                yield temp_file
+            os.replace(temp_path, self._path_for(key))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._evict()
+
+    def _evict(self):
+        """최대 크기를 넘으면 오래 사용하지 않은 항목부터 제거"""
+        with self._lock:
+            entries = []
+            total = 0
+            for entry in os.scandir(self.directory):
+                if entry.name.startswith(".tmp_") or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            for _, size, path in sorted(entries):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                if total <= self.max_bytes:
+                    break
@@ -0,0 +1,84 @@
+"""
+일괄 작업 실행 도구
+항목별 API 호출을 스레드 풀에서 동시에 실행하고 요청 순서대로 결과를 모은다
+(서비스 객체는 ThreadLocalHttp를 쓰므로 여러 스레드에서 공유해도 안전)
+"""
+import contextvars
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+# 항목별 호출 기본 동시 실행 수 (사용자별 API 속도 제한을 넘지 않는 수준)
+DEFAULT_MAX_WORKERS = 8
+
+# 모든 일괄 작업이 함께 쓰는 스레드 풀 크기 (호출마다 동시 실행 수는 max_workers로 따로 제한)
+SHARED_POOL_WORKERS = 32
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _shared_executor() -> ThreadPoolExecutor:
+    """일괄 작업용 공유 스레드 풀 반환 (처음 쓸 때 생성)
+
+    스레드를 호출마다 새로 만들지 않아야 ThreadLocalHttp의 스레드별 연결(TLS 세션)이 재사용된다.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=SHARED_POOL_WORKERS, thread_name_prefix="bulk")
+    return _executor
+
+
+def run_bulk(
+    func: Callable[[Any], Dict[str, Any]],
+    items: Sequence[Any],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    progress_callback: Optional[Callable[[int, int], None]] = None
+) -> List[Dict[str, Any]]:
+    """
+    항목마다 func를 동시에 실행
+
+    한 항목에서 예외가 나도 나머지는 계속 실행하고, 해당 항목만 실패 결과로 남긴다.
+
+    Args:
+        func: 항목 하나를 처리하고 결과 dict를 반환하는 함수
+        items: 처리할 항목 리스트
+        max_workers: 이 호출의 최대 동시 실행 수 (공유 풀 크기를 넘지 않음)
+        progress_callback: 항목이 끝날 때마다 (완료 수, 전체 수)로 호출
+
+    Returns:
+        요청 순서대로 정렬된 결과 리스트
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    if not items:
+        return []
+
+    executor = _shared_executor()
+    limit = max(1, max_workers)
+    running: Dict[Future, int] = {}
+    next_index = 0
+    done = 0
+
+    while done < len(items):
+        # 공유 풀을 쓰므로 이 호출의 항목은 limit개까지만 동시에 넣어 둔다
+        while next_index < len(items) and len(running) < limit:
+            # 호출자의 contextvars(추적 span 등)를 항목마다 복사해 워커 스레드에서 이어 쓴다
+            future = executor.submit(contextvars.copy_context().run, func, items[next_index])
+            running[future] = next_index
+            next_index += 1
+
+        finished, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in finished:
+            index = running.pop(future)
+            try:
+                results[index] = future.result()
+            except Exception as exc:
+                results[index] = {"success": False, "error": str(exc)}
+            done += 1
+            if progress_callback is not None:
+                progress_callback(done, len(items))
+
+    return results
@@ -0,0 +1,204 @@
+"""
+Google Calendar 로컬 미러
+syncToken 증분 동기화로 캘린더별 일정을 메모리에 유지하고 조회를 로컬에서 처리
+"""
+import bisect
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List
+from zoneinfo import ZoneInfo
+
+from src.google_services.scheduling import require_aware
+
+
+def event_bound(value: Dict[str, Any], tz: Optional[ZoneInfo] = None) -> datetime:
+    """
+    일정 start/end 값을 타임존 있는 datetime으로 변환
+
+    Args:
+        value: 일정 start/end 필드
+        tz: 종일 일정(date)을 해석할 캘린더 타임존 (없으면 UTC)
+
+    Returns:
+        종일 일정은 캘린더 타임존 기준 자정
+    """
+    if 'dateTime' in value:
+        parsed = datetime.fromisoformat(value['dateTime'].replace('Z', '+00:00'))
+    else:
+        parsed = datetime.fromisoformat(value['date'])
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=tz or timezone.utc)
+    return parsed
+
+
+class _CalendarState:
+    """캘린더 하나의 미러 상태"""
+
+    def __init__(self):
+        self.events: Dict[str, Dict[str, Any]] = {}
+        self.sync_token: Optional[str] = None
+        self.synced_at: float = 0.0
+        # 캘린더 타임존 (동기화 응답의 timeZone, 종일 일정 경계 계산에 사용)
+        self.timezone: Optional[ZoneInfo] = None
+        # 시작 시각 기준 정렬 인덱스 (변경 시 다시 만든다)
+        self.sorted_starts: List[datetime] = []
+        self.sorted_events: List[Dict[str, Any]] = []
+        self.max_duration = timedelta(0)
+        self.dirty = True
+
+    def apply(self, changes: List[Dict[str, Any]]):
+        for change in changes:
+            if change['cancelled']:
+                self.events.pop(change['id'], None)
+            else:
+                event = dict(change)
+                event.pop('cancelled')
+                self.events[event['id']] = event
+        if changes:
+            self.dirty = True
+
+    def rebuild(self):
+        if not self.dirty:
+            return
+        entries = []
+        max_duration = timedelta(0)
+        for event in self.events.values():
+            start = event_bound(event['start'], self.timezone)
+            end = event_bound(event['end'], self.timezone)
+            max_duration = max(max_duration, end - start)
+            entries.append((start, end, event))
+        entries.sort(key=lambda entry: (entry[0], entry[2]['id']))
+
+        self.sorted_starts = [entry[0] for entry in entries]
+        self.sorted_events = [(entry[1], entry[2]) for entry in entries]
+        self.max_duration = max_duration
+        self.dirty = False
+
+
+class CalendarMirror:
+    """캘린더 일정 로컬 미러"""
+
+    def __init__(self, calendar_service, max_staleness_seconds: float = 60.0):
+        """
+        미러 초기화
+
+        Args:
+            calendar_service: CalendarService 객체
+            max_staleness_seconds: 이 시간이 지나면 조회 전에 증분 동기화
+        """
+        self.calendar_service = calendar_service
+        self.max_staleness_seconds = max_staleness_seconds
+        self._states: Dict[str, _CalendarState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, calendar_id: str) -> _CalendarState:
+        state = self._states.get(calendar_id)
+        if state is None:
+            state = self._states.setdefault(calendar_id, _CalendarState())
+        return state
+
+    def refresh(self, calendar_id: str = 'primary') -> Dict[str, Any]:
+        """
+        증분 동기화 (토큰이 없거나 만료되었으면 전체 동기화)
+
+        Args:
+            calendar_id: 캘린더 ID
+
+        Returns:
+            동기화 결과 (반영한 변경 수)
+        """
+        with self._lock:
+            state = self._state(calendar_id)
+            result = self.calendar_service.sync_events(calendar_id, state.sync_token)
+
+            if not result['success'] and result.get('full_resync_required'):
+                state.sync_token = None
+                result = self.calendar_service.sync_events(calendar_id, None)
+
+            if not result['success']:
+                return result
+
+            if result['full_sync']:
+                state.events.clear()
+                state.dirty = True
+            state.apply(result['events'])
+            if result.get('timezone'):
+                calendar_tz = ZoneInfo(result['timezone'])
+                if calendar_tz != state.timezone:
+                    state.timezone = calendar_tz
+                    state.dirty = True
+            state.sync_token = result['next_sync_token']
+            state.synced_at = time.monotonic()
+
+            return {
+                "success": True,
+                "calendar_id": calendar_id,
+                "full_sync": result['full_sync'],
+                "applied": len(result['events'])
+            }
+
+    def mark_stale(self, calendar_id: str = 'primary'):
+        """다음 조회 때 동기화하도록 표시 (쓰기 작업 후 호출)"""
+        state = self._states.get(calendar_id)
+        if state is not None:
+            state.synced_at = 0.0
+
+    def query(
+        self,
+        calendar_id: str = 'primary',
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        max_results: Optional[int] = None,
+        max_staleness_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        미러에서 일정 조회 (events.list의 timeMin/timeMax 의미와 동일)
+
+        Args:
+            calendar_id: 캘린더 ID
+            time_min: 이 시각 이후에 끝나는 일정 (타임존 필수, 기본: 현재)
+            time_max: 이 시각 이전에 시작하는 일정 (타임존 필수)
+            max_results: 최대 결과 수
+            max_staleness_seconds: 허용 지연 (없으면 미러 기본값)
+
+        Returns:
+            get_upcoming_events와 같은 형식의 일정 리스트
+        """
+        staleness = self.max_staleness_seconds if max_staleness_seconds is None else max_staleness_seconds
+        state = self._state(calendar_id)
+        if state.sync_token is None or time.monotonic() - state.synced_at > staleness:
+            result = self.refresh(calendar_id)
+            if not result['success']:
+                return result
+
+        time_min = require_aware(time_min, 'time_min') if time_min else datetime.now(timezone.utc)
+        time_max = require_aware(time_max, 'time_max') if time_max else None
+
+        with self._lock:
+            state.rebuild()
+            # 진행 중인 일정도 포함하도록 가장 긴 일정 길이만큼 앞에서부터 본다
+            lo = bisect.bisect_left(state.sorted_starts, time_min - state.max_duration)
+            hi = (
+                bisect.bisect_left(state.sorted_starts, time_max)
+                if time_max else len(state.sorted_starts)
+            )
+
+            events = []
+            for end, event in state.sorted_events[lo:hi]:
+                if end <= time_min:
+                    continue
+                events.append(event)
+                if max_results is not None and len(events) >= max_results:
+                    break
+
+        return {
+            "success": True,
+            "count": len(events),
+            "events": events
+        }
+
+    def upcoming(self, max_results: int = 10, calendar_id: str = 'primary') -> Dict[str, Any]:
+        """미러 기반 get_upcoming_events"""
+        return self.query(calendar_id=calendar_id, max_results=max_results)
+
@@ -2,11 +2,121 @@
 Google Calendar 서비스 도메인
 일정 생성 및 관리 기능 제공
 """
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
+import base64
+import hashlib
+import time
+from uuid import uuid4
+from typing import Optional, Dict, Any, List, Iterator, Callable
+from datetime import datetime, timedelta, timezone as dt_timezone
+import httplib2
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from src.google_services.scheduling import BusySchedule, require_aware
+from src.google_services.transport import ThreadLocalHttp, execute_conditional
+
+
+# 일정 조회 시 요청할 필드 (응답에 담는 속성만)
+EVENT_LIST_FIELDS = 'nextPageToken, items(id, summary, start, end, htmlLink)'
+
+# 증분 동기화 시 요청할 필드 (삭제 여부 확인용 status, 종일 일정 해석용 캘린더 timeZone 포함)
+EVENT_SYNC_FIELDS = 'nextPageToken, nextSyncToken, timeZone, items(id, status, summary, start, end, htmlLink)'
+
+# events.list 페이지 최대 크기
+MAX_PAGE_SIZE = 2500
+
+# Calendar 배치 요청 한 번에 담을 호출 수 (Google 권장 최대 50)
+BATCH_LIMIT = 50
+
+# 일괄 작업 진행률 콜백 (완료 항목 수, 전체 항목 수)
+ProgressCallback = Callable[[int, int], None]
+
+# 재시도할 HTTP 상태 코드와 403 사유
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+RETRYABLE_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+
+
+def event_id_for(key: str) -> str:
+    """
+    콘텐츠 키로부터 고정 일정 ID 생성
+
+    Calendar 일정 ID는 base32hex 소문자(a-v, 0-9) 5~1024자여야 한다.
+    같은 키로 재시도하면 같은 ID가 되어 중복 생성 대신 409가 발생한다.
+    """
+    digest = hashlib.sha256(key.encode('utf-8')).digest()
+    return base64.b32hexencode(digest).decode('ascii').rstrip('=').lower()
+
+
+def is_retryable(error: Exception) -> bool:
+    """일시적 오류(속도 제한, 서버 오류)인지 확인"""
+    if not isinstance(error, HttpError):
+        return False
+    if error.resp.status in RETRYABLE_STATUSES:
+        return True
+    if error.resp.status == 403:
+        reasons = {detail.get('reason') for detail in (error.error_details or []) if isinstance(detail, dict)}
+        return bool(reasons & RETRYABLE_REASONS)
+    return False
+
+
+def to_rfc3339(value: datetime) -> str:
+    """datetime을 RFC 3339 문자열로 변환 (타임존이 없으면 어느 시각인지 알 수 없으므로 ValueError)"""
+    return require_aware(value, 'time').isoformat()
+
+
+def _time_field(value: datetime, timezone: str, all_day: bool) -> Dict[str, Any]:
+    """일정 start/end 필드 생성"""
+    if all_day:
+        return {'date': value.strftime('%Y-%m-%d'), 'timeZone': timezone}
+    return {'dateTime': value.isoformat(), 'timeZone': timezone}
+
+
+def _reminders_field(reminders: List[int]) -> Dict[str, Any]:
+    """일정 reminders 필드 생성 (분 단위 팝업 알림)"""
+    return {
+        'useDefault': False,
+        'overrides': [
+            {'method': 'popup', 'minutes': minutes}
+            for minutes in reminders
+        ]
+    }
+
+
+def build_event_patch(
+    changes: Dict[str, Any],
+    timezone: str = 'Asia/Seoul'
+) -> Dict[str, Any]:
+    """
+    변경된 필드만 담은 events.patch 본문 생성
+
+    Args:
+        changes: 바꿀 CalendarEvent 속성 (summary, description, location, start_time,
+            end_time, all_day, attendees, reminders). start_time/end_time을 바꿀 때는
+            all_day(True면 date, False면 dateTime)가 있어야 한다 (patch_events는 기존 일정에서 채움)
+        timezone: start_time/end_time에 적용할 타임존
+
+    Returns:
+        Google Calendar API 형식의 부분 일정
+    """
+    patch: Dict[str, Any] = {}
+    for field in ('summary', 'description', 'location'):
+        if field in changes:
+            patch[field] = changes[field]
+
+    all_day = changes.get('all_day')
+    if all_day is None and ('start_time' in changes or 'end_time' in changes):
+        raise ValueError("all_day is required when start_time or end_time is changed")
+    if 'start_time' in changes:
+        patch['start'] = _time_field(changes['start_time'], timezone, all_day)
+    if 'end_time' in changes:
+        patch['end'] = _time_field(changes['end_time'], timezone, all_day)
+    if 'attendees' in changes:
+        patch['attendees'] = [{'email': email} for email in changes['attendees']]
+    if 'reminders' in changes:
+        patch['reminders'] = _reminders_field(changes['reminders'])
+
+    return patch
+
 
 class CalendarEvent:
     """캘린더 이벤트 도메인 모델"""
@@ -21,7 +131,8 @@ class CalendarEvent:
         attendees: Optional[List[str]] = None,
         reminders: Optional[List[int]] = None,
         timezone: str = 'Asia/Seoul',
-        all_day: bool = False
+        all_day: bool = False,
+        event_id: Optional[str] = None
     ):
         self.summary = summary
         self.start_time = start_time
@@ -32,6 +143,7 @@ class CalendarEvent:
         self.reminders = reminders or [30]  # 기본 30분 전 알림
         self.timezone = timezone
         self.all_day = all_day
+        self.event_id = event_id  # 지정하면 멱등 생성 (event_id_for 참고)
 
     def to_google_event(self) -> Dict[str, Any]:
         """Google Calendar API 형식으로 변환"""
@@ -41,25 +153,12 @@ class CalendarEvent:
             'location': self.location,
         }
 
+        if self.event_id:
+            event['id'] = self.event_id
+
         # 시작/종료 시간 설정
-        if self.all_day:
-            event['start'] = {
-                'date': self.start_time.strftime('%Y-%m-%d'),
-                'timeZone': self.timezone,
-            }
-            event['end'] = {
-                'date': self.end_time.strftime('%Y-%m-%d'),
-                'timeZone': self.timezone,
-            }
-        else:
-            event['start'] = {
-                'dateTime': self.start_time.isoformat(),
-                'timeZone': self.timezone,
-            }
-            event['end'] = {
-                'dateTime': self.end_time.isoformat(),
-                'timeZone': self.timezone,
-            }
+        event['start'] = _time_field(self.start_time, self.timezone, self.all_day)
+        event['end'] = _time_field(self.end_time, self.timezone, self.all_day)
 
         # 참석자 추가
         if self.attendees:
@@ -67,13 +166,7 @@ class CalendarEvent:
 
         # 알림 설정
         if self.reminders:
-            event['reminders'] = {
-                'useDefault': False,
-                'overrides': [
-                    {'method': 'popup', 'minutes': minutes}
-                    for minutes in self.reminders
-                ]
-            }
+            event['reminders'] = _reminders_field(self.reminders)
 
         return event
 
@@ -88,7 +181,8 @@ class CalendarEvent:
             "attendees": self.attendees,
             "reminders": self.reminders,
             "timezone": self.timezone,
-            "all_day": self.all_day
+            "all_day": self.all_day,
+            "event_id": self.event_id
         }
 
 
@@ -103,13 +197,14 @@ class CalendarService:
             credentials: Google OAuth 인증 정보
         """
         self.credentials = credentials
-        self.service = build('calendar', 'v3', credentials=credentials)
+        self.service = build('calendar', 'v3', http=ThreadLocalHttp(credentials))
 
     def create_event(
         self,
         event: CalendarEvent,
         calendar_id: str = 'primary',
-        send_notifications: bool = True
+        send_notifications: bool = True,
+        revive_cancelled: bool = False
     ) -> Dict[str, Any]:
         """
         일정 생성
@@ -118,6 +213,8 @@ class CalendarService:
             event: CalendarEvent 객체
             calendar_id: 캘린더 ID (기본: primary)
             send_notifications: 참석자에게 알림 전송 여부
+            revive_cancelled: 같은 고정 ID의 일정이 삭제된 상태면 되살릴지 여부
+                (False면 status "cancelled"인 실패 결과 반환)
 
         Returns:
             생성된 일정 정보
@@ -131,17 +228,11 @@ class CalendarService:
                 sendNotifications=send_notifications
             ).execute()
 
-            return {
-                "success": True,
-                "event_id": created_event['id'],
-                "summary": created_event['summary'],
-                "start": created_event['start'],
-                "end": created_event['end'],
-                "html_link": created_event.get('htmlLink'),
-                "hangout_link": created_event.get('hangoutLink')
-            }
+            return self._created_result(created_event)
 
         except HttpError as error:
+            if error.resp.status == 409 and event.event_id:
+                return self._existing_event_result(calendar_id, google_event, revive_cancelled)
             return {
                 "success": False,
                 "error": str(error),
@@ -185,12 +276,165 @@ class CalendarService:
 
         return self.create_event(event)
 
+    def query_free_busy(
+        self,
+        attendees: List[str],
+        time_min: datetime,
+        time_max: datetime,
+        include_self: bool = True
+    ) -> Dict[str, Any]:
+        """
+        참석자 전원의 바쁜 시간 조회 (freebusy 한 번 호출)
+
+        Args:
+            attendees: 참석자 이메일 리스트
+            time_min: 조회 시작
+            time_max: 조회 종료
+            include_self: 내 캘린더(primary)도 포함할지 여부
+
+        Returns:
+            BusySchedule과 조회할 수 없었던 캘린더 목록
+        """
+        calendar_ids = list(dict.fromkeys((['primary'] if include_self else []) + list(attendees)))
+
+        try:
+            response = self.service.freebusy().query(body={
+                'timeMin': to_rfc3339(time_min),
+                'timeMax': to_rfc3339(time_max),
+                'items': [{'id': calendar_id} for calendar_id in calendar_ids]
+            }).execute()
+
+            intervals = []
+            unavailable = []
+            for calendar_id, calendar in response.get('calendars', {}).items():
+                if calendar.get('errors'):
+                    unavailable.append(calendar_id)
+                for busy in calendar.get('busy', []):
+                    intervals.append((
+                        datetime.fromisoformat(busy['start'].replace('Z', '+00:00')),
+                        datetime.fromisoformat(busy['end'].replace('Z', '+00:00'))
+                    ))
+
+            return {
+                "success": True,
+                "schedule": BusySchedule(intervals),
+                "unavailable_calendars": unavailable
+            }
+
+        except HttpError as error:
+            return {
+                "success": False,
+                "error": str(error),
+                "error_code": error.resp.status
+            }
+
+    def schedule_meeting(
+        self,
+        title: str,
+        duration_minutes: int,
+        attendees: List[str],
+        window_start: datetime,
+        window_end: datetime,
+        preferred_start: Optional[datetime] = None,
+        on_conflict: str = 'earliest',
+        slot_step_minutes: int = 15,
+        description: Optional[str] = None,
+        location: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        참석자 가용 시간을 확인하고 회의 일정 생성
+
+        freebusy를 한 번만 조회한 뒤 충돌 검사와 빈 시간 탐색은 로컬에서 처리한다.
+
+        Args:
+            title: 회의 제목
+            duration_minutes: 회의 시간 (분)
+            attendees: 참석자 이메일 리스트
+            window_start: 탐색 창 시작 (타임존 필수)
+            window_end: 탐색 창 종료 (타임존 필수)
+            preferred_start: 희망 시작 시간 (타임존 필수, 창 안이어야 함, 없으면 창 시작)
+            on_conflict: 희망 시간이 겹칠 때 'reject'(생성 안 함) 또는 'earliest'(가장 이른 빈 시간)
+            slot_step_minutes: 빈 시간 탐색 시 시작 시각 단위 (분)
+            description: 회의 설명
+            location: 회의 장소
+
+        Returns:
+            생성된 일정 정보 (충돌 시 conflicts 포함)
+
+        Raises:
+            ValueError: 타임존이 없는 시각, 잘못된 창 또는 창 밖의 희망 시간
+        """
+        if on_conflict not in ('reject', 'earliest'):
+            raise ValueError(f"Unsupported on_conflict: {on_conflict}")
+        if slot_step_minutes <= 0:
+            raise ValueError("slot_step_minutes must be positive")
+
+        window_start = require_aware(window_start, 'window_start')
+        window_end = require_aware(window_end, 'window_end')
+        if window_start >= window_end:
+            raise ValueError("window_start must be before window_end")
+
+        duration = timedelta(minutes=duration_minutes)
+        if preferred_start is not None:
+            preferred_start = require_aware(preferred_start, 'preferred_start')
+            # freebusy는 창 안만 조회하므로 창 밖의 희망 시간은 충돌 검사를 할 수 없다
+            if preferred_start < window_start or preferred_start + duration > window_end:
+                raise ValueError("preferred_start must fall within [window_start, window_end)")
+
+        busy = self.query_free_busy(attendees, window_start, window_end)
+        if not busy['success']:
+            return busy
+
+        schedule: BusySchedule = busy['schedule']
+        start = preferred_start or window_start
+
+        conflicts = schedule.conflicts(start, start + duration)
+        if conflicts:
+            if on_conflict == 'reject':
+                return {
+                    "success": False,
+                    "error": "Requested time conflicts with attendee availability",
+                    "conflicts": [
+                        {"start": busy_start.isoformat(), "end": busy_end.isoformat()}
+                        for busy_start, busy_end in conflicts
+                    ],
+                    "unavailable_calendars": busy['unavailable_calendars']
+                }
+
+            slot = schedule.earliest_free_slot(
+                duration,
+                window_start,
+                window_end,
+                step=timedelta(minutes=slot_step_minutes)
+            )
+            if slot is None:
+                return {
+                    "success": False,
+                    "error": "No common free slot in the requested window",
+                    "unavailable_calendars": busy['unavailable_calendars']
+                }
+            start = slot[0]
+
+        result = self.create_meeting_event(
+            title=title,
+            start_time=start,
+            duration_minutes=duration_minutes,
+            attendees=attendees,
+            description=description,
+            location=location
+        )
+        result['rescheduled'] = bool(conflicts)
+        result['unavailable_calendars'] = busy['unavailable_calendars']
+        return result
+
     def create_contract_deadline(
         self,
         contract_name: str,
         deadline_date: datetime,
         description: Optional[str] = None,
-        reminder_days: Optional[List[int]] = None
+        reminder_days: Optional[List[int]] = None,
+        idempotent: bool = False,
+        revive_cancelled: bool = False
     ) -> Dict[str, Any]:
         """
         계약 마감일 일정 생성
@@ -200,26 +444,270 @@ class CalendarService:
             deadline_date: 마감일
             description: 설명
             reminder_days: 알림 일수 (예: [1, 3, 7] = 1일전, 3일전, 7일전)
+            idempotent: 계약명 + 마감일로 고정 ID를 만들어 재시도 시 중복 생성 방지
+            revive_cancelled: 같은 마감일 일정이 삭제된 상태면 되살릴지 여부 (create_event 참고)
 
         Returns:
             생성된 일정 정보
         """
+        event = self.build_deadline_event(
+            contract_name=contract_name,
+            deadline_date=deadline_date,
+            description=description,
+            reminder_days=reminder_days,
+            idempotent=idempotent
+        )
+
+        return self.create_event(event, revive_cancelled=revive_cancelled)
+
+    @staticmethod
+    def build_deadline_event(
+        contract_name: str,
+        deadline_date: datetime,
+        description: Optional[str] = None,
+        reminder_days: Optional[List[int]] = None,
+        idempotent: bool = False
+    ) -> CalendarEvent:
+        """계약 마감일 CalendarEvent 생성"""
         if reminder_days is None:
             reminder_days = [1, 3, 7]  # 기본: 1, 3, 7일 전
 
         # 분 단위로 변환 (일 * 24시간 * 60분)
         reminders_in_minutes = [days * 24 * 60 for days in reminder_days]
 
-        event = CalendarEvent(
+        return CalendarEvent(
             summary=f"[계약 마감] {contract_name}",
             start_time=deadline_date,
             end_time=deadline_date + timedelta(hours=1),
             description=description or f"{contract_name} 계약 마감일",
             reminders=reminders_in_minutes,
-            all_day=True
+            all_day=True,
+            event_id=(
+                event_id_for(f"deadline:{contract_name}:{deadline_date.date().isoformat()}")
+                if idempotent else None
+            )
         )
 
-        return self.create_event(event)
+    def create_contract_deadlines(
+        self,
+        deadlines: List[Dict[str, Any]],
+        calendar_id: str = 'primary',
+        idempotent: bool = False,
+        revive_cancelled: bool = False,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        계약 마감일 일괄 생성
+
+        Args:
+            deadlines: create_contract_deadline 인자 dict 리스트
+                (contract_name, deadline_date, description, reminder_days)
+            calendar_id: 캘린더 ID
+            idempotent: 항목별 고정 ID 사용 여부 (create_contract_deadline 참고)
+            revive_cancelled: 삭제된 같은 마감일 일정을 되살릴지 여부 (create_event 참고)
+            progress_callback: 배치마다 (완료 수, 전체 수)로 호출
+
+        Returns:
+            요청 순서대로 정렬된 생성 결과 리스트
+        """
+        events = [
+            self.build_deadline_event(idempotent=idempotent, **deadline)
+            for deadline in deadlines
+        ]
+        return self.create_events(
+            events,
+            calendar_id=calendar_id,
+            revive_cancelled=revive_cancelled,
+            progress_callback=progress_callback
+        )
+
+    def create_events(
+        self,
+        events: List[CalendarEvent],
+        calendar_id: str = 'primary',
+        send_notifications: bool = True,
+        max_retries: int = 3,
+        revive_cancelled: bool = False,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        일정 일괄 생성 (배치 요청)
+
+        배치마다 최대 BATCH_LIMIT개의 insert를 묶어 보내고, 속도 제한이나 서버 오류로
+        실패한 항목만 지수 백오프 후 다시 묶어 재시도한다. ID가 없는 일정에는 새 ID를 붙여
+        보내므로, 이미 반영된 insert를 재시도해도 중복 생성 대신 409로 끝난다.
+
+        Args:
+            events: CalendarEvent 리스트
+            calendar_id: 캘린더 ID
+            send_notifications: 참석자에게 알림 전송 여부
+            max_retries: 항목별 최대 재시도 횟수
+            revive_cancelled: 삭제된 같은 ID의 일정을 되살릴지 여부 (create_event 참고)
+            progress_callback: 배치마다 (완료 수, 전체 수)로 호출
+
+        Returns:
+            요청 순서대로 정렬된 생성 결과 리스트 (create_event와 같은 형식)
+        """
+        bodies = [event.to_google_event() for event in events]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(bodies)
+
+        # 서버 오류 응답이 와도 insert는 이미 반영됐을 수 있으므로 재시도 전에 ID를 고정한다
+        generated = set()
+        for index, body in enumerate(bodies):
+            if not body.get('id'):
+                body['id'] = uuid4().hex
+                generated.add(index)
+
+        def make_request(index: int):
+            return self.service.events().insert(
+                calendarId=calendar_id,
+                body=bodies[index],
+                sendNotifications=send_notifications
+            )
+
+        def on_success(index: int, created: Dict[str, Any]):
+            results[index] = self._created_result(created)
+
+        self._execute_batched(
+            list(range(len(bodies))), make_request, on_success, results, max_retries, progress_callback
+        )
+
+        # 고정 ID 일정이 이미 있으면(409) 기존 일정을 결과로 돌려준다
+        # (새로 붙인 ID의 409는 앞선 시도가 반영된 것이므로 새로 생성된 것으로 본다)
+        for index, result in enumerate(results):
+            if not result['success'] and result.get('error_code') == 409:
+                results[index] = self._existing_event_result(calendar_id, bodies[index], revive_cancelled)
+                if index in generated:
+                    results[index].pop("already_exists", None)
+
+        return results
+
+    def _execute_batched(
+        self,
+        indexes,
+        make_request,
+        on_success,
+        results,
+        max_retries: int,
+        progress_callback: Optional[ProgressCallback] = None
+    ):
+        """
+        인덱스별 요청을 배치로 실행하고 일시적 오류 항목만 재시도
+
+        응답을 받지 못한 요청도 다시 보내므로 make_request는 같은 인덱스에 대해 멱등이어야 한다
+        (insert는 일정 ID를 고정해 보낼 것).
+
+        Args:
+            indexes: 실행할 항목 인덱스 리스트
+            make_request: 인덱스 -> HttpRequest (재시도해도 안전해야 함)
+            on_success: (인덱스, 응답) 성공 처리
+            results: 실패 결과를 기록할 리스트
+            max_retries: 항목별 최대 재시도 횟수
+            progress_callback: 배치마다 (결과가 확정된 항목 수, 전체 항목 수)로 호출
+        """
+        attempt = 0
+        pending = list(indexes)
+        while pending:
+            retry: List[int] = []
+
+            def make_callback(index: int):
+                def callback(request_id, response, exception):
+                    if exception is None:
+                        on_success(index, response)
+                    elif is_retryable(exception) and attempt < max_retries:
+                        retry.append(index)
+                    else:
+                        results[index] = {
+                            "success": False,
+                            "error": str(exception),
+                            "error_code": getattr(getattr(exception, 'resp', None), 'status', None)
+                        }
+                return callback
+
+            for start in range(0, len(pending), BATCH_LIMIT):
+                chunk = pending[start:start + BATCH_LIMIT]
+                batch = self.service.new_batch_http_request()
+                for index in chunk:
+                    batch.add(make_request(index), callback=make_callback(index))
+                try:
+                    batch.execute()
+                except (HttpError, httplib2.HttpLib2Error, OSError) as error:
+                    # 배치 요청 자체가 실패하거나 연결 오류(시간 초과 등)가 나면 이 배치의 항목만
+                    # 재시도 대상으로 보고, 앞서 끝난 배치의 결과는 그대로 둔다
+                    retryable = is_retryable(error) or not isinstance(error, HttpError)
+                    for index in chunk:
+                        if results[index] is None and index not in retry:
+                            if retryable and attempt < max_retries:
+                                retry.append(index)
+                            else:
+                                results[index] = {
+                                    "success": False,
+                                    "error": str(error),
+                                    "error_code": getattr(getattr(error, 'resp', None), 'status', None)
+                                }
+
+                if progress_callback is not None:
+                    progress_callback(sum(result is not None for result in results), len(results))
+
+            pending = sorted(retry)
+            if pending:
+                attempt += 1
+                time.sleep(min(2 ** attempt, 30))
+
+    def _existing_event_result(
+        self,
+        calendar_id: str,
+        google_event: Dict[str, Any],
+        revive_cancelled: bool = False
+    ) -> Dict[str, Any]:
+        """
+        고정 ID 충돌(409) 시 기존 일정 조회
+
+        같은 ID의 일정이 삭제(cancelled) 상태로 남아 있으면 일부러 지운 일정일 수 있으므로
+        실패(status "cancelled")로 돌려주고, revive_cancelled일 때만 내용을 덮어써 되살린다.
+        """
+        try:
+            existing = self.service.events().get(
+                calendarId=calendar_id,
+                eventId=google_event['id']
+            ).execute()
+
+            if existing.get('status') == 'cancelled':
+                if not revive_cancelled:
+                    return {
+                        "success": False,
+                        "error": "Event with this id was deleted",
+                        "event_id": google_event['id'],
+                        "status": "cancelled"
+                    }
+                existing = self.service.events().update(
+                    calendarId=calendar_id,
+                    eventId=google_event['id'],
+                    body={**google_event, 'status': 'confirmed'}
+                ).execute()
+                return self._created_result(existing)
+
+            return {**self._created_result(existing), "already_exists": True}
+
+        except HttpError as error:
+            return {
+                "success": False,
+                "error": str(error),
+                "error_code": error.resp.status
+            }
+
+    @staticmethod
+    def _created_result(created_event: Dict[str, Any]) -> Dict[str, Any]:
+        """생성된 일정 응답을 결과 형식으로 변환"""
+        return {
+            "success": True,
+            "event_id": created_event['id'],
+            "summary": created_event['summary'],
+            "start": created_event['start'],
+            "end": created_event['end'],
+            "html_link": created_event.get('htmlLink'),
+            "hangout_link": created_event.get('hangoutLink')
+        }
 
     def get_upcoming_events(
         self,
@@ -237,31 +725,132 @@ class CalendarService:
             일정 리스트
         """
         try:
-            now = datetime.utcnow().isoformat() + 'Z'
+            events = list(self.iter_events(
+                calendar_id=calendar_id,
+                max_results=max_results,
+                page_size=max_results
+            ))
 
-            events_result = self.service.events().list(
-                calendarId=calendar_id,
-                timeMin=now,
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy='startTime'
+            return {
+                "success": True,
+                "count": len(events),
+                "events": events
+            }
+
+        except HttpError as error:
+            return {
+                "success": False,
+                "error": str(error),
+                "error_code": error.resp.status
+            }
+
+    def iter_event_pages(
+        self,
+        calendar_id: str = 'primary',
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        max_results: Optional[int] = None,
+        page_size: int = 250
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        일정을 페이지 단위로 조회 (nextPageToken을 따라가며 지연 조회)
+
+        Args:
+            calendar_id: 캘린더 ID
+            time_min: 조회 시작 시각 (타임존 필수, 기본: 현재)
+            time_max: 조회 종료 시각 (없으면 제한 없음)
+            max_results: 전체 최대 결과 수 (없으면 제한 없음)
+            page_size: 페이지당 요청 크기
+
+        Yields:
+            페이지별 일정 리스트
+
+        Raises:
+            HttpError: Calendar API 오류
+            ValueError: 타임존이 없는 time_min/time_max
+        """
+        params = {
+            'calendarId': calendar_id,
+            'timeMin': to_rfc3339(time_min or datetime.now(dt_timezone.utc)),
+            'singleEvents': True,
+            'orderBy': 'startTime',
+            'fields': EVENT_LIST_FIELDS
+        }
+        if time_max:
+            params['timeMax'] = to_rfc3339(time_max)
+
+        remaining = max_results
+        page_token = None
+        while remaining is None or remaining > 0:
+            size = min(page_size, MAX_PAGE_SIZE)
+            if remaining is not None:
+                size = min(size, remaining)
+
+            response = self.service.events().list(
+                pageToken=page_token,
+                maxResults=size,
+                **params
             ).execute()
 
-            events = events_result.get('items', [])
+            page = [self._compact_event(event) for event in response.get('items', [])]
+            if remaining is not None:
+                remaining -= len(page)
+            yield page
+
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+
+    def list_events_page(
+        self,
+        calendar_id: str = 'primary',
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        max_results: int = 250,
+        page_token: Optional[str] = None,
+        etag: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        일정 한 페이지 조회 (ETag 조건부 요청)
 
+        Args:
+            calendar_id: 캘린더 ID
+            time_min: 조회 시작 시각 (타임존 필수, 기본: 현재)
+            time_max: 조회 종료 시각 (없으면 제한 없음)
+            max_results: 최대 결과 수 (최대 MAX_PAGE_SIZE)
+            page_token: 다음 페이지 토큰
+            etag: 이전 조회의 ETag (변경이 없으면 not_modified=True, events 없음)
+
+        Returns:
+            일정 리스트, 다음 페이지 토큰, ETag
+        """
+        params = {
+            'calendarId': calendar_id,
+            'timeMin': to_rfc3339(time_min or datetime.now(dt_timezone.utc)),
+            'singleEvents': True,
+            'orderBy': 'startTime',
+            'maxResults': max(1, min(int(max_results), MAX_PAGE_SIZE)),
+            'fields': 'etag, ' + EVENT_LIST_FIELDS
+        }
+        if time_max:
+            params['timeMax'] = to_rfc3339(time_max)
+        if page_token:
+            params['pageToken'] = page_token
+
+        try:
+            response, new_etag = execute_conditional(self.service.events().list(**params), etag)
+
+            if response is None:
+                return {"success": True, "not_modified": True, "etag": new_etag}
+
+            events = [self._compact_event(event) for event in response.get('items', [])]
             return {
                 "success": True,
+                "not_modified": False,
+                "etag": new_etag,
                 "count": len(events),
-                "events": [
-                    {
-                        "id": event['id'],
-                        "summary": event['summary'],
-                        "start": event['start'],
-                        "end": event['end'],
-                        "html_link": event.get('htmlLink')
-                    }
-                    for event in events
-                ]
+                "events": events,
+                "next_page_token": response.get('nextPageToken')
             }
 
         except HttpError as error:
@@ -271,6 +860,89 @@ class CalendarService:
                 "error_code": error.resp.status
             }
 
+    def iter_events(self, **kwargs) -> Iterator[Dict[str, Any]]:
+        """일정을 하나씩 조회 (인자는 iter_event_pages와 동일)"""
+        for page in self.iter_event_pages(**kwargs):
+            yield from page
+
+    def sync_events(
+        self,
+        calendar_id: str = 'primary',
+        sync_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        일정 증분 동기화 (syncToken)
+
+        sync_token이 없으면 전체 동기화를 수행한다. 토큰이 만료되면(410 Gone)
+        full_resync_required를 True로 돌려주므로 호출자는 토큰 없이 다시 호출해야 한다.
+
+        Args:
+            calendar_id: 캘린더 ID
+            sync_token: 이전 동기화에서 받은 nextSyncToken
+
+        Returns:
+            변경된 일정 목록 (삭제된 일정은 cancelled=True)과 다음 sync token
+        """
+        try:
+            changed = []
+            page_token = None
+            while True:
+                params = {
+                    'calendarId': calendar_id,
+                    'singleEvents': True,
+                    'maxResults': MAX_PAGE_SIZE,
+                    'fields': EVENT_SYNC_FIELDS
+                }
+                if page_token:
+                    params['pageToken'] = page_token
+                if sync_token:
+                    params['syncToken'] = sync_token
+
+                response = self.service.events().list(**params).execute()
+
+                for event in response.get('items', []):
+                    if event.get('status') == 'cancelled':
+                        changed.append({"id": event['id'], "cancelled": True})
+                    else:
+                        changed.append({**self._compact_event(event), "cancelled": False})
+
+                page_token = response.get('nextPageToken')
+                if not page_token:
+                    break
+
+            return {
+                "success": True,
+                "full_sync": sync_token is None,
+                "events": changed,
+                "next_sync_token": response.get('nextSyncToken'),
+                "timezone": response.get('timeZone')
+            }
+
+        except HttpError as error:
+            if error.resp.status == 410:
+                return {
+                    "success": False,
+                    "full_resync_required": True,
+                    "error": str(error),
+                    "error_code": 410
+                }
+            return {
+                "success": False,
+                "error": str(error),
+                "error_code": error.resp.status
+            }
+
+    @staticmethod
+    def _compact_event(event: Dict[str, Any]) -> Dict[str, Any]:
+        """조회 결과에 담는 일정 속성만 추출"""
+        return {
+            "id": event['id'],
+            "summary": event.get('summary'),
+            "start": event['start'],
+            "end": event['end'],
+            "html_link": event.get('htmlLink')
+        }
+
     def update_event(
         self,
         event_id: str,
@@ -344,3 +1016,127 @@ class CalendarService:
                 "error": str(error),
                 "error_code": error.resp.status
             }
+
+    def patch_events(
+        self,
+        updates: List[Dict[str, Any]],
+        calendar_id: str = 'primary',
+        timezone: str = 'Asia/Seoul',
+        max_retries: int = 3,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        일정 일괄 수정 (변경 필드만 events.patch, 배치 요청)
+
+        시간을 바꾸면서 all_day를 지정하지 않은 항목은 기존 일정의 종류(종일/시간 지정)를
+        먼저 배치로 조회해 그대로 유지한다.
+
+        Args:
+            updates: {"event_id": ..., 변경할 속성...} 리스트 (build_event_patch 참고)
+            calendar_id: 캘린더 ID
+            timezone: start_time/end_time에 적용할 타임존
+            max_retries: 항목별 최대 재시도 횟수
+            progress_callback: 배치마다 (완료 수, 전체 수)로 호출
+
+        Returns:
+            요청 순서대로 정렬된 수정 결과 리스트
+        """
+        changes = [
+            {k: v for k, v in update.items() if k != 'event_id' and not (k == 'all_day' and v is None)}
+            for update in updates
+        ]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(updates)
+
+        keep_kind = [
+            index for index, change in enumerate(changes)
+            if 'all_day' not in change and ('start_time' in change or 'end_time' in change)
+        ]
+        if keep_kind:
+            def make_get(index: int):
+                return self.service.events().get(
+                    calendarId=calendar_id,
+                    eventId=updates[index]['event_id'],
+                    fields='start'
+                )
+
+            def on_existing(index: int, existing: Dict[str, Any]):
+                changes[index]['all_day'] = 'date' in existing.get('start', {})
+
+            # 조회에 실패한 항목은 results에 실패가 기록되어 수정하지 않는다
+            self._execute_batched(keep_kind, make_get, on_existing, results, max_retries)
+
+        pending = [index for index, result in enumerate(results) if result is None]
+        bodies = {index: build_event_patch(changes[index], timezone) for index in pending}
+
+        def make_request(index: int):
+            return self.service.events().patch(
+                calendarId=calendar_id,
+                eventId=updates[index]['event_id'],
+                body=bodies[index],
+                fields='id, summary, updated'
+            )
+
+        def on_success(index: int, updated: Dict[str, Any]):
+            results[index] = {
+                "success": True,
+                "event_id": updated['id'],
+                "summary": updated.get('summary'),
+                "updated": updated.get('updated')
+            }
+
+        self._execute_batched(pending, make_request, on_success, results, max_retries, progress_callback)
+
+        for index, result in enumerate(results):
+            result.setdefault("event_id", updates[index]['event_id'])
+        return results
+
+    def delete_events(
+        self,
+        event_ids: List[str],
+        calendar_id: str = 'primary',
+        max_retries: int = 3,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        일정 일괄 삭제 (배치 요청)
+
+        이미 삭제된 일정(410 Gone)은 성공으로 처리한다.
+
+        Args:
+            event_ids: 삭제할 일정 ID 리스트
+            calendar_id: 캘린더 ID
+            max_retries: 항목별 최대 재시도 횟수
+            progress_callback: 배치마다 (완료 수, 전체 수)로 호출
+
+        Returns:
+            요청 순서대로 정렬된 삭제 결과 리스트
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(event_ids)
+
+        def make_request(index: int):
+            return self.service.events().delete(
+                calendarId=calendar_id,
+                eventId=event_ids[index]
+            )
+
+        def on_success(index: int, _response):
+            results[index] = {
+                "success": True,
+                "event_id": event_ids[index],
+                "message": "Event deleted successfully"
+            }
+
+        self._execute_batched(
+            list(range(len(event_ids))), make_request, on_success, results, max_retries, progress_callback
+        )
+
+        for index, result in enumerate(results):
+            if not result['success'] and result.get('error_code') == 410:
+                results[index] = {
+                    "success": True,
+                    "event_id": event_ids[index],
+                    "message": "Event already deleted"
+                }
+            else:
+                result.setdefault("event_id", event_ids[index])
+        return results
@@ -2,27 +2,115 @@
 Google Drive 서비스 도메인
 파일 업로드 및 관리 기능 제공 (계약서 저장)
 """
-from typing import Optional, Dict, Any, List
+import io
+import logging
+import sqlite3
+import time
+from typing import Optional, Dict, Any, List, Union, BinaryIO, Iterable, Tuple, Callable
 from pathlib import Path
+import httplib2
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import DEFAULT_CHUNK_SIZE, MediaFileUpload, MediaIoBaseUpload, MediaIoBaseDownload
+
+from src.contract_index import join_parties
+from src.google_services.bulk import DEFAULT_MAX_WORKERS, run_bulk
+from src.google_services.transport import ThreadLocalHttp, execute_conditional
+from src.tracing import traced
+
+
+# stdio MCP 모드에서는 stdout이 JSON-RPC 채널이므로 logging(기본 stderr)으로 남긴다
+logger = logging.getLogger(__name__)
+
+# 확장자별 MIME 타입
+EXTENSION_MIME_TYPES = {
+    '.pdf': 'application/pdf',
+    '.doc': 'application/msword',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.txt': 'text/plain',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.zip': 'application/zip'
+}
+
+
+# 권한 강도 순서 (기존 권한이 같거나 더 강하면 공유를 건너뛴다)
+ROLE_RANK = {
+    'reader': 0,
+    'commenter': 1,
+    'writer': 2,
+    'fileOrganizer': 3,
+    'organizer': 4,
+    'owner': 5
+}
+
+# Drive 배치 요청 한 번에 담을 수 있는 최대 호출 수
+BATCH_LIMIT = 100
+
+# permissions.list 페이지 최대 크기
+PERMISSION_PAGE_SIZE = 100
+
+# 기존 권한 목록 캐시 기본 유지 시간 (초)
+DEFAULT_PERMISSION_CACHE_TTL = 60.0
+
+# 진행률을 보고할 때의 재개 가능 업로드 청크 크기 (256KB의 배수)
+PROGRESS_CHUNK_SIZE = 8 * 1024 * 1024
+
+# 파일 목록/메타데이터 조회 시 요청할 필드
+FILE_METADATA_FIELDS = (
+    'id, name, mimeType, size, md5Checksum, createdTime, modifiedTime, '
+    'parents, properties, webViewLink, webContentLink'
+)
+
+# 업로드 진행률 콜백 (전송한 바이트, 전체 바이트)
+ProgressCallback = Callable[[int, int], None]
+
+
+def guess_mime_type(filename: str) -> str:
+    """파일 이름의 확장자로 MIME 타입 추정"""
+    ext = Path(filename).suffix.lower()
+    return EXTENSION_MIME_TYPES.get(ext, 'application/octet-stream')
+
+
+class _TeeWriter(io.RawIOBase):
+    """다운로드 청크를 sink와 캐시 파일에 동시에 기록"""
+
+    def __init__(self, *targets: BinaryIO):
+        self.targets = [target for target in targets if target is not None]
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        for target in self.targets:
+            target.write(data)
+        return len(data)
 
 
 class DriveFile:
-    """드라이브 파일 도메인 모델"""
+    """드라이브 파일 도메인 모델
+
+    업로드 원본은 로컬 파일 경로(filepath) 또는 메모리 컨텐츠(content) 중 하나.
+    content는 bytes 또는 seek 가능한 파일 객체(BytesIO, SpooledTemporaryFile 등)를 받는다.
+    """
 
     def __init__(
         self,
         name: str,
-        filepath: str,
+        filepath: Optional[str] = None,
         mime_type: Optional[str] = None,
         folder_id: Optional[str] = None,
         description: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        content: Optional[Union[bytes, BinaryIO]] = None
     ):
+        if filepath is None and content is None:
+            raise ValueError("DriveFile requires either filepath or content")
+
         self.name = name
         self.filepath = filepath
+        self.content = content
         self.mime_type = mime_type or self._detect_mime_type()
         self.folder_id = folder_id
         self.description = description
@@ -30,18 +118,24 @@ class DriveFile:
 
     def _detect_mime_type(self) -> str:
         """파일 확장자로 MIME 타입 감지"""
-        extension_map = {
-            '.pdf': 'application/pdf',
-            '.doc': 'application/msword',
-            '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            '.txt': 'text/plain',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png',
-            '.zip': 'application/zip'
-        }
-        ext = Path(self.filepath).suffix.lower()
-        return extension_map.get(ext, 'application/octet-stream')
+        return guess_mime_type(self.filepath or self.name)
+
+    def to_media_upload(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """업로드 원본에 맞는 MediaUpload 객체 생성"""
+        if self.content is not None:
+            stream = self.content
+            if isinstance(stream, (bytes, bytearray)):
+                stream = io.BytesIO(stream)
+            else:
+                stream.seek(0)
+            return MediaIoBaseUpload(stream, mimetype=self.mime_type, chunksize=chunk_size, resumable=True)
+
+        return MediaFileUpload(
+            self.filepath,
+            mimetype=self.mime_type,
+            chunksize=chunk_size,
+            resumable=True
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
@@ -58,15 +152,33 @@ class DriveFile:
 class DriveService:
     """Google Drive 서비스"""
 
-    def __init__(self, credentials):
+    def __init__(
+        self,
+        credentials,
+        contract_index=None,
+        download_cache=None,
+        permission_cache_ttl: float = DEFAULT_PERMISSION_CACHE_TTL
+    ):
         """
         Drive 서비스 초기화
 
         Args:
             credentials: Google OAuth 인증 정보
+            contract_index: 업로드한 계약서를 기록할 ContractIndex (선택)
+            download_cache: 다운로드 파일을 보관할 DiskLRUCache (선택)
+            permission_cache_ttl: 기존 권한 목록을 다시 조회하기 전까지 재사용하는 시간 (초)
         """
         self.credentials = credentials
-        self.service = build('drive', 'v3', credentials=credentials)
+        self.contract_index = contract_index
+        self.download_cache = download_cache
+        self.service = build('drive', 'v3', http=ThreadLocalHttp(credentials))
+        # 폴더 이름 -> 폴더 정보 캐시 (변경 피드 동기화로 무효화)
+        self._folder_cache: Dict[str, Dict[str, Any]] = {}
+        # 파일 ID -> {이메일(소문자): 권한} 캐시 (변경 피드 동기화 또는 TTL로 무효화,
+        # 외부에서 회수된 공유를 동기화 없이도 TTL 안에 다시 확인한다)
+        self._permission_cache: Dict[str, Dict[str, str]] = {}
+        self._permission_loaded_at: Dict[str, float] = {}
+        self.permission_cache_ttl = permission_cache_ttl
 
     def create_folder(
         self,
@@ -111,12 +223,18 @@ class DriveService:
                 "error_code": error.resp.status
             }
 
-    def upload_file(self, drive_file: DriveFile) -> Dict[str, Any]:
+    def upload_file(
+        self,
+        drive_file: DriveFile,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
         """
         파일 업로드
 
         Args:
             drive_file: DriveFile 객체
+            progress_callback: 청크를 보낼 때마다 (전송한 바이트, 전체 바이트)로 호출
+                (지정하면 PROGRESS_CHUNK_SIZE 단위로 나눠 업로드)
 
         Returns:
             업로드 결과 (파일 ID, 링크 포함)
@@ -136,17 +254,26 @@ class DriveService:
             if drive_file.metadata:
                 file_metadata['properties'] = drive_file.metadata
 
-            media = MediaFileUpload(
-                drive_file.filepath,
-                mimetype=drive_file.mime_type,
-                resumable=True
-            )
+            if progress_callback is None:
+                media = drive_file.to_media_upload()
+            else:
+                media = drive_file.to_media_upload(chunk_size=PROGRESS_CHUNK_SIZE)
 
-            file = self.service.files().create(
+            request = self.service.files().create(
                 body=file_metadata,
                 media_body=media,
-                fields='id, name, webViewLink, webContentLink, mimeType, size, createdTime'
-            ).execute()
+                fields='id, name, webViewLink, webContentLink, mimeType, size, createdTime, md5Checksum'
+            )
+
+            if progress_callback is None:
+                file = request.execute()
+            else:
+                file = None
+                while file is None:
+                    status, file = request.next_chunk()
+                    if status is not None:
+                        progress_callback(status.resumable_progress, status.total_size)
+                progress_callback(media.size(), media.size())
 
             return {
                 "success": True,
@@ -156,7 +283,8 @@ class DriveService:
                 "download_link": file.get('webContentLink'),
                 "mime_type": file.get('mimeType'),
                 "size": file.get('size'),
-                "created_time": file.get('createdTime')
+                "created_time": file.get('createdTime'),
+                "md5_checksum": file.get('md5Checksum')
             }
 
         except HttpError as error:
@@ -173,23 +301,35 @@ class DriveService:
 
     def upload_contract(
         self,
-        contract_file_path: str,
+        contract_file_path: Optional[str],
         contract_name: str,
         contract_metadata: Optional[Dict[str, Any]] = None,
-        folder_name: str = "Contracts"
+        folder_name: str = "Contracts",
+        contract_content: Optional[Union[bytes, BinaryIO]] = None,
+        mime_type: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None
     ) -> Dict[str, Any]:
         """
         계약서 업로드 (전용 폴더에 저장)
 
         Args:
-            contract_file_path: 계약서 파일 경로
+            contract_file_path: 계약서 파일 경로 (contract_content를 주면 None)
             contract_name: 계약서 이름
             contract_metadata: 계약서 메타데이터 (계약 날짜, 당사자 등)
             folder_name: 저장할 폴더 이름 (기본: Contracts)
+            contract_content: 파일 경로 대신 업로드할 메모리 컨텐츠 (bytes 또는 파일 객체)
+            mime_type: MIME 타입 (없으면 파일 이름으로 추정)
+            progress_callback: 업로드 진행률 콜백 (upload_file 참고)
 
         Returns:
             업로드 결과
+
+        Raises:
+            ValueError: contract_file_path와 contract_content가 모두 없을 때
         """
+        if contract_file_path is None and contract_content is None:
+            raise ValueError("upload_contract requires either contract_file_path or contract_content")
+
         # 계약서 폴더 찾기 또는 생성
         folder_result = self._find_or_create_folder(folder_name)
 
@@ -198,19 +338,145 @@ class DriveService:
 
         folder_id = folder_result['folder_id']
 
+        # Drive 속성 값은 문자열만 허용하므로 당사자 목록은 JSON 배열로 저장
+        properties = dict(contract_metadata or {})
+        if isinstance(properties.get('parties'), (list, tuple)):
+            properties['parties'] = join_parties(properties['parties'])
+
         # 계약서 파일 업로드
         drive_file = DriveFile(
             name=contract_name,
             filepath=contract_file_path,
+            mime_type=mime_type,
             folder_id=folder_id,
             description="Contract Document",
-            metadata=contract_metadata
+            metadata=properties,
+            content=contract_content
+        )
+
+        result = self.upload_file(drive_file, progress_callback=progress_callback)
+
+        if result['success']:
+            result['folder_id'] = folder_id
+            if self.contract_index is not None:
+                # 인덱스 기록 실패가 이미 끝난 업로드를 실패로 만들지 않도록 한다
+                try:
+                    self.contract_index.record_upload(result, folder_name, contract_metadata)
+                except sqlite3.Error as error:
+                    result['index_error'] = str(error)
+
+        return result
+
+    def upload_contracts(
+        self,
+        contracts: List[Dict[str, Any]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        계약서 일괄 업로드 (여러 스레드에서 동시에 업로드)
+
+        같은 폴더가 동시에 여러 번 만들어지지 않도록 대상 폴더를 먼저 한 번씩 찾거나 만든다.
+
+        Args:
+            contracts: upload_contract 인자 dict 리스트
+            max_workers: 최대 동시 업로드 수
+            progress_callback: 한 건이 끝날 때마다 (완료 수, 전체 수)로 호출
+
+        Returns:
+            요청 순서대로 정렬된 업로드 결과 리스트
+        """
+        for folder_name in dict.fromkeys(contract.get('folder_name', 'Contracts') for contract in contracts):
+            # 실패하면 해당 항목 업로드에서 다시 시도해 항목별 오류로 남긴다
+            self._find_or_create_folder(folder_name)
+
+        return run_bulk(
+            lambda contract: self.upload_contract(**contract),
+            contracts,
+            max_workers,
+            progress_callback
         )
 
-        return self.upload_file(drive_file)
+    def download_file(
+        self,
+        file_id: str,
+        sink: BinaryIO,
+        chunk_size: int = 8 * 1024 * 1024
+    ) -> Dict[str, Any]:
+        """
+        파일 다운로드 (청크 단위 스트리밍)
+
+        파일 ID + md5Checksum(없으면 modifiedTime)을 키로 디스크 캐시를 조회하고,
+        캐시에 없으면 Range 요청으로 청크씩 받아 sink와 캐시에 함께 기록한다.
+
+        Args:
+            file_id: 다운로드할 파일 ID
+            sink: 내용을 기록할 바이너리 파일 객체
+            chunk_size: 청크 크기 (바이트)
+
+        Returns:
+            다운로드 결과 (파일 정보, 캐시 적중 여부 포함)
+        """
+        try:
+            file = self.service.files().get(
+                fileId=file_id,
+                fields='id, name, mimeType, size, md5Checksum, modifiedTime'
+            ).execute()
+
+            result = {
+                "success": True,
+                "file_id": file['id'],
+                "file_name": file['name'],
+                "mime_type": file.get('mimeType'),
+                "size": file.get('size'),
+                "md5_checksum": file.get('md5Checksum'),
+                "modified_time": file.get('modifiedTime'),
+                "cached": False
+            }
+
+            cache = self.download_cache
+            version = file.get('md5Checksum') or file.get('modifiedTime')
+            cache_key = f"{file_id}:{version}"
+            if cache is not None and version and cache.copy_to(cache_key, sink, chunk_size):
+                result['cached'] = True
+                return result
 
+            request = self.service.files().get_media(fileId=file_id)
+            cacheable = (
+                cache is not None and version
+                and int(file.get('size') or 0) <= cache.max_bytes
+            )
+
+            if cacheable:
+                with cache.writer(cache_key) as cache_file:
+                    self._stream_media(request, _TeeWriter(sink, cache_file), chunk_size)
+            else:
+                self._stream_media(request, sink, chunk_size)
+
+            return result
+
+        except HttpError as error:
+            return {
+                "success": False,
+                "error": str(error),
+                "error_code": error.resp.status
+            }
+
+    @staticmethod
+    def _stream_media(request, target: BinaryIO, chunk_size: int):
+        """MediaIoBaseDownload로 청크 단위 다운로드"""
+        downloader = MediaIoBaseDownload(target, request, chunksize=chunk_size)
+        done = False
+        while not done:
+            _, done = downloader.next_chunk()
+
+    @traced("drive.find_or_create_folder")
     def _find_or_create_folder(self, folder_name: str) -> Dict[str, Any]:
         """폴더 찾기 또는 생성"""
+        cached = self._folder_cache.get(folder_name)
+        if cached:
+            return {"success": True, **cached, "created": False}
+
         try:
             # 폴더 검색
             query = f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
@@ -224,6 +490,7 @@ class DriveService:
 
             if folders:
                 # 기존 폴더 사용
+                self._cache_folder(folders[0]['id'], folders[0]['name'])
                 return {
                     "success": True,
                     "folder_id": folders[0]['id'],
@@ -234,6 +501,7 @@ class DriveService:
                 # 새 폴더 생성
                 result = self.create_folder(folder_name)
                 if result['success']:
+                    self._cache_folder(result['folder_id'], result['folder_name'])
                     result['created'] = True
                 return result
 
@@ -276,6 +544,9 @@ class DriveService:
                 sendNotificationEmail=send_notification
             ).execute()
 
+            if file_id in self._permission_cache:
+                self._permission_cache[file_id][email.lower()] = role
+
             return {
                 "success": True,
                 "file_id": file_id,
@@ -288,4 +559,348 @@ class DriveService:
                 "success": False,
                 "error": str(error),
                 "error_code": error.resp.status
-            }
\ No newline at end of file
+            }
+
+    def _cache_folder(self, folder_id: str, folder_name: str):
+        """폴더 캐시에 추가"""
+        self._folder_cache[folder_name] = {
+            "folder_id": folder_id,
+            "folder_name": folder_name
+        }
+
+    def cached_folder_name(self, folder_id: str) -> Optional[str]:
+        """캐시된 폴더 ID의 이름 (없으면 None)"""
+        for name, folder in list(self._folder_cache.items()):
+            if folder['folder_id'] == folder_id:
+                return name
+        return None
+
+    def invalidate_folder(self, folder_id: str):
+        """폴더 ID에 해당하는 캐시 항목 제거"""
+        for name, folder in list(self._folder_cache.items()):
+            if folder['folder_id'] == folder_id:
+                self._folder_cache.pop(name, None)
+
+    def invalidate_permissions(self, file_id: str):
+        """파일의 권한 캐시 제거"""
+        self._permission_cache.pop(file_id, None)
+        self._permission_loaded_at.pop(file_id, None)
+
+    def _cached_permissions(self, file_id: str) -> Optional[Dict[str, str]]:
+        """TTL 안에 조회한 파일의 권한 목록 (없거나 만료되면 None)"""
+        loaded_at = self._permission_loaded_at.get(file_id)
+        if loaded_at is None or time.monotonic() - loaded_at >= self.permission_cache_ttl:
+            return None
+        return self._permission_cache.get(file_id)
+
+    def get_start_page_token(self) -> Dict[str, Any]:
+        """
+        변경 피드 시작 커서 조회
+
+        Returns:
+            시작 페이지 토큰
+        """
+        try:
+            response = self.service.changes().getStartPageToken().execute()
+
+            return {
+                "success": True,
+                "start_page_token": response['startPageToken']
+            }
+
+        except HttpError as error:
+            return {
+                "success": False,
+                "error": str(error),
+                "error_code": error.resp.status
+            }
+
+    def list_changes(self, page_token: str, page_size: int = 1000) -> Dict[str, Any]:
+        """
+        변경 피드 한 페이지 조회
+
+        Args:
+            page_token: 변경 피드 커서
+            page_size: 페이지 크기
+
+        Returns:
+            변경 목록과 다음 커서 (next_page_token 또는 new_start_page_token)
+        """
+        try:
+            response = self.service.changes().list(
+                pageToken=page_token,
+                pageSize=page_size,
+                spaces='drive',
+                includeRemoved=True,
+                fields=(
+                    'nextPageToken, newStartPageToken, '
+                    'changes(changeType, fileId, removed, file(id, name, mimeType, trashed, parents, '
+                    'properties, md5Checksum, size, webViewLink, webContentLink, createdTime))'
+                )
+            ).execute()
+
+            return {
+                "success": True,
+                "changes": response.get('changes', []),
+                "next_page_token": response.get('nextPageToken'),
+                "new_start_page_token": response.get('newStartPageToken')
+            }
+
+        except HttpError as error:
+            return {
+                "success": False,
+                "error": str(error),
+                "error_code": error.resp.status
+            }
+
+    def list_folder(
+        self,
+        folder_id: str,
+        page_size: int = 100,
+        page_token: Optional[str] = None,
+        etag: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        폴더 안의 파일 목록 조회 (ETag 조건부 요청)
+
+        Args:
+            folder_id: 폴더 ID ('root'면 내 드라이브 최상위)
+            page_size: 페이지 크기 (최대 1000)
+            page_token: 다음 페이지 토큰
+            etag: 이전 조회의 ETag (변경이 없으면 not_modified=True, files 없음)
+
+        Returns:
+            파일 목록, 다음 페이지 토큰, ETag
+        """
+        try:
+            escaped = folder_id.replace('\\', '\\\\').replace("'", "\\'")
+            request = self.service.files().list(
+                q=f"'{escaped}' in parents and trashed=false",
+                spaces='drive',
+                pageSize=max(1, min(int(page_size), 1000)),
+                pageToken=page_token,
+                orderBy='folder, name',
+                fields=f'nextPageToken, files({FILE_METADATA_FIELDS})'
+            )
+            response, new_etag = execute_conditional(request, etag)
+
+            if response is None:
+                return {"success": True, "not_modified": True, "etag": new_etag}
+
+            files = response.get('files', [])
+            return {
+                "success": True,
+                "not_modified": False,
+                "etag": new_etag,
+                "folder_id": folder_id,
+                "count": len(files),
+                "files": files,
+                "next_page_token": response.get('nextPageToken')
+            }
+
+        except HttpError as error:
+            return {
+                "success": False,
+                "error": str(error),
+                "error_code": error.resp.status
+            }
+
+    def get_file_metadata(self, file_id: str, etag: Optional[str] = None) -> Dict[str, Any]:
+        """
+        파일 메타데이터 조회 (ETag 조건부 요청)
+
+        Args:
+            file_id: 파일 ID
+            etag: 이전 조회의 ETag (변경이 없으면 not_modified=True, file 없음)
+
+        Returns:
+            파일 메타데이터와 ETag
+        """
+        try:
+            request = self.service.files().get(fileId=file_id, fields=FILE_METADATA_FIELDS)
+            response, new_etag = execute_conditional(request, etag)
+
+            if response is None:
+                return {"success": True, "not_modified": True, "etag": new_etag}
+
+            return {
+                "success": True,
+                "not_modified": False,
+                "etag": new_etag,
+                "file": response
+            }
+
+        except HttpError as error:
+            return {
+                "success": False,
+                "error": str(error),
+                "error_code": error.resp.status
+            }
+
+    def share_files(
+        self,
+        grants: Iterable[Tuple[str, str, str]],
+        send_notification: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 파일/사용자 공유를 배치 요청으로 처리
+
+        이미 같거나 더 강한 권한이 있는 공유는 건너뛴다.
+        기존 권한을 조회하지 못한 파일은 중복 공유를 만들지 않도록 요청하지 않고 실패로 기록한다.
+
+        Args:
+            grants: (file_id, email, role) 튜플 목록
+            send_notification: 이메일 알림 전송 여부
+
+        Returns:
+            요청 순서대로 정렬된 공유 결과 리스트
+        """
+        grants = list(grants)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(grants)
+
+        load_errors = self._load_permissions({file_id for file_id, _, _ in grants})
+
+        pending: List[int] = []
+        requested: Dict[Tuple[str, str], str] = {}
+        for index, (file_id, email, role) in enumerate(grants):
+            if file_id in load_errors:
+                results[index] = {
+                    "success": False,
+                    "file_id": file_id,
+                    "shared_with": email,
+                    **load_errors[file_id]
+                }
+                continue
+            key = (file_id, email.lower())
+            # 오류가 없던 파일은 방금 조회했거나 TTL 안에 조회한 권한 목록이 캐시에 있다
+            existing = self._permission_cache.get(file_id, {}).get(key[1]) or requested.get(key)
+            if existing and ROLE_RANK.get(existing, 0) >= ROLE_RANK.get(role, 0):
+                results[index] = {
+                    "success": True,
+                    "file_id": file_id,
+                    "shared_with": email,
+                    "role": existing,
+                    "skipped": True
+                }
+                continue
+            requested[key] = role
+            pending.append(index)
+
+        def make_callback(index: int):
+            file_id, email, role = grants[index]
+
+            def callback(request_id, response, exception):
+                if exception is not None:
+                    results[index] = {
+                        "success": False,
+                        "file_id": file_id,
+                        "shared_with": email,
+                        "error": str(exception),
+                        "error_code": getattr(getattr(exception, 'resp', None), 'status', None)
+                    }
+                    return
+                self._permission_cache.setdefault(file_id, {})[email.lower()] = role
+                results[index] = {
+                    "success": True,
+                    "file_id": file_id,
+                    "shared_with": email,
+                    "role": role,
+                    "permission_id": response.get('id')
+                }
+            return callback
+
+        for start in range(0, len(pending), BATCH_LIMIT):
+            batch = self.service.new_batch_http_request()
+            for index in pending[start:start + BATCH_LIMIT]:
+                file_id, email, role = grants[index]
+                batch.add(
+                    self.service.permissions().create(
+                        fileId=file_id,
+                        body={'type': 'user', 'role': role, 'emailAddress': email},
+                        sendNotificationEmail=send_notification,
+                        fields='id'
+                    ),
+                    callback=make_callback(index)
+                )
+            try:
+                batch.execute()
+            except (HttpError, httplib2.HttpLib2Error, OSError) as error:
+                # 배치 요청 자체가 실패하거나 연결 오류(시간 초과 등)가 나면 이 배치에서
+                # 응답을 받지 못한 항목만 실패로 기록하고 다음 배치는 계속 보낸다
+                for index in pending[start:start + BATCH_LIMIT]:
+                    if results[index] is None:
+                        file_id, email, _ = grants[index]
+                        results[index] = {
+                            "success": False,
+                            "file_id": file_id,
+                            "shared_with": email,
+                            "error": str(error),
+                            "error_code": getattr(getattr(error, 'resp', None), 'status', None)
+                        }
+
+        return results
+
+    def _load_permissions(self, file_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        캐시에 없거나 TTL이 지난 파일의 권한 목록을 배치 요청으로 조회 (nextPageToken을 따라 모든 페이지)
+
+        Returns:
+            조회에 실패한 파일 ID -> {"error", "error_code"} (실패한 파일은 캐시하지 않는다)
+        """
+        pending: List[Tuple[str, Optional[str]]] = [
+            (file_id, None) for file_id in file_ids if self._cached_permissions(file_id) is None
+        ]
+        collected: Dict[str, Dict[str, str]] = {}
+        errors: Dict[str, Dict[str, Any]] = {}
+
+        def record_error(file_id: str, error: Exception):
+            logger.warning("Listing permissions for %s failed: %s", file_id, error)
+            errors[file_id] = {
+                "error": f"Could not load existing permissions: {error}",
+                "error_code": getattr(getattr(error, 'resp', None), 'status', None)
+            }
+
+        while pending:
+            next_pages: List[Tuple[str, Optional[str]]] = []
+
+            def make_callback(file_id: str):
+                def callback(request_id, response, exception):
+                    if exception is not None:
+                        record_error(file_id, exception)
+                        return
+                    roles = collected.setdefault(file_id, {})
+                    roles.update({
+                        permission['emailAddress'].lower(): permission['role']
+                        for permission in response.get('permissions', [])
+                        if permission.get('emailAddress')
+                    })
+                    # 모든 페이지를 받은 파일만 캐시한다
+                    if response.get('nextPageToken'):
+                        next_pages.append((file_id, response['nextPageToken']))
+                    else:
+                        self._permission_cache[file_id] = roles
+                        self._permission_loaded_at[file_id] = time.monotonic()
+                return callback
+
+            for start in range(0, len(pending), BATCH_LIMIT):
+                batch = self.service.new_batch_http_request()
+                for file_id, page_token in pending[start:start + BATCH_LIMIT]:
+                    batch.add(
+                        self.service.permissions().list(
+                            fileId=file_id,
+                            pageSize=PERMISSION_PAGE_SIZE,
+                            pageToken=page_token,
+                            fields='nextPageToken, permissions(id, emailAddress, role)'
+                        ),
+                        callback=make_callback(file_id)
+                    )
+                try:
+                    batch.execute()
+                except (HttpError, httplib2.HttpLib2Error, OSError) as error:
+                    for file_id, _ in pending[start:start + BATCH_LIMIT]:
+                        if self._cached_permissions(file_id) is None:
+                            record_error(file_id, error)
+
+            pending = [(file_id, token) for file_id, token in next_pages if file_id not in errors]
+
+        return errors
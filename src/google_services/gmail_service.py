@@ -2,7 +2,7 @@
 Gmail 서비스 도메인
 이메일 발송 기능 제공
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
@@ -11,6 +11,10 @@ import base64
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from src.google_services.bulk import DEFAULT_MAX_WORKERS, run_bulk
+from src.google_services.transport import ThreadLocalHttp
+from src.tracing import traced
+
 
 class EmailMessage:
     """이메일 메시지 도메인 모델"""
@@ -57,8 +61,9 @@ class GmailService:
             credentials: Google OAuth 인증 정보
         """
         self.credentials = credentials
-        self.service = build('gmail', 'v1', credentials=credentials)
+        self.service = build('gmail', 'v1', http=ThreadLocalHttp(credentials))
 
+    @traced("gmail.create_message")
     def create_message(self, email: EmailMessage) -> Dict[str, Any]:
         """
         이메일 메시지 생성
@@ -142,18 +147,21 @@ class GmailService:
                 "error_code": error.resp.status
             }
 
-    def send_bulk_emails(self, emails: List[EmailMessage]) -> List[Dict[str, Any]]:
+    def send_bulk_emails(
+        self,
+        emails: List[EmailMessage],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict[str, Any]]:
         """
-        대량 이메일 발송
+        대량 이메일 발송 (여러 스레드에서 동시에 발송)
 
         Args:
             emails: EmailMessage 리스트
+            max_workers: 최대 동시 발송 수
+            progress_callback: 한 건이 끝날 때마다 (완료 수, 전체 수)로 호출
 
         Returns:
-            각 이메일의 발송 결과 리스트
+            각 이메일의 발송 결과 리스트 (요청 순서)
         """
-        results = []
-        for email in emails:
-            result = self.send_email(email)
-            results.append(result)
-        return results
\ No newline at end of file
+        return run_bulk(self.send_email, emails, max_workers, progress_callback)
@@ -0,0 +1,88 @@
+"""
+일정 충돌 검사 도메인
+freebusy 조회 결과를 정렬된 구간 배열로 합쳐 충돌 검사와 빈 시간 탐색을 로컬에서 처리
+"""
+import bisect
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple, Iterable
+
+
+Interval = Tuple[datetime, datetime]
+
+
+class BusySchedule:
+    """바쁜 시간 구간 모음 (겹치는 구간은 병합해 시작 시각 순으로 보관)"""
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        merged: List[List[datetime]] = []
+        for start, end in sorted(interval for interval in intervals if interval[0] < interval[1]):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        self.starts = [interval[0] for interval in merged]
+        self.ends = [interval[1] for interval in merged]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def conflicts(self, start: datetime, end: datetime) -> List[Interval]:
+        """[start, end)와 겹치는 바쁜 구간 목록"""
+        # end보다 먼저 시작하는 구간 중 start 이후에 끝나는 것들
+        hi = bisect.bisect_left(self.starts, end)
+        lo = bisect.bisect_right(self.ends, start)
+        return [(self.starts[i], self.ends[i]) for i in range(lo, hi)]
+
+    def is_free(self, start: datetime, end: datetime) -> bool:
+        """[start, end)에 바쁜 구간이 없는지 확인"""
+        return not self.conflicts(start, end)
+
+    def earliest_free_slot(
+        self,
+        duration: timedelta,
+        window_start: datetime,
+        window_end: datetime,
+        step: Optional[timedelta] = None
+    ) -> Optional[Interval]:
+        """
+        창 안에서 duration 길이의 가장 이른 빈 시간
+
+        Args:
+            duration: 필요한 시간
+            window_start: 탐색 시작
+            window_end: 탐색 종료
+            step: 시작 시각 정렬 단위 (예: 15분 단위로 올림, 없으면 정렬하지 않음)
+
+        Returns:
+            (시작, 종료) 또는 빈 시간이 없으면 None
+        """
+        candidate = _align(window_start, window_start, step)
+        index = bisect.bisect_right(self.ends, candidate)
+
+        while candidate + duration <= window_end:
+            if index >= len(self.starts) or candidate + duration <= self.starts[index]:
+                return candidate, candidate + duration
+            # 겹치는 구간 끝으로 이동
+            candidate = _align(max(candidate, self.ends[index]), window_start, step)
+            index = bisect.bisect_right(self.ends, candidate)
+
+        return None
+
+
+def require_aware(value: datetime, name: str) -> datetime:
+    """타임존이 있는 datetime인지 확인 (없으면 어느 시각인지 알 수 없으므로 ValueError)"""
+    if value.tzinfo is None:
+        raise ValueError(f"{name} must include a timezone offset")
+    return value
+
+
+def _align(value: datetime, origin: datetime, step: Optional[timedelta]) -> datetime:
+    """origin 기준 step 단위로 올림"""
+    if not step:
+        return value
+    offset = value - origin
+    remainder = offset % step
+    if remainder:
+        value += step - remainder
+    return value
@@ -0,0 +1,83 @@
+"""
+Google API HTTP 전송 계층
+스레드마다 별도의 인증된 httplib2 연결을 사용 (httplib2.Http는 스레드 안전하지 않음)
+"""
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import google_auth_httplib2
+from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+
+from src.tracing import SPAN_KIND_CLIENT, span
+
+
+class ThreadLocalHttp:
+    """스레드별 AuthorizedHttp로 요청을 위임하는 http 객체
+
+    서비스 객체 하나를 asyncio.to_thread 워커 여러 개가 동시에 써도
+    요청이 같은 소켓에 섞이지 않는다.
+    """
+
+    def __init__(self, credentials):
+        """
+        Args:
+            credentials: Google OAuth 인증 정보 (모든 스레드가 공유)
+        """
+        # googleapiclient가 배치 요청에서 인증 정보를 꺼내 쓰는 속성
+        self.credentials = credentials
+        self._local = threading.local()
+
+    def _http(self) -> google_auth_httplib2.AuthorizedHttp:
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=build_http())
+            self._local.http = http
+        return http
+
+    def request(self, uri, method="GET", *args, **kwargs):
+        # 모든 .execute()/next_chunk()/배치 요청이 이 경로로 나가므로 여기서 한 번에 추적
+        with span("google.http", kind=SPAN_KIND_CLIENT, **{
+            "http.method": method,
+            "http.url": uri.split("?", 1)[0],
+        }) as current:
+            response, content = self._http().request(uri, method, *args, **kwargs)
+            current.set_attribute("http.status_code", response.status)
+            return response, content
+
+    def close(self):
+        """현재 스레드의 연결 종료"""
+        http = getattr(self._local, "http", None)
+        if http is not None:
+            http.close()
+            self._local.http = None
+
+
+def execute_conditional(request, etag: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    ETag 조건부 요청 실행 (If-None-Match)
+
+    Args:
+        request: 실행할 googleapiclient HttpRequest
+        etag: 이전 응답의 ETag (없으면 일반 요청)
+
+    Returns:
+        (응답 본문, ETag) - 변경이 없으면(304) 본문은 None이고 ETag는 보낸 값
+
+    Raises:
+        HttpError: 304 이외의 API 오류
+    """
+    headers = {}
+    request.add_response_callback(headers.update)
+    if etag:
+        request.headers['If-None-Match'] = etag
+
+    try:
+        body = request.execute()
+    except HttpError as error:
+        if etag and error.resp.status == 304:
+            return None, etag
+        raise
+
+    # 응답 헤더가 없으면 본문의 etag 필드 (fields에 etag를 넣은 경우)
+    return body, headers.get('etag') or body.get('etag')
@@ -1,19 +1,35 @@
 """HTTP 서버 (포트 8001)로 Gmail/Calendar/Drive 작업을 받는 엔드포인트."""
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import base64
+import hashlib
+import importlib
+import json
+import logging
 import tempfile
 import os
-from pathlib import Path
-from typing import Any, Dict, Literal, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Literal, Optional
 from uuid import uuid4
+from zoneinfo import ZoneInfo
 
 from aiohttp import web
 from pydantic import BaseModel, Field, ValidationError
 
 from src.auth import GoogleAuthManager
+from src.config import Config
+from src.contract_index import ContractIndex
+from src.file_cache import DiskLRUCache
+from src.read_cache import ReadCache
+from src.scheduler import DEFAULT_TENANT, PRIORITY_BATCH, PRIORITY_INTERACTIVE, FairScheduler, parse_lanes
+from src.drive_sync import DriveChangeSync
+from src.task_queue import TaskQueue
+from src.tracing import SPAN_KIND_SERVER, current_traceparent, span, traced
 
 
+# stdio MCP 모드(같은 라우터 사용)에서는 stdout이 JSON-RPC 채널이므로 logging(기본 stderr)으로 남긴다
+logger = logging.getLogger(__name__)
+
 # CORS 설정
 ALLOWED_ORIGINS = [
     "http://localhost:5173",
@@ -21,56 +37,186 @@ ALLOWED_ORIGINS = [
     "http://127.0.0.1:5173",
     "http://127.0.0.1:3000",
 ]
-from src.google_services.calendar_service import CalendarEvent, CalendarService
-from src.google_services.drive_service import DriveService
-from src.google_services.gmail_service import EmailMessage, GmailService
+from src.google_services.calendar_mirror import CalendarMirror
+
+# Google API 클라이언트(googleapiclient)를 쓰는 서비스 모듈은 import 비용이 커서
+# 첫 작업(ensure_services) 또는 서버 기동 후 백그라운드 워밍업에서 불러온다
+if TYPE_CHECKING:
+    from src.google_services.calendar_service import CalendarEvent, CalendarService
+    from src.google_services.drive_service import DriveService
+    from src.google_services.gmail_service import GmailService
+
+# 워밍업 때 미리 불러 둘 모듈
+WARM_UP_MODULES = (
+    "google.auth.transport.requests",
+    "google.oauth2.credentials",
+    "google_auth_oauthlib.flow",
+    "src.google_services.gmail_service",
+    "src.google_services.drive_service",
+    "src.google_services.calendar_service",
+)
+
+# 기본 스레드 풀에 스케줄러 슬롯 외에 남겨 둘 스레드 수 (드라이브 동기화, 캐시 갱신, 워밍업 등)
+EXECUTOR_HEADROOM = 4
 
 
 class TaskRequest(BaseModel):
     """포트 8000에서 받는 공통 요청 모델."""
 
     request_id: str = Field(default_factory=lambda: uuid4().hex)
-    type: Literal["email", "calendar", "drive"]
-    timezone: str = Field(default="Asia/Seoul", description="캘린더용 타임존")
+    type: Literal[
+        "email", "calendar", "drive", "drive_download", "search_contracts", "list_events",
+        "calendar_bulk", "deadline_bulk", "schedule_meeting",
+        "calendar_update_bulk", "calendar_delete_bulk",
+        "list_calendar_events", "list_drive_folder", "get_drive_file",
+    ]
+    timezone: str = Field(default=Config.DEFAULT_TIMEZONE, description="캘린더용 타임존")
+    priority: Optional[Literal["interactive", "normal", "batch"]] = Field(
+        default=None,
+        description="스케줄링 우선순위 (기본: 일괄 작업은 batch, 나머지는 interactive)",
+    )
+    tenant: str = Field(default=DEFAULT_TENANT, description="같은 우선순위 안에서 공평하게 나눌 단위 (사용자/조직)")
     payload: Dict[str, Any]
 
 
+# priority를 지정하지 않으면 batch 레인에서 처리하는 작업
+_BATCH_TASK_TYPES = {"calendar_bulk", "deadline_bulk", "calendar_update_bulk", "calendar_delete_bulk"}
+
+
+# 조회 결과를 캐시하고 응답에 ETag를 붙이는 작업
+_READ_TASK_TYPES = {"list_calendar_events", "list_drive_folder", "get_drive_file"}
+
+# 쓰기 작업 -> 끝난 뒤 비울 조회 캐시 네임스페이스
+_READ_INVALIDATIONS = {
+    "calendar": "calendar",
+    "calendar_bulk": "calendar",
+    "deadline_bulk": "calendar",
+    "calendar_update_bulk": "calendar",
+    "calendar_delete_bulk": "calendar",
+    "schedule_meeting": "calendar",
+    "drive": "drive",
+}
+
+
+def task_priority(task: TaskRequest) -> str:
+    """작업의 우선순위 레인."""
+    if task.priority:
+        return task.priority
+    return PRIORITY_BATCH if task.type in _BATCH_TASK_TYPES else PRIORITY_INTERACTIVE
+
+
 class GoogleTaskRouter:
     """Google 서비스 호출을 라우팅하는 헬퍼."""
 
     def __init__(self):
         self.auth_manager = GoogleAuthManager()
+        self.contract_index = ContractIndex(Config.CONTRACT_INDEX_DB)
+        self.download_cache = DiskLRUCache(
+            Config.DRIVE_DOWNLOAD_CACHE_DIR,
+            Config.DRIVE_DOWNLOAD_CACHE_MAX_BYTES
+        )
         self.credentials = None
-        self.gmail_service: Optional[GmailService] = None
-        self.drive_service: Optional[DriveService] = None
-        self.calendar_service: Optional[CalendarService] = None
-
-    def _ensure_services(self):
+        self.gmail_service: Optional["GmailService"] = None
+        self.drive_service: Optional["DriveService"] = None
+        self.calendar_service: Optional["CalendarService"] = None
+        self.calendar_mirror: Optional[CalendarMirror] = None
+        self.scheduler = FairScheduler(parse_lanes(Config.SCHEDULER_LANES), Config.SCHEDULER_MAX_CONCURRENCY)
+        self.read_cache = ReadCache(Config.READ_CACHE_MAX_ENTRIES, Config.READ_CACHE_TTL_SECONDS)
+        self._init_lock = asyncio.Lock()
+
+    async def ensure_services(self):
+        """첫 작업에서 서비스 초기화 (OAuth/discovery는 스레드에서, 동시 요청 시 한 번만)."""
         if self.credentials:
             return
-
-        self.credentials = self.auth_manager.get_credentials()
-        self.gmail_service = GmailService(self.credentials)
-        self.drive_service = DriveService(self.credentials)
-        self.calendar_service = CalendarService(self.credentials)
+        async with self._init_lock:
+            if not self.credentials:
+                await asyncio.to_thread(self._initialize_services)
+
+    @traced("router.initialize_services")
+    def _initialize_services(self):
+        from src.google_services.calendar_service import CalendarService
+        from src.google_services.drive_service import DriveService
+        from src.google_services.gmail_service import GmailService
+
+        credentials = self.auth_manager.get_credentials()
+        self.gmail_service = GmailService(credentials)
+        self.drive_service = DriveService(
+            credentials,
+            contract_index=self.contract_index,
+            download_cache=self.download_cache,
+            permission_cache_ttl=Config.DRIVE_PERMISSION_CACHE_TTL_SECONDS
+        )
+        self.calendar_service = CalendarService(credentials)
+        if Config.CALENDAR_MIRROR_ENABLED:
+            self.calendar_mirror = CalendarMirror(
+                self.calendar_service,
+                Config.CALENDAR_MIRROR_MAX_STALENESS_SECONDS,
+            )
+        # 서비스가 모두 준비된 뒤에 설정해야 다른 요청이 초기화 완료로 본다
+        self.credentials = credentials
 
     async def dispatch(self, task: TaskRequest) -> Dict[str, Any]:
-        """type에 따라 각 서비스로 분기."""
-        self._ensure_services()
+        """우선순위 레인에서 실행 슬롯을 받은 뒤 type에 따라 각 서비스로 분기."""
+        priority = task_priority(task)
+        with span("router.dispatch", **{
+            "task.type": task.type,
+            "task.request_id": task.request_id,
+            "task.priority": priority,
+            "task.tenant": task.tenant,
+        }):
+            async with self.scheduler.slot(priority, task.tenant):
+                try:
+                    return await self._dispatch(task)
+                finally:
+                    # 일괄 작업은 일부만 성공해도 바뀌므로 실패해도 비운다
+                    if task.type in _READ_INVALIDATIONS:
+                        self.invalidate_reads(_READ_INVALIDATIONS[task.type])
+
+    def invalidate_reads(self, namespace: str):
+        """쓰기 작업 후 해당 네임스페이스(calendar/drive)의 조회 캐시 비우기."""
+        self.read_cache.invalidate(f"{namespace}:")
+
+    async def _dispatch(self, task: TaskRequest) -> Dict[str, Any]:
+        # 로컬 인덱스 조회는 Google 인증이 필요 없다
+        if task.type == "search_contracts":
+            return await self._handle_search_contracts(task.payload)
+
+        await self.ensure_services()
 
         if task.type == "email":
             return await self._handle_email(task.payload)
         if task.type == "calendar":
-            return await self._handle_calendar(task.payload, task.timezone)
+            return await self._handle_calendar(task.payload, task.timezone, task.request_id)
         if task.type == "drive":
             return await self._handle_drive(task.payload)
+        if task.type == "drive_download":
+            return await self._handle_drive_download(task.payload)
+        if task.type == "calendar_bulk":
+            return await self._handle_calendar_bulk(task.payload, task.timezone, task.request_id)
+        if task.type == "deadline_bulk":
+            return await self._handle_deadline_bulk(task.payload)
+        if task.type == "calendar_update_bulk":
+            return await self._handle_calendar_update_bulk(task.payload, task.timezone)
+        if task.type == "calendar_delete_bulk":
+            return await self._handle_calendar_delete_bulk(task.payload)
+        if task.type == "schedule_meeting":
+            return await self._handle_schedule_meeting(task.payload, task.timezone)
+        if task.type == "list_calendar_events":
+            return await self._handle_list_calendar_events(task.payload, task.timezone)
+        if task.type == "list_drive_folder":
+            return await self._handle_list_drive_folder(task.payload)
+        if task.type == "get_drive_file":
+            return await self._handle_get_drive_file(task.payload)
 
         raise ValueError(f"Unsupported task type: {task.type}")
 
+    @traced("router.email")
     async def _handle_email(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         required = ["to", "subject", "body"]
         _validate_required(payload, required, "email")
 
+        from src.google_services.gmail_service import EmailMessage
+
         email = EmailMessage(
             to=payload["to"],
             subject=payload["subject"],
@@ -83,29 +229,66 @@ class GoogleTaskRouter:
 
         return await asyncio.to_thread(self.gmail_service.send_email, email)
 
-    async def _handle_calendar(self, payload: Dict[str, Any], timezone: str) -> Dict[str, Any]:
-        required = ["summary", "start_time", "end_time"]
-        _validate_required(payload, required, "calendar")
-
-        event = CalendarEvent(
-            summary=payload["summary"],
-            start_time=datetime.fromisoformat(payload["start_time"]),
-            end_time=datetime.fromisoformat(payload["end_time"]),
-            description=payload.get("description"),
-            location=payload.get("location"),
-            attendees=payload.get("attendees", []),
-            reminders=payload.get("reminders"),
-            timezone=timezone,
-            all_day=payload.get("all_day", False),
-        )
+    @traced("router.calendar")
+    async def _handle_calendar(self, payload: Dict[str, Any], timezone: str, request_id: str) -> Dict[str, Any]:
+        event = _build_event(payload, timezone, _idempotency_key(payload, request_id))
+
+        result = await asyncio.to_thread(self.calendar_service.create_event, event)
+        if self.calendar_mirror is not None:
+            self.calendar_mirror.mark_stale()
+        return result
+
+    @traced("router.calendar_bulk")
+    async def _handle_calendar_bulk(self, payload: Dict[str, Any], timezone: str, request_id: str) -> Dict[str, Any]:
+        _validate_required(payload, ["events"], "calendar_bulk")
+        idempotent = payload.get("idempotent", False)
+        events = [
+            _build_event(
+                item,
+                timezone,
+                item.get("idempotency_key") or (f"{request_id}:{index}" if idempotent else None),
+            )
+            for index, item in enumerate(payload["events"])
+        ]
 
-        return await asyncio.to_thread(self.calendar_service.create_event, event)
+        results = await asyncio.to_thread(
+            self.calendar_service.create_events,
+            events,
+            calendar_id=payload.get("calendar_id", "primary"),
+        )
+        if self.calendar_mirror is not None:
+            self.calendar_mirror.mark_stale(payload.get("calendar_id", "primary"))
+        return _bulk_summary(results)
+
+    @traced("router.deadline_bulk")
+    async def _handle_deadline_bulk(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        _validate_required(payload, ["deadlines"], "deadline_bulk")
+        deadlines = []
+        for item in payload["deadlines"]:
+            _validate_required(item, ["contract_name", "deadline_date"], "deadline_bulk")
+            deadlines.append({
+                "contract_name": item["contract_name"],
+                "deadline_date": datetime.fromisoformat(item["deadline_date"]),
+                "description": item.get("description"),
+                "reminder_days": item.get("reminder_days"),
+            })
+
+        results = await asyncio.to_thread(
+            self.calendar_service.create_contract_deadlines,
+            deadlines,
+            calendar_id=payload.get("calendar_id", "primary"),
+            idempotent=payload.get("idempotent", False),
+        )
+        if self.calendar_mirror is not None:
+            self.calendar_mirror.mark_stale(payload.get("calendar_id", "primary"))
+        return _bulk_summary(results)
 
+    @traced("router.drive")
     async def _handle_drive(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         required = ["contract_name"]
         _validate_required(payload, required, "drive")
 
-        temp_file_path = None
+        spool = None
         try:
             # 파일 경로 또는 base64 컨텐츠 둘 중 하나를 지원
             file_path = payload.get("file_path")
@@ -113,13 +296,10 @@ class GoogleTaskRouter:
             file_name = payload.get("file_name") or payload["contract_name"]
 
             if file_content_b64:
-                suffix = Path(file_name).suffix or ".bin"
-                fd, temp_file_path = tempfile.mkstemp(suffix=suffix, prefix="mcp_drive_")
-                with os.fdopen(fd, "wb") as temp_file:
-                    temp_file.write(base64.b64decode(file_content_b64))
-                file_path = temp_file_path
+                # 작은 파일은 메모리에서 바로 업로드, 큰 파일만 디스크로 넘긴다
+                spool = _spool_b64_content(file_content_b64)
 
-            if not file_path:
+            if not file_path and spool is None:
                 raise web.HTTPBadRequest(
                     text="drive payload missing fields: file_path or file_content_b64",
                     content_type="application/json",
@@ -129,21 +309,350 @@ class GoogleTaskRouter:
             if payload.get("contract_date"):
                 metadata["contract_date"] = payload["contract_date"]
             if payload.get("parties"):
-                metadata["parties"] = ",".join(payload["parties"])
+                metadata["parties"] = list(payload["parties"])
+
+            if spool is not None:
+                from src.google_services.drive_service import guess_mime_type
+
+                source = {
+                    "contract_file_path": None,
+                    "contract_content": spool,
+                    "mime_type": guess_mime_type(file_name),
+                }
+            else:
+                source = {"contract_file_path": file_path}
 
             return await asyncio.to_thread(
                 self.drive_service.upload_contract,
-                contract_file_path=file_path,
                 contract_name=payload["contract_name"],
                 contract_metadata=metadata,
                 folder_name=payload.get("folder_name", "Contracts"),
+                **source,
             )
         finally:
-            if temp_file_path and os.path.exists(temp_file_path):
-                try:
-                    os.remove(temp_file_path)
-                except OSError:
-                    pass
+            if spool is not None:
+                spool.close()
+
+    @traced("router.drive_download")
+    async def _handle_drive_download(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        _validate_required(payload, ["file_id"], "drive_download")
+        if payload.get("destination_path"):
+            try:
+                resolve_download_path(payload["destination_path"])
+            except ValueError as exc:
+                raise web.HTTPBadRequest(text=str(exc), content_type="application/json")
+        return await self.download_drive_file(payload["file_id"], payload.get("destination_path"))
+
+    async def download_drive_file(self, file_id: str, destination_path: Optional[str] = None) -> Dict[str, Any]:
+        """Drive 파일 다운로드 (디스크 LRU 캐시 경유, HTTP 작업과 MCP 도구가 함께 사용).
+
+        destination_path가 있으면 DRIVE_DOWNLOAD_DIR 아래 그 경로에 저장하고(밖을 가리키면 ValueError),
+        없으면 내용을 file_content_b64로 담아 반환한다.
+        """
+        if destination_path:
+            destination = resolve_download_path(destination_path)
+            return await asyncio.to_thread(_download_to_path, self.drive_service, file_id, destination)
+        return await asyncio.to_thread(_download_b64, self.drive_service, file_id)
+
+    @traced("router.calendar_update_bulk")
+    async def _handle_calendar_update_bulk(self, payload: Dict[str, Any], timezone: str) -> Dict[str, Any]:
+        _validate_required(payload, ["updates"], "calendar_update_bulk")
+        updates = []
+        for item in payload["updates"]:
+            _validate_required(item, ["event_id"], "calendar_update_bulk")
+            updates.append(_parse_event_changes(item))
+
+        calendar_id = payload.get("calendar_id", "primary")
+        results = await asyncio.to_thread(
+            self.calendar_service.patch_events,
+            updates,
+            calendar_id=calendar_id,
+            timezone=timezone,
+        )
+        if self.calendar_mirror is not None:
+            self.calendar_mirror.mark_stale(calendar_id)
+        return _bulk_summary(results)
+
+    @traced("router.calendar_delete_bulk")
+    async def _handle_calendar_delete_bulk(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        _validate_required(payload, ["event_ids"], "calendar_delete_bulk")
+
+        calendar_id = payload.get("calendar_id", "primary")
+        results = await asyncio.to_thread(
+            self.calendar_service.delete_events,
+            payload["event_ids"],
+            calendar_id=calendar_id,
+        )
+        if self.calendar_mirror is not None:
+            self.calendar_mirror.mark_stale(calendar_id)
+        return _bulk_summary(results)
+
+    @traced("router.schedule_meeting")
+    async def _handle_schedule_meeting(self, payload: Dict[str, Any], timezone: str) -> Dict[str, Any]:
+        required = ["title", "duration_minutes", "attendees", "window_start", "window_end"]
+        _validate_required(payload, required, "schedule_meeting")
+
+        tz = ZoneInfo(timezone)
+        try:
+            result = await asyncio.to_thread(
+                self.calendar_service.schedule_meeting,
+                title=payload["title"],
+                duration_minutes=int(payload["duration_minutes"]),
+                attendees=payload["attendees"],
+                window_start=parse_datetime(payload["window_start"], tz),
+                window_end=parse_datetime(payload["window_end"], tz),
+                preferred_start=parse_datetime(payload.get("preferred_start"), tz),
+                on_conflict=payload.get("on_conflict", "earliest"),
+                slot_step_minutes=int(payload.get("slot_step_minutes", 15)),
+                description=payload.get("description"),
+                location=payload.get("location"),
+            )
+        except ValueError as exc:
+            raise web.HTTPBadRequest(text=str(exc), content_type="application/json")
+
+        if self.calendar_mirror is not None and result.get("success"):
+            self.calendar_mirror.mark_stale()
+        return result
+
+    async def stream_events(self, payload: Dict[str, Any], timezone: str) -> AsyncIterator[Dict[str, Any]]:
+        """일정을 페이지 단위로 가져오며 하나씩 내보낸다 (페이지 조회는 스레드에서)."""
+        await self.ensure_services()
+
+        tz = ZoneInfo(timezone)
+        query = dict(
+            calendar_id=payload.get("calendar_id", "primary"),
+            time_min=parse_datetime(payload.get("time_min"), tz),
+            time_max=parse_datetime(payload.get("time_max"), tz),
+            max_results=payload.get("max_results"),
+        )
+
+        # 미러가 있으면 로컬에서 응답 (fresh=true면 Google에서 직접 조회)
+        if self.calendar_mirror is not None and not payload.get("fresh", False):
+            result = await asyncio.to_thread(
+                self.calendar_mirror.query,
+                max_staleness_seconds=payload.get("max_staleness_seconds"),
+                **query,
+            )
+            if not result["success"]:
+                raise RuntimeError(result["error"])
+            for event in result["events"]:
+                yield event
+            return
+
+        pages = self.calendar_service.iter_event_pages(
+            page_size=int(payload.get("page_size", 250)),
+            **query,
+        )
+
+        while True:
+            page = await asyncio.to_thread(next, pages, None)
+            if page is None:
+                return
+            for event in page:
+                yield event
+
+    @traced("router.list_calendar_events")
+    async def _handle_list_calendar_events(self, payload: Dict[str, Any], timezone: str) -> Dict[str, Any]:
+        tz = ZoneInfo(timezone)
+        calendar_id = payload.get("calendar_id", "primary")
+        time_min = parse_datetime(payload.get("time_min"), tz)
+        if time_min is None:
+            # "지금부터" 조회는 분 단위로 고정한 시각을 키에 넣는다 (304를 받아도 처음 조회한
+            # 창의 본문을 계속 돌려주지 않도록, 같은 분 안의 반복 조회는 캐시를 공유)
+            time_min = datetime.now(tz).replace(second=0, microsecond=0)
+        time_max = parse_datetime(payload.get("time_max"), tz)
+        max_results = int(payload.get("max_results", 250))
+        page_token = payload.get("page_token")
+
+        # 조회 작업은 미러와 상관없이 조회 캐시 + ETag 조건부 요청으로 처리한다
+        # (미러는 list_events 스트리밍과 MCP 조회가 쓴다)
+        return await self.read_cache.get_or_fetch(
+            _read_cache_key("calendar", {**payload, "time_min": time_min.isoformat()}, timezone),
+            lambda etag: self.calendar_service.list_events_page(
+                calendar_id=calendar_id,
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+                page_token=page_token,
+                etag=etag,
+            ),
+            fresh=payload.get("fresh", False),
+        )
+
+    @traced("router.list_drive_folder")
+    async def _handle_list_drive_folder(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        _validate_required(payload, ["folder_id"], "list_drive_folder")
+        return await self.read_cache.get_or_fetch(
+            _read_cache_key("drive", payload),
+            lambda etag: self.drive_service.list_folder(
+                payload["folder_id"],
+                page_size=int(payload.get("page_size", 100)),
+                page_token=payload.get("page_token"),
+                etag=etag,
+            ),
+            fresh=payload.get("fresh", False),
+        )
+
+    @traced("router.get_drive_file")
+    async def _handle_get_drive_file(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        _validate_required(payload, ["file_id"], "get_drive_file")
+        return await self.read_cache.get_or_fetch(
+            _read_cache_key("drive", {"file_id": payload["file_id"]}),
+            lambda etag: self.drive_service.get_file_metadata(payload["file_id"], etag=etag),
+            fresh=payload.get("fresh", False),
+        )
+
+    @traced("router.search_contracts")
+    async def _handle_search_contracts(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await asyncio.to_thread(
+            self.contract_index.search,
+            party=payload.get("party"),
+            date_from=payload.get("date_from"),
+            date_to=payload.get("date_to"),
+            name=payload.get("name"),
+            folder_name=payload.get("folder_name"),
+            limit=int(payload.get("limit", 50)),
+        )
+
+
+# base64 디코딩 단위 (4의 배수여야 패딩 경계가 맞는다)
+_B64_DECODE_CHUNK = 4 * 64 * 1024
+
+
+def _spool_b64_content(content_b64: str) -> tempfile.SpooledTemporaryFile:
+    """base64 컨텐츠를 청크 단위로 디코딩해 스풀 버퍼에 기록."""
+    spool = tempfile.SpooledTemporaryFile(
+        max_size=Config.DRIVE_UPLOAD_SPOOL_MAX_BYTES,
+        prefix="mcp_drive_",
+    )
+    try:
+        content_b64 = "".join(content_b64.split())
+        for start in range(0, len(content_b64), _B64_DECODE_CHUNK):
+            spool.write(base64.b64decode(content_b64[start:start + _B64_DECODE_CHUNK]))
+    except Exception:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+def resolve_download_path(destination_path: str) -> str:
+    """destination_path(상대 경로는 DRIVE_DOWNLOAD_DIR 기준)를 다운로드 디렉토리 안의 절대 경로로 변환.
+
+    원격 호출자가 서버 파일(소스, 토큰 등)을 덮어쓰지 못하도록 심볼릭 링크를 풀어 본 실제 경로가
+    다운로드 디렉토리 밖이면 ValueError.
+    """
+    root = os.path.realpath(Config.DRIVE_DOWNLOAD_DIR)
+    destination = os.path.realpath(os.path.join(root, destination_path))
+    if destination == root or os.path.commonpath([root, destination]) != root:
+        raise ValueError(f"destination_path must be a file inside the download directory: {destination_path}")
+    return destination
+
+
+def _download_to_path(drive_service: "DriveService", file_id: str, destination: str) -> Dict[str, Any]:
+    """임시 파일(.part)에 받은 뒤 성공하면 destination(resolve_download_path 결과)으로 교체 (실패 시 기존 파일 유지)."""
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    partial = destination + ".part"
+    try:
+        with open(partial, "wb") as sink:
+            result = drive_service.download_file(file_id, sink)
+        if result.get("success"):
+            os.replace(partial, destination)
+            result["saved_path"] = destination
+        return result
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+
+
+def _download_b64(drive_service: "DriveService", file_id: str) -> Dict[str, Any]:
+    """스풀 버퍼에 받은 뒤 청크 단위로 base64 인코딩 (큰 파일은 스풀이 디스크로 넘긴다)."""
+    with tempfile.SpooledTemporaryFile(
+        max_size=Config.DRIVE_UPLOAD_SPOOL_MAX_BYTES,
+        prefix="mcp_drive_",
+    ) as spool:
+        result = drive_service.download_file(file_id, spool)
+        if not result.get("success"):
+            return result
+        spool.seek(0)
+        chunks = []
+        # 3의 배수 단위로 읽어야 청크 사이에 패딩이 끼지 않는다
+        while chunk := spool.read(3 * 64 * 1024):
+            chunks.append(base64.b64encode(chunk).decode("ascii"))
+        result["file_content_b64"] = "".join(chunks)
+        return result
+
+
+def _read_cache_key(namespace: str, payload: Dict[str, Any], timezone: Optional[str] = None) -> str:
+    """조회 캐시 키 (네임스페이스 접두어 + 정규화한 payload, fresh는 같은 항목을 갱신하므로 제외)."""
+    canonical = json.dumps(
+        {"payload": {name: value for name, value in payload.items() if name != "fresh"}, "timezone": timezone},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return f"{namespace}:{canonical}"
+
+
+def _idempotency_key(payload: Dict[str, Any], request_id: Optional[str]) -> Optional[str]:
+    """idempotency_key가 있으면 그 값, idempotent=true면 request_id를 키로 사용."""
+    if payload.get("idempotency_key"):
+        return payload["idempotency_key"]
+    if payload.get("idempotent") and request_id:
+        return request_id
+    return None
+
+
+def _build_event(payload: Dict[str, Any], timezone: str, idempotency_key: Optional[str] = None) -> "CalendarEvent":
+    from src.google_services.calendar_service import CalendarEvent, event_id_for
+
+    required = ["summary", "start_time", "end_time"]
+    _validate_required(payload, required, "calendar")
+
+    return CalendarEvent(
+        summary=payload["summary"],
+        start_time=datetime.fromisoformat(payload["start_time"]),
+        end_time=datetime.fromisoformat(payload["end_time"]),
+        description=payload.get("description"),
+        location=payload.get("location"),
+        attendees=payload.get("attendees", []),
+        reminders=payload.get("reminders"),
+        timezone=timezone,
+        all_day=payload.get("all_day", False),
+        event_id=event_id_for(idempotency_key) if idempotency_key else None,
+    )
+
+
+def _parse_event_changes(item: Dict[str, Any]) -> Dict[str, Any]:
+    """일정 변경 payload의 시간 문자열을 datetime으로 변환."""
+    changes = dict(item)
+    for field in ("start_time", "end_time"):
+        if field in changes:
+            changes[field] = datetime.fromisoformat(changes[field])
+    return changes
+
+
+def _bulk_summary(results: list) -> Dict[str, Any]:
+    """항목별 결과 리스트를 요약과 함께 반환."""
+    succeeded = sum(1 for result in results if result.get("success"))
+    return {
+        "success": succeeded == len(results),
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results,
+    }
+
+
+def parse_datetime(value: Optional[str], tz: ZoneInfo) -> Optional[datetime]:
+    """ISO 8601 문자열 파싱 (타임존이 없으면 요청 타임존 적용)."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=tz)
+    return parsed
 
 
 def _validate_required(payload: Dict[str, Any], fields: list[str], section: str):
@@ -167,42 +676,74 @@ async def cors_middleware(request: web.Request, handler):
                 headers={
                     "Access-Control-Allow-Origin": origin,
                     "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
-                    "Access-Control-Allow-Headers": "Content-Type, Authorization",
+                    "Access-Control-Allow-Headers": "Content-Type, Authorization, If-None-Match",
                     "Access-Control-Max-Age": "3600",
                 },
             )
         return web.Response(status=403)
 
-    # 실제 요청 처리
+    # 실제 요청 처리 (스트리밍 응답은 prepare 전에 헤더를 직접 붙인다)
     response = await handler(request)
+    if not response.prepared:
+        _apply_cors_headers(request, response)
+
+    return response
+
+
+def _apply_cors_headers(request: web.Request, response: web.StreamResponse):
     origin = request.headers.get("Origin", "")
     if origin in ALLOWED_ORIGINS:
         response.headers["Access-Control-Allow-Origin"] = origin
         response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS"
-        response.headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization"
-
-    return response
+        response.headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization, If-None-Match"
+        response.headers["Access-Control-Expose-Headers"] = "ETag"
 
 
 async def handle_task(request: web.Request) -> web.Response:
     """POST /tasks 엔드포인트."""
+    with span(
+        "POST /tasks",
+        kind=SPAN_KIND_SERVER,
+        traceparent=request.headers.get("traceparent"),
+    ) as root:
+        response = await _handle_task(request, root)
+        if root.traceparent and not response.prepared:
+            response.headers["traceparent"] = root.traceparent
+        return response
+
+
+async def _handle_task(request: web.Request, root) -> web.StreamResponse:
     try:
-        body = await request.json()
+        with span("parse_json"):
+            body = await request.json()
     except Exception:
         raise web.HTTPBadRequest(text='Invalid JSON body', content_type="application/json")
 
     try:
-        task = TaskRequest(**body)
+        with span("validate_task"):
+            task = TaskRequest(**body)
     except ValidationError as exc:
         return web.json_response(
             {"success": False, "error": "validation_error", "details": exc.errors()},
             status=400,
         )
 
+    root.set_attribute("task.type", task.type)
+    root.set_attribute("task.request_id", task.request_id)
+
     router: GoogleTaskRouter = request.app["router"]
 
+    if task.type == "list_events":
+        return await _stream_events(request, router, task)
+
+    queue: Optional[TaskQueue] = request.app.get("task_queue")
+    if queue is not None and task.type not in _INLINE_TASK_TYPES:
+        return await _enqueue_task(queue, task, root.traceparent)
+
     try:
         result = await router.dispatch(task)
+        if task.type in _READ_TASK_TYPES:
+            return _conditional_response(request, task, result)
         return web.json_response(
             {
                 "success": True,
@@ -225,12 +766,214 @@ async def handle_task(request: web.Request) -> web.Response:
         )
 
 
+# 큐를 켜도 바로 처리하는 작업 (Google 쓰기가 없는 조회)
+_INLINE_TASK_TYPES = {"search_contracts", "list_events"} | _READ_TASK_TYPES
+
+
+def _conditional_response(request: web.Request, task: TaskRequest, result: Dict[str, Any]) -> web.Response:
+    """조회 결과에 ETag를 붙여 응답 (If-None-Match가 같으면 본문 없이 304)."""
+    body = json.dumps(result, sort_keys=True, ensure_ascii=False, default=str)
+    etag = '"' + hashlib.sha256(body.encode("utf-8")).hexdigest()[:32] + '"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if _etag_matches(request.headers.get("If-None-Match"), etag):
+        return web.Response(status=304, headers=headers)
+
+    return web.json_response(
+        {
+            "success": True,
+            "request_id": task.request_id,
+            "type": task.type,
+            "result": result,
+        },
+        headers=headers,
+    )
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더에 etag가 있는지 (약한 비교, W/ 접두어 무시)."""
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def _enqueue_task(queue: TaskQueue, task: TaskRequest, traceparent: Optional[str]) -> web.Response:
+    """작업을 영속 큐에 넣고 202 응답 (같은 request_id로 다시 보내면 기존 작업 상태를 돌려준다)."""
+    with span("task_queue.enqueue"):
+        state = await asyncio.to_thread(
+            queue.enqueue,
+            task.request_id,
+            task.type,
+            task.model_dump(mode="json"),
+            traceparent,
+            task_priority(task),
+            task.tenant,
+        )
+    status_url = f"/tasks/{task.request_id}"
+    return web.json_response(
+        {
+            "success": True,
+            "request_id": task.request_id,
+            "type": task.type,
+            "status": state["status"],
+            "status_url": status_url,
+        },
+        status=202,
+        headers={"Location": status_url},
+    )
+
+
+async def handle_task_status(request: web.Request) -> web.Response:
+    """GET /tasks/{request_id}: 큐에 넣은 작업의 상태와 결과."""
+    queue: TaskQueue = request.app["task_queue"]
+    request_id = request.match_info["request_id"]
+    state = await asyncio.to_thread(queue.get, request_id)
+    if state is None:
+        return web.json_response(
+            {"success": False, "request_id": request_id, "error": "Task not found"},
+            status=404,
+        )
+    return web.json_response({"success": state["status"] != "failed", **state})
+
+
+async def _drive_sync_loop(app: web.Application):
+    """라우터의 Drive 서비스가 준비되면 변경 피드 동기화를 시작."""
+    router: GoogleTaskRouter = app["router"]
+    stop_event: asyncio.Event = app["drive_sync_stop"]
+    interval = Config.DRIVE_SYNC_INTERVAL_SECONDS
+
+    # 인증(OAuth)은 첫 작업 요청에서 이루어지므로 그때까지 대기
+    while router.drive_service is None:
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+            return
+        except asyncio.TimeoutError:
+            pass
+
+    sync = DriveChangeSync(router.drive_service, router.contract_index)
+    await sync.run(interval, stop_event)
+
+
+def warm_up_imports():
+    """무거운 Google 클라이언트 모듈을 미리 import (이미 불러온 모듈은 건너뛴다)."""
+    for name in WARM_UP_MODULES:
+        importlib.import_module(name)
+
+
+async def warm_up():
+    """백그라운드 스레드에서 워밍업 (이벤트 루프를 막지 않고 첫 작업의 import 지연을 없앤다)."""
+    try:
+        await asyncio.to_thread(warm_up_imports)
+    except Exception as exc:
+        # 실패해도 첫 작업에서 다시 import하며 오류를 보고한다
+        logger.warning("Warm-up failed: %s", exc)
+
+
+def install_default_executor():
+    """asyncio.to_thread 기본 스레드 풀을 스케줄러 동시 실행 수보다 크게 설정.
+
+    기본 풀 크기(min(32, CPU 수 + 4))가 SCHEDULER_MAX_CONCURRENCY보다 작으면 슬롯을 받은 작업도
+    스레드를 기다리게 되므로, 슬롯 수에 백그라운드 작업(동기화, 캐시 갱신, 워밍업) 여유분을 더한다.
+    """
+    workers = max(min(32, (os.cpu_count() or 1) + 4), Config.SCHEDULER_MAX_CONCURRENCY + EXECUTOR_HEADROOM)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asyncio")
+    )
+
+
+async def _start_background_tasks(app: web.Application):
+    install_default_executor()
+    if Config.STARTUP_WARM_UP:
+        app["warm_up_task"] = asyncio.create_task(warm_up())
+    if "task_queue" in app and Config.TASK_QUEUE_LOCAL_WORKERS > 0:
+        from src.task_worker import create_worker
+
+        worker = create_worker(app["router"], app["task_queue"], Config.TASK_QUEUE_LOCAL_WORKERS)
+        app["task_worker_stop"] = asyncio.Event()
+        app["task_worker_task"] = asyncio.create_task(worker.run(app["task_worker_stop"]))
+    if Config.DRIVE_SYNC_INTERVAL_SECONDS <= 0:
+        return
+    app["drive_sync_stop"] = asyncio.Event()
+    app["drive_sync_task"] = asyncio.create_task(_drive_sync_loop(app))
+
+
+async def _stop_background_tasks(app: web.Application):
+    warm_up_task = app.get("warm_up_task")
+    if warm_up_task is not None:
+        await warm_up_task
+    worker_task = app.get("task_worker_task")
+    if worker_task is not None:
+        # 진행 중인 작업은 끝까지 처리 (중단되면 리스 만료 후 다른 워커가 다시 처리)
+        app["task_worker_stop"].set()
+        await worker_task
+    task = app.get("drive_sync_task")
+    if task is None:
+        return
+    app["drive_sync_stop"].set()
+    await task
+
+
+async def _stream_events(request: web.Request, router: GoogleTaskRouter, task: TaskRequest) -> web.StreamResponse:
+    """list_events 작업을 NDJSON(한 줄에 일정 하나)으로 스트리밍."""
+    response = web.StreamResponse(
+        headers={"Content-Type": "application/x-ndjson", "X-Request-Id": task.request_id}
+    )
+    events = router.stream_events(task.payload, task.timezone)
+
+    try:
+        first = await events.__anext__()
+    except StopAsyncIteration:
+        first = None
+    except Exception as exc:
+        return web.json_response(
+            {
+                "success": False,
+                "request_id": task.request_id,
+                "type": task.type,
+                "error": str(exc),
+            },
+            status=500,
+        )
+
+    _apply_cors_headers(request, response)
+    traceparent = current_traceparent()
+    if traceparent:
+        response.headers["traceparent"] = traceparent
+    await response.prepare(request)
+    try:
+        if first is not None:
+            await response.write(_ndjson_line(first))
+            async for event in events:
+                await response.write(_ndjson_line(event))
+    except Exception as exc:
+        # 헤더를 이미 보냈으므로 오류는 마지막 줄로 알린다
+        await response.write(_ndjson_line({"success": False, "error": str(exc)}))
+    await response.write_eof()
+    return response
+
+
+def _ndjson_line(item: Dict[str, Any]) -> bytes:
+    return (json.dumps(item, ensure_ascii=False) + "\n").encode("utf-8")
+
+
 def create_app() -> web.Application:
     """AIOHTTP 애플리케이션 생성."""
     app = web.Application(middlewares=[cors_middleware])
     app["router"] = GoogleTaskRouter()
     app.router.add_post("/tasks", handle_task)
+    if Config.TASK_QUEUE_ENABLED:
+        app["task_queue"] = TaskQueue(Config.TASK_QUEUE_DB, Config.TASK_QUEUE_MAX_ATTEMPTS)
+        app.router.add_get("/tasks/{request_id}", handle_task_status)
     app.router.add_get("/health", lambda _: web.json_response({"status": "ok"}))
+    if Config.MCP_HTTP_ENABLED:
+        # MCP 클라이언트도 같은 라우터(인증/서비스/캐시)를 사용
+        from src.mcp_http import add_mcp_routes
+        from src.mcp_server import GoogleServicesMCPServer
+
+        add_mcp_routes(app, GoogleServicesMCPServer(app["router"]))
+    app.on_startup.append(_start_background_tasks)
+    app.on_cleanup.append(_stop_background_tasks)
     return app
 
 
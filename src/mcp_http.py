@@ -0,0 +1,134 @@
+"""
+MCP HTTP/SSE 전송 계층 (aiohttp)
+HTTP 게이트웨이와 같은 프로세스에서 MCP 서버를 제공해 여러 에이전트가 준비된 서비스를 공유
+"""
+import asyncio
+import json
+from typing import Dict
+from uuid import uuid4
+
+import anyio
+from aiohttp import web
+from anyio.streams.memory import MemoryObjectSendStream
+from mcp.shared.message import SessionMessage
+from mcp.types import JSONRPCMessage
+from pydantic import ValidationError
+
+from src.http_server import _apply_cors_headers
+
+
+# 이 시간 동안 보낼 메시지가 없으면 주석 줄을 보내 연결을 유지하고 끊긴 클라이언트를 감지
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
+class MCPSseTransport:
+    """MCP SSE 전송 (GET으로 이벤트 스트림을 열고, 메시지는 POST로 받는다)
+
+    연결마다 MCP 세션 하나를 실행하며 세션들은 같은 MCP 서버 객체를 공유한다.
+    """
+
+    def __init__(self, mcp_server, messages_path: str):
+        """
+        전송 계층 초기화
+
+        Args:
+            mcp_server: GoogleServicesMCPServer 객체
+            messages_path: 클라이언트가 메시지를 POST할 경로
+        """
+        self.mcp_server = mcp_server
+        self.messages_path = messages_path
+        self._read_stream_writers: Dict[str, MemoryObjectSendStream] = {}
+
+    async def handle_sse(self, request: web.Request) -> web.StreamResponse:
+        """GET /mcp/sse: 세션 생성 후 서버 메시지를 SSE로 전달"""
+        session_id = uuid4().hex
+        read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
+        write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+        self._read_stream_writers[session_id] = read_stream_writer
+
+        server = self.mcp_server.server
+        session_task = asyncio.create_task(server.run(
+            read_stream,
+            write_stream,
+            server.create_initialization_options()
+        ))
+
+        response = web.StreamResponse(headers={
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        })
+        _apply_cors_headers(request, response)
+        await response.prepare(request)
+
+        try:
+            await response.write(_sse_event(
+                "endpoint",
+                f"{self.messages_path}?session_id={session_id}"
+            ))
+            async with write_stream_reader:
+                while True:
+                    session_message = None
+                    with anyio.move_on_after(SSE_KEEPALIVE_SECONDS):
+                        session_message = await write_stream_reader.receive()
+                    if session_message is None:
+                        await response.write(b": ping\n\n")
+                        continue
+                    message = session_message.message
+                    await response.write(_sse_event(
+                        "message",
+                        message.model_dump_json(by_alias=True, exclude_none=True)
+                    ))
+        except (ConnectionResetError, anyio.EndOfStream):
+            # 클라이언트 연결 종료 또는 세션 종료
+            pass
+        finally:
+            self._read_stream_writers.pop(session_id, None)
+            await read_stream_writer.aclose()
+            session_task.cancel()
+            await asyncio.gather(session_task, return_exceptions=True)
+
+        return response
+
+    async def handle_message(self, request: web.Request) -> web.Response:
+        """POST /mcp/messages?session_id=...: 클라이언트 메시지를 세션에 전달"""
+        session_id = request.query.get("session_id", "")
+        writer = self._read_stream_writers.get(session_id)
+        if writer is None:
+            return web.json_response({"error": "Unknown session_id"}, status=404)
+
+        body = await request.read()
+        try:
+            message = JSONRPCMessage.model_validate_json(body)
+        except ValidationError as exc:
+            return web.json_response(
+                {"error": "Invalid JSON-RPC message", "details": json.loads(exc.json(include_url=False))},
+                status=400
+            )
+
+        try:
+            await writer.send(SessionMessage(message))
+        except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+            return web.json_response({"error": "Session closed"}, status=410)
+
+        return web.Response(status=202, text="Accepted")
+
+
+def _sse_event(event: str, data: str) -> bytes:
+    """SSE 이벤트 한 건 (data는 한 줄 JSON이라 줄바꿈 분할이 필요 없다)"""
+    return f"event: {event}\ndata: {data}\n\n".encode("utf-8")
+
+
+def add_mcp_routes(app: web.Application, mcp_server, prefix: str = "/mcp"):
+    """
+    aiohttp 앱에 MCP SSE 엔드포인트 등록
+
+    Args:
+        app: aiohttp 애플리케이션
+        mcp_server: GoogleServicesMCPServer 객체
+        prefix: 엔드포인트 경로 접두사
+    """
+    transport = MCPSseTransport(mcp_server, f"{prefix}/messages")
+    app["mcp_transport"] = transport
+    app.router.add_get(f"{prefix}/sse", transport.handle_sse)
+    app.router.add_post(f"{prefix}/messages", transport.handle_message)
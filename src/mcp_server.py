@@ -5,268 +5,487 @@ Gmail, Drive, Calendar 통합 서버
 import asyncio
 import json
 from datetime import datetime
-from typing import Any, Dict, List
+from zoneinfo import ZoneInfo
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple, Type
 from mcp.server import Server
 from mcp.types import Tool, TextContent
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
-from src.auth import GoogleAuthManager
-from src.google_services.gmail_service import GmailService, EmailMessage
-from src.google_services.drive_service import DriveService, DriveFile
-from src.google_services.calendar_service import CalendarService, CalendarEvent
+from src.config import Config
+from src.http_server import GoogleTaskRouter, install_default_executor, parse_datetime, warm_up
+from src.scheduler import PRIORITY_BATCH, PRIORITY_INTERACTIVE
+from src.tracing import SPAN_KIND_SERVER, span
 
+# 서비스 모듈(googleapiclient)은 도구 호출 시점에 불러온다 (list_tools는 가볍게 응답)
+if TYPE_CHECKING:
+    from src.google_services.gmail_service import EmailMessage
+    from src.google_services.calendar_service import CalendarEvent
 
-# Pydantic 모델 정의
+
+# 스케줄러에서 MCP 도구 호출을 묶는 테넌트
+MCP_TENANT = "mcp"
+
+# 쓰기 도구 -> 끝난 뒤 비울 라우터 조회 캐시 네임스페이스 (HTTP 조회 작업과 캐시를 공유)
+_READ_INVALIDATIONS = {
+    "upload_contract": "drive",
+    "upload_contracts_bulk": "drive",
+    "create_calendar_event": "calendar",
+    "create_calendar_events_bulk": "calendar",
+    "create_contract_deadline": "calendar",
+    "schedule_meeting": "calendar",
+    "create_contract_deadlines_bulk": "calendar",
+    "update_calendar_events_bulk": "calendar",
+    "delete_calendar_events_bulk": "calendar",
+}
+
+
+class ToolError(Exception):
+    """도구 호출 실패
+
+    call_tool 핸들러에서 올리면 SDK가 메시지를 본문으로 하는 isError=True 결과로 바꿔 보낸다
+    (클라이언트는 isError로 실패를 구분해 결과를 캐시하지 않는다).
+    """
+
+
+# Pydantic 모델 정의 (도구 입력 스키마와 인자 검증에 함께 사용)
 class SendEmailRequest(BaseModel):
     """이메일 발송 요청"""
-    to: str = Field(description="받는 사람 이메일")
+    to: str = Field(description="받는 사람 이메일 주소")
     subject: str = Field(description="이메일 제목")
     body: str = Field(description="이메일 본문")
-    cc: List[str] = Field(default=[], description="참조 이메일 리스트")
-    bcc: List[str] = Field(default=[], description="숨은 참조 이메일 리스트")
+    cc: List[str] = Field(default=[], description="참조(CC) 이메일 리스트")
+    bcc: List[str] = Field(default=[], description="숨은참조(BCC) 이메일 리스트")
     html: bool = Field(default=False, description="HTML 형식 사용 여부")
 
 
 class UploadContractRequest(BaseModel):
     """계약서 업로드 요청"""
-    file_path: str = Field(description="계약서 파일 경로")
+    file_path: str = Field(description="업로드할 계약서 파일 경로")
     contract_name: str = Field(description="계약서 이름")
-    contract_date: str = Field(default=None, description="계약 날짜 (YYYY-MM-DD)")
-    parties: List[str] = Field(default=[], description="계약 당사자")
-    folder_name: str = Field(default="Contracts", description="저장할 폴더명")
+    contract_date: Optional[str] = Field(default=None, description="계약 날짜 (YYYY-MM-DD 형식)")
+    parties: List[str] = Field(default=[], description="계약 당사자 목록")
+    folder_name: str = Field(default="Contracts", description="저장할 폴더명 (기본: Contracts)")
+
+
+class DownloadContractRequest(BaseModel):
+    """계약서 다운로드 요청"""
+    file_id: str = Field(description="다운로드할 Drive 파일 ID")
+    destination_path: Optional[str] = Field(
+        default=None,
+        description="DRIVE_DOWNLOAD_DIR 안에 저장할 파일 경로 (상대 경로는 그 디렉토리 기준, 없으면 내용을 file_content_b64로 반환)"
+    )
 
 
 class CreateEventRequest(BaseModel):
     """일정 생성 요청"""
     summary: str = Field(description="일정 제목")
-    start_time: str = Field(description="시작 시간 (ISO 8601)")
-    end_time: str = Field(description="종료 시간 (ISO 8601)")
-    description: str = Field(default=None, description="일정 설명")
-    location: str = Field(default=None, description="장소")
+    start_time: str = Field(description="시작 시간 (ISO 8601 형식)")
+    end_time: str = Field(description="종료 시간 (ISO 8601 형식)")
+    description: Optional[str] = Field(default=None, description="일정 설명")
+    location: Optional[str] = Field(default=None, description="장소")
     attendees: List[str] = Field(default=[], description="참석자 이메일 리스트")
     all_day: bool = Field(default=False, description="종일 일정 여부")
+    idempotency_key: Optional[str] = Field(
+        default=None,
+        description="재시도 시 중복 생성을 막는 고유 키 (같은 키면 기존 일정 반환)"
+    )
+
+
+class SendEmailsBulkRequest(BaseModel):
+    """이메일 일괄 발송 요청"""
+    emails: List[SendEmailRequest] = Field(min_length=1, description="발송할 이메일 목록 (send_email 인자와 동일)")
+
+
+class UploadContractsBulkRequest(BaseModel):
+    """계약서 일괄 업로드 요청"""
+    contracts: List[UploadContractRequest] = Field(
+        min_length=1,
+        description="업로드할 계약서 목록 (upload_contract 인자와 동일)"
+    )
+
+
+class CreateEventsBulkRequest(BaseModel):
+    """일정 일괄 생성 요청"""
+    events: List[CreateEventRequest] = Field(
+        min_length=1,
+        description="생성할 일정 목록 (create_calendar_event 인자와 동일)"
+    )
+
+
+class DeadlineItem(BaseModel):
+    """계약 마감일 한 건"""
+    contract_name: str = Field(description="계약명")
+    deadline_date: str = Field(description="마감일 (ISO 8601 형식)")
+    description: Optional[str] = Field(default=None, description="계약 설명")
+    reminder_days: Optional[List[int]] = Field(default=None, description="알림 설정 (일 단위, 예: [1, 3, 7])")
+
+
+class CreateDeadlineRequest(DeadlineItem):
+    """계약 마감일 생성 요청"""
+    idempotent: bool = Field(default=False, description="계약명 + 마감일 기준으로 중복 생성 방지")
+
+
+class CreateDeadlinesBulkRequest(BaseModel):
+    """계약 마감일 일괄 생성 요청"""
+    deadlines: List[DeadlineItem] = Field(description="마감일 목록 (create_contract_deadline 인자와 동일)")
+    idempotent: bool = Field(default=False, description="계약명 + 마감일 기준으로 중복 생성 방지")
+
+
+class ScheduleMeetingRequest(BaseModel):
+    """회의 일정 조율 요청"""
+    title: str = Field(description="회의 제목")
+    duration_minutes: int = Field(gt=0, description="회의 시간 (분)")
+    attendees: List[str] = Field(description="참석자 이메일 리스트")
+    window_start: str = Field(description="탐색 시작 (ISO 8601, 타임존이 없으면 DEFAULT_TIMEZONE)")
+    window_end: str = Field(description="탐색 종료 (ISO 8601)")
+    preferred_start: Optional[str] = Field(
+        default=None,
+        description="희망 시작 시간 (ISO 8601, 탐색 창 안이어야 함, 기본: 탐색 시작)"
+    )
+    on_conflict: Literal["reject", "earliest"] = Field(
+        default="earliest",
+        description="충돌 시 거부(reject) 또는 가장 이른 빈 시간(earliest)"
+    )
+    slot_step_minutes: int = Field(default=15, gt=0, description="빈 시간 탐색 시 시작 시각 단위 (분)")
+    description: Optional[str] = Field(default=None, description="회의 설명")
+    location: Optional[str] = Field(default=None, description="장소")
+
+
+class EventUpdateItem(BaseModel):
+    """일정 한 건의 변경 필드 (지정한 필드만 수정)"""
+    event_id: str = Field(description="수정할 일정 ID")
+    summary: Optional[str] = Field(default=None, description="일정 제목")
+    start_time: Optional[str] = Field(default=None, description="시작 시간 (ISO 8601, 타임존이 없으면 DEFAULT_TIMEZONE)")
+    end_time: Optional[str] = Field(default=None, description="종료 시간 (ISO 8601, 타임존이 없으면 DEFAULT_TIMEZONE)")
+    all_day: Optional[bool] = Field(default=None, description="종일 일정 여부")
+    description: Optional[str] = Field(default=None, description="일정 설명")
+    location: Optional[str] = Field(default=None, description="장소")
+    attendees: Optional[List[str]] = Field(default=None, description="참석자 이메일 리스트")
+
+
+class UpdateEventsBulkRequest(BaseModel):
+    """일정 일괄 수정 요청"""
+    updates: List[EventUpdateItem] = Field(description="event_id와 바꿀 필드 목록")
+
+
+class DeleteEventsBulkRequest(BaseModel):
+    """일정 일괄 삭제 요청"""
+    event_ids: List[str] = Field(description="삭제할 일정 ID 리스트")
+
+
+class ListEventsRequest(BaseModel):
+    """일정 조회 요청"""
+    time_min: Optional[str] = Field(default=None, description="조회 시작 시각 (ISO 8601, 타임존이 없으면 DEFAULT_TIMEZONE, 기본: 현재)")
+    time_max: Optional[str] = Field(default=None, description="조회 종료 시각 (ISO 8601)")
+    max_results: Optional[int] = Field(default=None, gt=0, description="최대 결과 수 (없으면 기간 내 전체)")
+    calendar_id: str = Field(default="primary", description="캘린더 ID (기본: primary)")
+    fresh: bool = Field(default=False, description="로컬 미러 대신 Google에서 직접 조회")
+
+
+class SearchContractsRequest(BaseModel):
+    """계약서 검색 요청"""
+    party: Optional[str] = Field(default=None, description="계약 당사자 (대소문자 무시, 접두사 일치)")
+    date_from: Optional[str] = Field(default=None, description="계약 날짜 시작 (YYYY-MM-DD)")
+    date_to: Optional[str] = Field(default=None, description="계약 날짜 종료 (YYYY-MM-DD)")
+    name: Optional[str] = Field(default=None, description="계약서 이름 (부분 일치)")
+    folder_name: Optional[str] = Field(default=None, description="폴더명")
+    limit: int = Field(default=50, gt=0, description="최대 결과 수 (기본: 50)")
+
+
+ToolHandler = Callable[[Dict[str, Any]], Awaitable[List[TextContent]]]
+
+
+class ToolRegistry:
+    """MCP 도구 레지스트리
+
+    도구마다 요청 모델 하나로 입력 스키마와 인자 검증을 함께 정의한다.
+    스키마는 등록 시점에 한 번만 생성해 tools/list 응답으로 재사용한다.
+    """
+
+    def __init__(self):
+        self._specs: Dict[str, Tuple[Type[BaseModel], ToolHandler, bool]] = {}
+        self._tools: List[Tool] = []
+
+    def register(
+        self,
+        name: str,
+        description: str,
+        model: Type[BaseModel],
+        handler: ToolHandler,
+        requires_google: bool = True
+    ):
+        """
+        도구 등록
+
+        Args:
+            name: 도구 이름
+            description: 도구 설명
+            model: 입력 인자 모델
+            handler: 검증된 인자 딕셔너리를 받는 핸들러
+            requires_google: Google 서비스 초기화가 필요한지 여부
+        """
+        self._specs[name] = (model, handler, requires_google)
+        self._tools.append(Tool(
+            name=name,
+            description=description,
+            inputSchema=model.model_json_schema()
+        ))
+
+    def tools(self) -> List[Tool]:
+        """등록된 도구 목록 (등록 시 만든 객체를 그대로 반환)"""
+        return self._tools
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    def requires_google(self, name: str) -> bool:
+        return self._specs[name][2]
+
+    def validate(self, name: str, arguments: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        인자 검증
+
+        Returns:
+            검증·변환된 인자 (클라이언트가 보내지 않은 필드는 빠진다.
+            일괄 수정처럼 지정한 필드만 반영해야 하는 핸들러를 위해서다)
+
+        Raises:
+            ValidationError: 인자가 모델과 맞지 않을 때
+        """
+        model = self._specs[name][0]
+        return model.model_validate(arguments or {}).model_dump(exclude_unset=True)
+
+    async def call(self, name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+        """검증된 인자로 핸들러 실행"""
+        return await self._specs[name][1](arguments)
+
+
+class ProgressReporter:
+    """워커 스레드에서 호출하는 MCP 진행률 알림 콜백
+
+    호출 시 notifications/progress 전송을 이벤트 루프에 예약만 하고 바로 돌아온다.
+    """
+
+    def __init__(self, session, progress_token, loop: asyncio.AbstractEventLoop):
+        self.session = session
+        self.progress_token = progress_token
+        self.loop = loop
+        self._pending = []
+
+    def __call__(self, progress: float, total: Optional[float] = None):
+        self._pending.append(asyncio.run_coroutine_threadsafe(
+            self.session.send_progress_notification(self.progress_token, progress, total),
+            self.loop
+        ))
+
+    async def drain(self):
+        """예약된 알림을 모두 전송 (응답보다 먼저 도착하도록 결과 반환 전에 호출)"""
+        await asyncio.gather(
+            *(asyncio.wrap_future(future) for future in self._pending),
+            return_exceptions=True
+        )
 
 
 class GoogleServicesMCPServer:
     """Google Services MCP Server"""
 
-    def __init__(self):
+    def __init__(self, router: Optional[GoogleTaskRouter] = None):
+        """
+        Args:
+            router: 서비스와 캐시를 공유할 라우터 (HTTP 게이트웨이에 붙일 때 전달, 없으면 새로 생성)
+        """
         self.server = Server("google-services-mcp")
-        self.auth_manager = GoogleAuthManager()
-        self.credentials = None
-        self.gmail_service = None
-        self.drive_service = None
-        self.calendar_service = None
+        self.router = router or GoogleTaskRouter()
+        self.tools = ToolRegistry()
+        self._warm_up_task: Optional[asyncio.Task] = None
 
         # 도구 등록
         self._register_tools()
 
-    def _initialize_services(self):
-        """서비스 초기화"""
-        if not self.credentials:
-            self.credentials = self.auth_manager.get_credentials()
-            self.gmail_service = GmailService(self.credentials)
-            self.drive_service = DriveService(self.credentials)
-            self.calendar_service = CalendarService(self.credentials)
-
     def _register_tools(self):
         """MCP 도구 등록"""
+        registry = self.tools
+        registry.register(
+            "send_email",
+            "Gmail을 사용하여 이메일을 발송합니다",
+            SendEmailRequest,
+            self._handle_send_email
+        )
+        registry.register(
+            "upload_contract",
+            "계약서를 Google Drive에 업로드합니다",
+            UploadContractRequest,
+            self._handle_upload_contract
+        )
+        registry.register(
+            "download_contract",
+            "Google Drive에서 계약서를 다운로드합니다 (같은 버전은 로컬 캐시에서 바로 반환)",
+            DownloadContractRequest,
+            self._handle_download_contract
+        )
+        registry.register(
+            "create_calendar_event",
+            "Google Calendar에 일정을 생성합니다",
+            CreateEventRequest,
+            self._handle_create_event
+        )
+        registry.register(
+            "send_emails_bulk",
+            "여러 이메일을 서버에서 동시에 발송하고 항목별 결과를 반환합니다",
+            SendEmailsBulkRequest,
+            self._handle_send_emails_bulk
+        )
+        registry.register(
+            "upload_contracts_bulk",
+            "여러 계약서를 서버에서 동시에 Google Drive에 업로드하고 항목별 결과를 반환합니다",
+            UploadContractsBulkRequest,
+            self._handle_upload_contracts_bulk
+        )
+        registry.register(
+            "create_calendar_events_bulk",
+            "여러 일정을 배치 요청으로 한 번에 생성하고 항목별 결과를 반환합니다",
+            CreateEventsBulkRequest,
+            self._handle_create_events_bulk
+        )
+        registry.register(
+            "create_contract_deadline",
+            "계약 마감일을 캘린더에 등록합니다",
+            CreateDeadlineRequest,
+            self._handle_create_deadline
+        )
+        registry.register(
+            "schedule_meeting",
+            "참석자 전원의 가용 시간을 확인한 뒤 겹치지 않는 시간에 회의를 생성합니다",
+            ScheduleMeetingRequest,
+            self._handle_schedule_meeting
+        )
+        registry.register(
+            "create_contract_deadlines_bulk",
+            "여러 계약 마감일을 배치 요청으로 한 번에 캘린더에 등록합니다",
+            CreateDeadlinesBulkRequest,
+            self._handle_create_deadlines_bulk
+        )
+        registry.register(
+            "update_calendar_events_bulk",
+            "여러 일정을 변경된 필드만 배치로 수정합니다 (일괄 일정 변경)",
+            UpdateEventsBulkRequest,
+            self._handle_update_events_bulk
+        )
+        registry.register(
+            "delete_calendar_events_bulk",
+            "여러 일정을 배치로 삭제합니다",
+            DeleteEventsBulkRequest,
+            self._handle_delete_events_bulk
+        )
+        registry.register(
+            "list_calendar_events",
+            "기간 내 캘린더 일정을 페이지를 따라가며 조회합니다 (NDJSON, 한 줄에 일정 하나)",
+            ListEventsRequest,
+            self._handle_list_events
+        )
+        # 로컬 인덱스 조회는 Google 인증이 필요 없다
+        registry.register(
+            "search_contracts",
+            "업로드된 계약서를 당사자, 계약 날짜, 이름으로 검색합니다",
+            SearchContractsRequest,
+            self._handle_search_contracts,
+            requires_google=False
+        )
 
         @self.server.list_tools()
         async def list_tools() -> List[Tool]:
             """사용 가능한 도구 목록"""
-            return [
-                Tool(
-                    name="send_email",
-                    description="Gmail을 사용하여 이메일을 발송합니다",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "to": {
-                                "type": "string",
-                                "description": "받는 사람 이메일 주소"
-                            },
-                            "subject": {
-                                "type": "string",
-                                "description": "이메일 제목"
-                            },
-                            "body": {
-                                "type": "string",
-                                "description": "이메일 본문"
-                            },
-                            "cc": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "참조(CC) 이메일 리스트"
-                            },
-                            "bcc": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "숨은참조(BCC) 이메일 리스트"
-                            },
-                            "html": {
-                                "type": "boolean",
-                                "description": "HTML 형식 사용 여부"
-                            }
-                        },
-                        "required": ["to", "subject", "body"]
-                    }
-                ),
-                Tool(
-                    name="upload_contract",
-                    description="계약서를 Google Drive에 업로드합니다",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "file_path": {
-                                "type": "string",
-                                "description": "업로드할 계약서 파일 경로"
-                            },
-                            "contract_name": {
-                                "type": "string",
-                                "description": "계약서 이름"
-                            },
-                            "contract_date": {
-                                "type": "string",
-                                "description": "계약 날짜 (YYYY-MM-DD 형식)"
-                            },
-                            "parties": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "계약 당사자 목록"
-                            },
-                            "folder_name": {
-                                "type": "string",
-                                "description": "저장할 폴더명 (기본: Contracts)"
-                            }
-                        },
-                        "required": ["file_path", "contract_name"]
-                    }
-                ),
-                Tool(
-                    name="create_calendar_event",
-                    description="Google Calendar에 일정을 생성합니다",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "summary": {
-                                "type": "string",
-                                "description": "일정 제목"
-                            },
-                            "start_time": {
-                                "type": "string",
-                                "description": "시작 시간 (ISO 8601 형식)"
-                            },
-                            "end_time": {
-                                "type": "string",
-                                "description": "종료 시간 (ISO 8601 형식)"
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "일정 설명"
-                            },
-                            "location": {
-                                "type": "string",
-                                "description": "장소"
-                            },
-                            "attendees": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "참석자 이메일 리스트"
-                            },
-                            "all_day": {
-                                "type": "boolean",
-                                "description": "종일 일정 여부"
-                            }
-                        },
-                        "required": ["summary", "start_time", "end_time"]
-                    }
-                ),
-                Tool(
-                    name="create_contract_deadline",
-                    description="계약 마감일을 캘린더에 등록합니다",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "contract_name": {
-                                "type": "string",
-                                "description": "계약명"
-                            },
-                            "deadline_date": {
-                                "type": "string",
-                                "description": "마감일 (ISO 8601 형식)"
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "계약 설명"
-                            },
-                            "reminder_days": {
-                                "type": "array",
-                                "items": {"type": "integer"},
-                                "description": "알림 설정 (일 단위, 예: [1, 3, 7])"
-                            }
-                        },
-                        "required": ["contract_name", "deadline_date"]
-                    }
-                )
-            ]
+            return registry.tools()
+
+        # 인자는 레지스트리 모델로 검증하므로 SDK의 JSON Schema 검증은 끈다
+        # (validate_input 인자가 없는 이전 SDK에서는 기본 동작 유지)
+        try:
+            call_tool_decorator = self.server.call_tool(validate_input=False)
+        except TypeError:
+            call_tool_decorator = self.server.call_tool()
 
-        @self.server.call_tool()
+        @call_tool_decorator
         async def call_tool(name: str, arguments: Any) -> List[TextContent]:
-            """도구 실행"""
-            self._initialize_services()
+            """도구 실행 (실패는 ToolError로 올려 SDK가 isError=True 결과로 보내게 한다)"""
+            if name not in registry:
+                raise ToolError(f"Unknown tool: {name}")
 
             try:
-                if name == "send_email":
-                    return await self._handle_send_email(arguments)
-                elif name == "upload_contract":
-                    return await self._handle_upload_contract(arguments)
-                elif name == "create_calendar_event":
-                    return await self._handle_create_event(arguments)
-                elif name == "create_contract_deadline":
-                    return await self._handle_create_deadline(arguments)
-                else:
-                    return [TextContent(
-                        type="text",
-                        text=f"Unknown tool: {name}"
-                    )]
+                args = registry.validate(name, arguments)
+            except ValidationError as e:
+                raise ToolError(json.dumps({
+                    "success": False,
+                    "error": f"Invalid arguments for {name}",
+                    "details": e.errors(include_url=False)
+                }, ensure_ascii=False, indent=2, default=str))
+
+            try:
+                # HTTP 작업과 같은 스케줄러를 써서 일괄 도구가 단건 요청을 밀어내지 않게 한다
+                priority = PRIORITY_BATCH if name.endswith("_bulk") else PRIORITY_INTERACTIVE
+                with span("mcp.call_tool", kind=SPAN_KIND_SERVER, **{"mcp.tool": name}):
+                    async with self.router.scheduler.slot(priority, MCP_TENANT):
+                        if registry.requires_google(name):
+                            await self.router.ensure_services()
+                        try:
+                            contents = await registry.call(name, args)
+                        finally:
+                            if name in _READ_INVALIDATIONS:
+                                self.router.invalidate_reads(_READ_INVALIDATIONS[name])
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error executing {name}: {str(e)}"
-                )]
+                raise ToolError(f"Error executing {name}: {str(e)}") from e
+
+            # Google 오류 등 핸들러가 {"success": false}로 돌려준 실패도 오류 결과로 표시
+            if _reports_failure(contents):
+                raise ToolError(contents[0].text)
+            return contents
+
+    def _progress_reporter(self) -> Optional[ProgressReporter]:
+        """현재 요청에 progressToken이 있으면 진행률 콜백 생성"""
+        try:
+            ctx = self.server.request_context
+        except LookupError:
+            return None
+        token = ctx.meta.progressToken if ctx.meta is not None else None
+        if token is None:
+            return None
+        return ProgressReporter(ctx.session, token, asyncio.get_running_loop())
+
+    async def _run_with_progress(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """func를 워커 스레드에서 실행하며 progress_callback으로 진행률 알림 전송"""
+        reporter = self._progress_reporter()
+        try:
+            return await asyncio.to_thread(func, *args, progress_callback=reporter, **kwargs)
+        finally:
+            if reporter is not None:
+                await reporter.drain()
 
     async def _handle_send_email(self, args: Dict[str, Any]) -> List[TextContent]:
         """이메일 발송 처리"""
-        email = EmailMessage(
-            to=args["to"],
-            subject=args["subject"],
-            body=args["body"],
-            cc=args.get("cc", []),
-            bcc=args.get("bcc", []),
-            html=args.get("html", False)
-        )
+        email = _email_message(args)
 
-        result = self.gmail_service.send_email(email)
+        result = await asyncio.to_thread(self.router.gmail_service.send_email, email)
 
         return [TextContent(
             type="text",
             text=json.dumps(result, ensure_ascii=False, indent=2)
         )]
 
+    async def _handle_send_emails_bulk(self, args: Dict[str, Any]) -> List[TextContent]:
+        """이메일 일괄 발송 처리 (동시 발송, 항목별 결과)"""
+        emails = [_email_message(item) for item in args["emails"]]
+
+        results = await self._run_with_progress(self.router.gmail_service.send_bulk_emails, emails)
+
+        return [TextContent(
+            type="text",
+            text=json.dumps(results, ensure_ascii=False, indent=2)
+        )]
+
     async def _handle_upload_contract(self, args: Dict[str, Any]) -> List[TextContent]:
         """계약서 업로드 처리"""
-        metadata = {}
-        if args.get("contract_date"):
-            metadata["contract_date"] = args["contract_date"]
-        if args.get("parties"):
-            metadata["parties"] = ",".join(args["parties"])
-
-        result = self.drive_service.upload_contract(
-            contract_file_path=args["file_path"],
-            contract_name=args["contract_name"],
-            contract_metadata=metadata,
-            folder_name=args.get("folder_name", "Contracts")
+        result = await self._run_with_progress(
+            self.router.drive_service.upload_contract,
+            **_upload_contract_kwargs(args)
         )
 
         return [TextContent(
@@ -274,32 +493,204 @@ class GoogleServicesMCPServer:
             text=json.dumps(result, ensure_ascii=False, indent=2)
         )]
 
+    async def _handle_download_contract(self, args: Dict[str, Any]) -> List[TextContent]:
+        """계약서 다운로드 처리"""
+        result = await self.router.download_drive_file(args["file_id"], args.get("destination_path"))
+
+        return [TextContent(
+            type="text",
+            text=json.dumps(result, ensure_ascii=False, indent=2)
+        )]
+
+    async def _handle_upload_contracts_bulk(self, args: Dict[str, Any]) -> List[TextContent]:
+        """계약서 일괄 업로드 처리 (동시 업로드, 항목별 결과)"""
+        contracts = [_upload_contract_kwargs(item) for item in args["contracts"]]
+
+        results = await self._run_with_progress(self.router.drive_service.upload_contracts, contracts)
+
+        return [TextContent(
+            type="text",
+            text=json.dumps(results, ensure_ascii=False, indent=2)
+        )]
+
     async def _handle_create_event(self, args: Dict[str, Any]) -> List[TextContent]:
         """일정 생성 처리"""
-        event = CalendarEvent(
-            summary=args["summary"],
-            start_time=datetime.fromisoformat(args["start_time"]),
-            end_time=datetime.fromisoformat(args["end_time"]),
-            description=args.get("description"),
-            location=args.get("location"),
-            attendees=args.get("attendees", []),
-            all_day=args.get("all_day", False)
-        )
+        event = _calendar_event(args)
 
-        result = self.calendar_service.create_event(event)
+        result = await asyncio.to_thread(self.router.calendar_service.create_event, event)
+        if self.router.calendar_mirror is not None:
+            self.router.calendar_mirror.mark_stale()
 
         return [TextContent(
             type="text",
             text=json.dumps(result, ensure_ascii=False, indent=2)
         )]
 
+    async def _handle_create_events_bulk(self, args: Dict[str, Any]) -> List[TextContent]:
+        """일정 일괄 생성 처리 (배치 요청, 항목별 결과)"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(args["events"])
+        events = []
+        for index, item in enumerate(args["events"]):
+            try:
+                events.append((index, _calendar_event(item)))
+            except ValueError as e:
+                results[index] = {"success": False, "error": str(e)}
+
+        if events:
+            created = await self._run_with_progress(
+                self.router.calendar_service.create_events,
+                [event for _, event in events]
+            )
+            for (index, _), result in zip(events, created):
+                results[index] = result
+            if self.router.calendar_mirror is not None:
+                self.router.calendar_mirror.mark_stale()
+
+        return [TextContent(
+            type="text",
+            text=json.dumps(results, ensure_ascii=False, indent=2)
+        )]
+
     async def _handle_create_deadline(self, args: Dict[str, Any]) -> List[TextContent]:
         """계약 마감일 생성 처리"""
-        result = self.calendar_service.create_contract_deadline(
+        result = await asyncio.to_thread(
+            self.router.calendar_service.create_contract_deadline,
             contract_name=args["contract_name"],
             deadline_date=datetime.fromisoformat(args["deadline_date"]),
             description=args.get("description"),
-            reminder_days=args.get("reminder_days")
+            reminder_days=args.get("reminder_days"),
+            idempotent=args.get("idempotent", False)
+        )
+        if self.router.calendar_mirror is not None:
+            self.router.calendar_mirror.mark_stale()
+
+        return [TextContent(
+            type="text",
+            text=json.dumps(result, ensure_ascii=False, indent=2)
+        )]
+
+    async def _handle_schedule_meeting(self, args: Dict[str, Any]) -> List[TextContent]:
+        """가용 시간 확인 후 회의 생성 처리"""
+        tz = ZoneInfo(Config.DEFAULT_TIMEZONE)
+        result = await asyncio.to_thread(
+            self.router.calendar_service.schedule_meeting,
+            title=args["title"],
+            duration_minutes=args["duration_minutes"],
+            attendees=args["attendees"],
+            window_start=parse_datetime(args["window_start"], tz),
+            window_end=parse_datetime(args["window_end"], tz),
+            preferred_start=parse_datetime(args.get("preferred_start"), tz),
+            on_conflict=args.get("on_conflict", "earliest"),
+            slot_step_minutes=args.get("slot_step_minutes", 15),
+            description=args.get("description"),
+            location=args.get("location")
+        )
+        if self.router.calendar_mirror is not None and result.get("success"):
+            self.router.calendar_mirror.mark_stale()
+
+        return [TextContent(
+            type="text",
+            text=json.dumps(result, ensure_ascii=False, indent=2)
+        )]
+
+    async def _handle_create_deadlines_bulk(self, args: Dict[str, Any]) -> List[TextContent]:
+        """계약 마감일 일괄 생성 처리"""
+        deadlines = [
+            {
+                "contract_name": item["contract_name"],
+                "deadline_date": datetime.fromisoformat(item["deadline_date"]),
+                "description": item.get("description"),
+                "reminder_days": item.get("reminder_days")
+            }
+            for item in args["deadlines"]
+        ]
+
+        results = await self._run_with_progress(
+            self.router.calendar_service.create_contract_deadlines,
+            deadlines,
+            idempotent=args.get("idempotent", False)
+        )
+        if self.router.calendar_mirror is not None:
+            self.router.calendar_mirror.mark_stale()
+
+        return [TextContent(
+            type="text",
+            text=json.dumps(results, ensure_ascii=False, indent=2)
+        )]
+
+    async def _handle_update_events_bulk(self, args: Dict[str, Any]) -> List[TextContent]:
+        """일정 일괄 수정 처리"""
+        updates = []
+        for item in args["updates"]:
+            changes = dict(item)
+            for field in ("start_time", "end_time"):
+                if field in changes:
+                    changes[field] = datetime.fromisoformat(changes[field])
+            updates.append(changes)
+
+        results = await self._run_with_progress(
+            self.router.calendar_service.patch_events,
+            updates,
+            timezone=Config.DEFAULT_TIMEZONE
+        )
+        if self.router.calendar_mirror is not None:
+            self.router.calendar_mirror.mark_stale()
+
+        return [TextContent(
+            type="text",
+            text=json.dumps(results, ensure_ascii=False, indent=2)
+        )]
+
+    async def _handle_delete_events_bulk(self, args: Dict[str, Any]) -> List[TextContent]:
+        """일정 일괄 삭제 처리"""
+        results = await self._run_with_progress(
+            self.router.calendar_service.delete_events,
+            args["event_ids"]
+        )
+        if self.router.calendar_mirror is not None:
+            self.router.calendar_mirror.mark_stale()
+
+        return [TextContent(
+            type="text",
+            text=json.dumps(results, ensure_ascii=False, indent=2)
+        )]
+
+    async def _handle_list_events(self, args: Dict[str, Any]) -> List[TextContent]:
+        """일정 조회 처리 (NDJSON)"""
+        tz = ZoneInfo(Config.DEFAULT_TIMEZONE)
+        query = dict(
+            calendar_id=args.get("calendar_id", "primary"),
+            time_min=parse_datetime(args.get("time_min"), tz),
+            time_max=parse_datetime(args.get("time_max"), tz),
+            max_results=args.get("max_results")
+        )
+
+        if self.router.calendar_mirror is not None and not args.get("fresh", False):
+            result = await asyncio.to_thread(self.router.calendar_mirror.query, **query)
+            if not result["success"]:
+                return [TextContent(
+                    type="text",
+                    text=json.dumps(result, ensure_ascii=False, indent=2)
+                )]
+            events = result["events"]
+        else:
+            events = await asyncio.to_thread(list, self.router.calendar_service.iter_events(**query))
+
+        return [TextContent(
+            type="text",
+            text="\n".join(json.dumps(event, ensure_ascii=False) for event in events)
+        )]
+
+    async def _handle_search_contracts(self, args: Dict[str, Any]) -> List[TextContent]:
+        """계약서 검색 처리"""
+        result = await asyncio.to_thread(
+            self.router.contract_index.search,
+            party=args.get("party"),
+            date_from=args.get("date_from"),
+            date_to=args.get("date_to"),
+            name=args.get("name"),
+            folder_name=args.get("folder_name"),
+            limit=args.get("limit", 50)
         )
 
         return [TextContent(
@@ -311,12 +702,80 @@ class GoogleServicesMCPServer:
         """서버 실행"""
         from mcp.server.stdio import stdio_server
 
+        install_default_executor()
         async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options()
-            )
+            if Config.STARTUP_WARM_UP:
+                # initialize/list_tools에 응답하는 동안 스레드에서 미리 import
+                # (태스크 참조를 잡아 두어야 끝나기 전에 가비지 컬렉션되지 않는다)
+                self._warm_up_task = asyncio.create_task(warm_up())
+            try:
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options()
+                )
+            finally:
+                if self._warm_up_task is not None:
+                    # 스레드의 import는 취소할 수 없으므로 끝날 때까지 기다린다 (오류는 warm_up이 기록)
+                    await self._warm_up_task
+                    self._warm_up_task = None
+
+
+def _reports_failure(contents: List[TextContent]) -> bool:
+    """핸들러 결과가 {"success": false, ...} 형식의 단건 실패인지 확인"""
+    if len(contents) != 1 or contents[0].type != "text":
+        return False
+    try:
+        payload = json.loads(contents[0].text)
+    except ValueError:
+        return False
+    return isinstance(payload, dict) and payload.get("success") is False
+
+
+def _email_message(args: Dict[str, Any]) -> "EmailMessage":
+    """send_email 인자로 EmailMessage 생성"""
+    from src.google_services.gmail_service import EmailMessage
+
+    return EmailMessage(
+        to=args["to"],
+        subject=args["subject"],
+        body=args["body"],
+        cc=args.get("cc", []),
+        bcc=args.get("bcc", []),
+        html=args.get("html", False)
+    )
+
+
+def _upload_contract_kwargs(args: Dict[str, Any]) -> Dict[str, Any]:
+    """upload_contract 인자를 DriveService.upload_contract 인자로 변환"""
+    metadata = {}
+    if args.get("contract_date"):
+        metadata["contract_date"] = args["contract_date"]
+    if args.get("parties"):
+        metadata["parties"] = list(args["parties"])
+
+    return dict(
+        contract_file_path=args["file_path"],
+        contract_name=args["contract_name"],
+        contract_metadata=metadata,
+        folder_name=args.get("folder_name", "Contracts")
+    )
+
+
+def _calendar_event(args: Dict[str, Any]) -> "CalendarEvent":
+    """create_calendar_event 인자로 CalendarEvent 생성 (시간 형식이 잘못되면 ValueError)"""
+    from src.google_services.calendar_service import CalendarEvent, event_id_for
+
+    return CalendarEvent(
+        summary=args["summary"],
+        start_time=datetime.fromisoformat(args["start_time"]),
+        end_time=datetime.fromisoformat(args["end_time"]),
+        description=args.get("description"),
+        location=args.get("location"),
+        attendees=args.get("attendees", []),
+        all_day=args.get("all_day", False),
+        event_id=event_id_for(args["idempotency_key"]) if args.get("idempotency_key") else None
+    )
 
 
 async def main():
@@ -0,0 +1,129 @@
+"""
+조회 결과 캐시
+Google 조회 결과를 ETag와 함께 메모리에 보관하고, TTL이 지나면 ETag 조건부 요청(If-None-Match)으로
+변경 여부만 확인해 바뀌지 않았으면(304) 본문을 다시 받지 않는다
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+# 조회 함수: 이전 ETag(없으면 None)를 받아 {"success", "not_modified", "etag", ...} 반환
+ConditionalFetch = Callable[[Optional[str]], Dict[str, Any]]
+
+
+class _Entry:
+    __slots__ = ("value", "etag", "expires_at")
+
+    def __init__(self, value: Dict[str, Any], etag: Optional[str], expires_at: float):
+        self.value = value
+        self.etag = etag
+        self.expires_at = expires_at
+
+
+class ReadCache:
+    """크기 제한 LRU + TTL 조회 캐시
+
+    TTL 안의 항목은 그대로 돌려주고, 만료된 항목은 저장된 ETag로 다시 확인한다.
+    같은 키를 동시에 조회하면 Google 요청은 한 번만 보낸다. 실패한 조회 결과는 저장하지 않는다.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 30.0):
+        """
+        캐시 초기화
+
+        Args:
+            max_entries: 최대 항목 수 (넘으면 가장 오래 쓰지 않은 항목부터 제거, 0이면 캐시하지 않음)
+            ttl_seconds: Google에 다시 확인하지 않고 쓰는 시간 (초)
+        """
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Task] = {}
+        # invalidate마다 증가 (무효화 전에 시작한 조회 결과는 저장하지 않는다)
+        self._generation = 0
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_fetch(self, key: str, fetch: ConditionalFetch, fresh: bool = False) -> Dict[str, Any]:
+        """
+        캐시된 결과 반환 (없거나 만료되면 fetch를 스레드에서 실행)
+
+        Args:
+            key: 캐시 키 (네임스페이스 접두어 포함, invalidate 참고)
+            fetch: 조건부 조회 함수
+            fresh: TTL이 남아 있어도 Google에 확인 (ETag가 있으면 조건부 요청)
+
+        Returns:
+            조회 결과 (not_modified/etag 키는 제외)
+        """
+        entry = self._entries.get(key)
+        if not fresh and entry is not None and entry.expires_at > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh(key, entry, fetch))
+            self._pending[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # 먼저 기다리던 요청이 취소돼도 다른 요청을 위해 조회는 계속한다
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        if not task.cancelled():
+            # 기다리던 요청이 모두 취소됐을 때 "exception was never retrieved" 경고 방지
+            task.exception()
+
+    async def _refresh(self, key: str, entry: Optional[_Entry], fetch: ConditionalFetch) -> Dict[str, Any]:
+        generation = self._generation
+        result = await asyncio.to_thread(fetch, entry.etag if entry is not None else None)
+        if not result.get("success"):
+            return result
+
+        if result.get("not_modified") and entry is not None:
+            self.revalidated += 1
+            value = entry.value
+        else:
+            self.misses += 1
+            value = {name: item for name, item in result.items() if name not in ("not_modified", "etag")}
+
+        if generation == self._generation:
+            self._store(key, _Entry(value, result.get("etag"), time.monotonic() + self.ttl_seconds))
+        return value
+
+    def _store(self, key: str, entry: _Entry):
+        if self.max_entries == 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str = ""):
+        """
+        prefix로 시작하는 키의 항목 제거 (쓰기 작업 후 호출)
+
+        Args:
+            prefix: 키 접두어 (빈 문자열이면 전체)
+        """
+        self._generation += 1
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+
+    def stats(self) -> Dict[str, int]:
+        """항목 수와 적중/재검증/미스 횟수"""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+        }
@@ -0,0 +1,189 @@
+"""
+작업 스케줄러
+우선순위 레인(interactive/normal/batch)별 동시 실행 수를 제한하고, 빈 슬롯은
+레인 사이에서는 가중치, 레인 안에서는 테넌트끼리 공평하게(가중 공정 큐잉) 나눠준다
+대량 일괄 작업이 쌓여 있어도 대화형 요청은 남겨 둔 슬롯에서 바로 실행된다
+"""
+import asyncio
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, List, Optional
+
+
+# 우선순위 레인 (앞쪽이 높다)
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_NORMAL = "normal"
+PRIORITY_BATCH = "batch"
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_NORMAL, PRIORITY_BATCH)
+
+DEFAULT_TENANT = "default"
+
+# 레인별 기본값 (가중치, 최대 동시 실행 수)
+DEFAULT_LANES = {
+    PRIORITY_INTERACTIVE: (8.0, 16),
+    PRIORITY_NORMAL: (4.0, 8),
+    PRIORITY_BATCH: (1.0, 4),
+}
+
+
+class _Lane:
+    """레인 하나의 대기열과 가상 시간"""
+
+    def __init__(self, name: str, weight: float, max_concurrency: int):
+        self.name = name
+        self.weight = weight
+        self.max_concurrency = max(1, max_concurrency)
+        self.active = 0
+        self.waiting = 0
+        self.vtime = 0.0
+        # 테넌트 -> 대기 중인 future, 테넌트별 가상 시간
+        self.queues: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self.tenant_vtime: Dict[str, float] = {}
+        # 마지막으로 슬롯을 받은 테넌트의 가상 시간
+        self.clock = 0.0
+
+    @property
+    def runnable(self) -> bool:
+        return self.waiting > 0 and self.active < self.max_concurrency
+
+
+def parse_lanes(spec: str) -> Dict[str, tuple]:
+    """
+    레인 설정 문자열 파싱
+
+    Args:
+        spec: "이름:가중치:최대동시실행,..." (예: "interactive:8:16,batch:1:4"), 빠진 레인은 기본값
+
+    Returns:
+        레인 이름 -> (가중치, 최대 동시 실행 수)
+    """
+    lanes = dict(DEFAULT_LANES)
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, weight, max_concurrency = item.split(":")
+        if name not in lanes:
+            raise ValueError(f"Unknown priority lane: {name}")
+        lanes[name] = (float(weight), int(max_concurrency))
+    return lanes
+
+
+class FairScheduler:
+    """우선순위 레인 + 테넌트 가중 공정 큐잉 스케줄러
+
+    실행 슬롯(max_concurrency)이 비면 실행 가능한 레인 중 가상 시간이 가장 작은 레인을,
+    그 레인 안에서는 가상 시간이 가장 작은 테넌트를 고른다. 레인은 한 건 실행할 때마다
+    1/가중치, 테넌트는 1씩 가상 시간이 늘어나며, 쉬다가 다시 요청이 들어온 레인/테넌트는
+    현재 가상 시간부터 시작해 쉬는 동안 몫을 쌓아 두지 못한다.
+    """
+
+    def __init__(self, lanes: Optional[Dict[str, tuple]] = None, max_concurrency: int = 16):
+        """
+        스케줄러 초기화
+
+        Args:
+            lanes: 레인 이름 -> (가중치, 최대 동시 실행 수) (기본: DEFAULT_LANES)
+            max_concurrency: 전체 최대 동시 실행 수
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self._lanes = {
+            name: _Lane(name, weight, max_lane)
+            for name, (weight, max_lane) in (lanes or DEFAULT_LANES).items()
+        }
+        self._active = 0
+        self._clock = 0.0
+
+    def lane_limit(self, priority: str) -> int:
+        """레인의 최대 동시 실행 수"""
+        return self._lane(priority).max_concurrency
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """레인별 실행/대기 수"""
+        return {
+            name: {"active": lane.active, "waiting": lane.waiting}
+            for name, lane in self._lanes.items()
+        }
+
+    def _lane(self, priority: str) -> _Lane:
+        return self._lanes.get(priority) or self._lanes[PRIORITY_NORMAL]
+
+    @asynccontextmanager
+    async def slot(self, priority: str = PRIORITY_NORMAL, tenant: str = DEFAULT_TENANT) -> AsyncIterator[None]:
+        """
+        실행 슬롯 하나를 받아 컨텍스트 동안 점유
+
+        Args:
+            priority: 우선순위 레인
+            tenant: 레인 안에서 공평하게 나눌 단위 (사용자/조직 등)
+        """
+        lane = self._lane(priority)
+        await self._acquire(lane, tenant or DEFAULT_TENANT)
+        try:
+            yield
+        finally:
+            self._release(lane)
+
+    async def _acquire(self, lane: _Lane, tenant: str):
+        future = asyncio.get_running_loop().create_future()
+        if lane.waiting == 0:
+            # 쉬던 레인은 현재 가상 시간부터 (쉬는 동안 몫을 쌓지 않는다)
+            lane.vtime = max(lane.vtime, self._clock)
+        queue = lane.queues.get(tenant)
+        if queue is None:
+            queue = lane.queues[tenant] = deque()
+            lane.tenant_vtime[tenant] = max(lane.tenant_vtime.get(tenant, 0.0), lane.clock)
+        queue.append(future)
+        lane.waiting += 1
+        self._schedule()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 슬롯을 받은 직후에 취소되면 반납
+                self._release(lane)
+            else:
+                self._remove_waiter(lane, tenant, future)
+            raise
+
+    def _release(self, lane: _Lane):
+        lane.active -= 1
+        self._active -= 1
+        self._schedule()
+
+    def _remove_waiter(self, lane: _Lane, tenant: str, future: asyncio.Future):
+        queue = lane.queues.get(tenant)
+        if queue is None or future not in queue:
+            return
+        queue.remove(future)
+        lane.waiting -= 1
+        if not queue:
+            del lane.queues[tenant]
+
+    def _schedule(self):
+        """빈 슬롯을 대기 중인 요청에 배정"""
+        while self._active < self.max_concurrency:
+            runnable: List[_Lane] = [lane for lane in self._lanes.values() if lane.runnable]
+            if not runnable:
+                return
+            lane = min(runnable, key=lambda candidate: candidate.vtime)
+            tenant = min(lane.queues, key=lambda name: lane.tenant_vtime[name])
+
+            queue = lane.queues[tenant]
+            future = queue.popleft()
+            lane.waiting -= 1
+            if not queue:
+                del lane.queues[tenant]
+            if future.done():
+                # 기다리다 취소된 요청
+                continue
+
+            self._clock = lane.vtime
+            lane.vtime += 1.0 / lane.weight
+            lane.clock = lane.tenant_vtime[tenant]
+            lane.tenant_vtime[tenant] += 1.0
+            if len(lane.tenant_vtime) > 4 * len(lane.queues) + 64:
+                # 대기열이 없는 테넌트 기록 정리 (다시 오면 현재 가상 시간부터 시작)
+                lane.tenant_vtime = {name: lane.tenant_vtime[name] for name in lane.queues}
+
+            lane.active += 1
+            self._active += 1
+            future.set_result(None)
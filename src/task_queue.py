@@ -0,0 +1,287 @@
+"""
+영속 작업 큐
+/tasks로 받은 작업을 SQLite(WAL)에 기록하고, 워커 프로세스가 리스(lease)를 잡아 처리
+리스가 만료되면(워커가 죽으면) 다른 워커가 다시 가져가므로 최소 한 번(at-least-once) 처리된다
+"""
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+from src.scheduler import DEFAULT_TENANT, PRIORITIES, PRIORITY_NORMAL
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    request TEXT NOT NULL,
+    traceparent TEXT,
+    priority TEXT NOT NULL DEFAULT 'normal',
+    tenant TEXT NOT NULL DEFAULT 'default',
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_queued ON tasks (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_lease ON tasks (status, lease_expires_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_tenant ON tasks (status, tenant);
+"""
+
+# 우선순위 레인 정렬 순서 (claim에서 높은 레인부터 가져온다)
+_PRIORITY_ORDER = "CASE priority " + " ".join(
+    f"WHEN '{name}' THEN {rank}" for rank, name in enumerate(PRIORITIES)
+) + f" ELSE {len(PRIORITIES)} END"
+
+# 작업 상태
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+class TaskQueue:
+    """SQLite 기반 작업 큐 (여러 프로세스가 같은 DB 파일을 공유)"""
+
+    def __init__(self, db_path: Path, max_attempts: int = 3):
+        """
+        큐 초기화
+
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+            max_attempts: 리스 만료로 다시 시도할 최대 횟수 (첫 시도 포함)
+        """
+        self.db_path = Path(db_path)
+        self.max_attempts = max(1, max_attempts)
+        self._local = threading.local()
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 커넥션 반환 (트랜잭션은 _transaction에서 직접 연다)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30.0, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    conn.executescript(_SCHEMA)
+                    self._schema_ready = True
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 잠금을 먼저 잡는 트랜잭션 (다른 프로세스와 같은 작업을 동시에 가져가지 않도록)"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def enqueue(
+        self,
+        task_id: str,
+        task_type: str,
+        request: Dict[str, Any],
+        traceparent: Optional[str] = None,
+        priority: str = PRIORITY_NORMAL,
+        tenant: str = DEFAULT_TENANT
+    ) -> Dict[str, Any]:
+        """
+        작업 추가 (같은 task_id가 이미 있으면 기존 작업을 그대로 반환)
+
+        Args:
+            task_id: 작업 ID (TaskRequest.request_id)
+            task_type: 작업 종류
+            request: 워커가 다시 검증할 요청 본문
+            traceparent: 요청을 받은 span의 W3C traceparent (워커가 추적을 이어간다)
+            priority: 우선순위 레인
+            tenant: 같은 레인 안에서 공평하게 나눌 단위
+
+        Returns:
+            작업 상태 (get 참고)
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO tasks "
+                "(task_id, type, request, traceparent, priority, tenant, status, max_attempts, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    task_id, task_type, json.dumps(request, ensure_ascii=False), traceparent,
+                    priority, tenant, STATUS_QUEUED, self.max_attempts, time.time(),
+                )
+            )
+        return self.get(task_id)
+
+    def claim(
+        self,
+        worker_id: str,
+        lease_seconds: float,
+        priorities: Optional[Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        처리할 작업 하나를 가져와 리스 설정
+
+        대기 중인 작업과 리스가 만료된 실행 중 작업 중에서 우선순위가 높은 레인,
+        실행 중인 작업이 적은 테넌트, 오래된 작업 순으로 가져온다.
+        리스가 만료됐는데 시도 횟수를 모두 쓴 작업은 실패로 마감한다.
+
+        Args:
+            worker_id: 리스를 잡는 워커 ID
+            lease_seconds: 리스 유지 시간 (이 안에 heartbeat 또는 완료해야 한다)
+            priorities: 가져올 레인 (기본: 전체, 빈 목록이면 가져오지 않는다)
+
+        Returns:
+            {"task_id", "type", "request", "traceparent", "priority", "tenant", "attempts"}
+            또는 처리할 작업이 없으면 None
+        """
+        if priorities is not None and not priorities:
+            return None
+        lane_filter, lane_params = "", ()
+        if priorities is not None:
+            lane_filter = f"AND priority IN ({', '.join('?' for _ in priorities)}) "
+            lane_params = tuple(priorities)
+
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE tasks SET status = ?, error = ?, lease_owner = NULL, finished_at = ? "
+                "WHERE status = ? AND lease_expires_at <= ? AND attempts >= max_attempts",
+                (STATUS_FAILED, "Lease expired after maximum attempts", now, STATUS_RUNNING, now)
+            )
+            row = conn.execute(
+                "SELECT task_id, type, request, traceparent, priority, tenant, attempts FROM tasks AS t "
+                "WHERE (status = ? OR (status = ? AND lease_expires_at <= ?)) " + lane_filter +
+                "ORDER BY " + _PRIORITY_ORDER + ", "
+                "(SELECT COUNT(*) FROM tasks AS r WHERE r.status = ? AND r.tenant = t.tenant), "
+                "created_at LIMIT 1",
+                (STATUS_QUEUED, STATUS_RUNNING, now) + lane_params + (STATUS_RUNNING,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE tasks SET status = ?, attempts = attempts + 1, lease_owner = ?, "
+                "lease_expires_at = ?, started_at = ? WHERE task_id = ?",
+                (STATUS_RUNNING, worker_id, now + lease_seconds, now, row["task_id"])
+            )
+
+        return {
+            "task_id": row["task_id"],
+            "type": row["type"],
+            "request": json.loads(row["request"]),
+            "traceparent": row["traceparent"],
+            "priority": row["priority"],
+            "tenant": row["tenant"],
+            "attempts": row["attempts"] + 1,
+        }
+
+    def heartbeat(self, task_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """
+        리스 연장
+
+        Returns:
+            아직 이 워커가 리스를 갖고 있으면 True (만료되어 다른 워커가 가져갔으면 False)
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires_at = ? "
+                "WHERE task_id = ? AND lease_owner = ? AND status = ?",
+                (time.time() + lease_seconds, task_id, worker_id, STATUS_RUNNING)
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, task_id: str, worker_id: str, result: Any) -> bool:
+        """작업 성공 기록 (리스를 잃었으면 기록하지 않고 False)"""
+        return self._finish(task_id, worker_id, STATUS_SUCCEEDED, result=result)
+
+    def fail(self, task_id: str, worker_id: str, error: str) -> bool:
+        """작업 실패 기록 (처리 중 예외는 재시도하지 않는다, 리스를 잃었으면 False)"""
+        return self._finish(task_id, worker_id, STATUS_FAILED, error=error)
+
+    def _finish(
+        self,
+        task_id: str,
+        worker_id: str,
+        status: str,
+        result: Any = None,
+        error: Optional[str] = None
+    ) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = ?, result = ?, error = ?, lease_owner = NULL, "
+                "lease_expires_at = NULL, finished_at = ? "
+                "WHERE task_id = ? AND lease_owner = ? AND status = ?",
+                (
+                    status,
+                    json.dumps(result, ensure_ascii=False, default=str) if result is not None else None,
+                    error, time.time(), task_id, worker_id, STATUS_RUNNING,
+                )
+            )
+        return cursor.rowcount == 1
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 상태 조회
+
+        Returns:
+            {"request_id", "type", "status", "attempts", "created_at", "started_at",
+             "finished_at", "result", "error"} 또는 없으면 None
+        """
+        row = self._connect().execute(
+            "SELECT task_id, type, status, attempts, result, error, created_at, started_at, finished_at "
+            "FROM tasks WHERE task_id = ?",
+            (task_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        return {
+            "request_id": row["task_id"],
+            "type": row["type"],
+            "status": row["status"],
+            "attempts": row["attempts"],
+            "created_at": _isoformat(row["created_at"]),
+            "started_at": _isoformat(row["started_at"]),
+            "finished_at": _isoformat(row["finished_at"]),
+            "result": json.loads(row["result"]) if row["result"] is not None else None,
+            "error": row["error"],
+        }
+
+    def purge(self, older_than_seconds: float) -> int:
+        """끝난 지 older_than_seconds가 지난 작업 삭제
+
+        Returns:
+            삭제한 작업 수
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM tasks WHERE status IN (?, ?) AND finished_at < ?",
+                (STATUS_SUCCEEDED, STATUS_FAILED, time.time() - older_than_seconds)
+            )
+        return cursor.rowcount
@@ -0,0 +1,221 @@
+"""
+작업 큐 워커
+영속 큐(TaskQueue)에서 작업을 가져와 GoogleTaskRouter로 처리하고 결과를 기록
+HTTP 서버 안에서 돌리거나 `python -m src.task_worker`로 별도 프로세스로 띄워 수평 확장한다
+"""
+import asyncio
+import logging
+import os
+import signal
+import socket
+from typing import Any, Dict, Optional
+from uuid import uuid4
+
+from aiohttp import web
+
+from src.config import Config
+from src.http_server import GoogleTaskRouter, TaskRequest
+from src.scheduler import PRIORITIES, PRIORITY_INTERACTIVE
+from src.task_queue import TaskQueue
+from src.tracing import SPAN_KIND_SERVER, span
+
+
+logger = logging.getLogger(__name__)
+
+# 끝난 작업 정리 주기 (초)
+PURGE_INTERVAL_SECONDS = 3600.0
+
+
+class TaskWorker:
+    """큐 작업 처리기 (concurrency개의 작업을 동시에 처리)
+
+    레인별로 라우터 스케줄러의 최대 동시 실행 수까지만 가져오고, interactive가 아닌 레인들은
+    합쳐서 슬롯 하나를 남겨 두어 일괄 작업이 쌓여 있어도 대화형 작업을 바로 가져올 수 있다
+    (concurrency가 1이면 남겨 둘 슬롯이 없다).
+    """
+
+    def __init__(
+        self,
+        queue: TaskQueue,
+        router: GoogleTaskRouter,
+        concurrency: int = 4,
+        lease_seconds: float = 60.0,
+        poll_interval: float = 1.0,
+        retention_seconds: float = 7 * 24 * 3600,
+        worker_id: Optional[str] = None
+    ):
+        """
+        워커 초기화
+
+        Args:
+            queue: 작업 큐
+            router: 작업을 처리할 라우터
+            concurrency: 동시에 처리할 작업 수
+            lease_seconds: 작업 리스 시간 (처리 중에는 1/3마다 연장)
+            poll_interval: 큐가 비었을 때 다시 확인하는 간격 (초)
+            retention_seconds: 끝난 작업 결과 보관 기간 (초)
+            worker_id: 리스 소유자 ID (기본: 호스트:PID:임의값)
+        """
+        self.queue = queue
+        self.router = router
+        self.concurrency = max(1, concurrency)
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._lane_limits = {
+            priority: min(router.scheduler.lane_limit(priority), self.concurrency)
+            for priority in PRIORITIES
+        }
+        self._lane_active = {priority: 0 for priority in PRIORITIES}
+        # interactive가 아닌 레인이 함께 쓸 수 있는 슬롯 수
+        self._background_limit = max(1, self.concurrency - 1)
+
+    async def run(self, stop_event: asyncio.Event):
+        """stop_event가 설정될 때까지 작업 처리 (진행 중인 작업은 끝까지 처리)"""
+        purge_task = asyncio.create_task(self._purge_loop(stop_event))
+        try:
+            await asyncio.gather(*(self._slot_loop(stop_event) for _ in range(self.concurrency)))
+        finally:
+            purge_task.cancel()
+            await asyncio.gather(purge_task, return_exceptions=True)
+
+    async def _slot_loop(self, stop_event: asyncio.Event):
+        while not stop_event.is_set():
+            background = sum(
+                active for priority, active in self._lane_active.items() if priority != PRIORITY_INTERACTIVE
+            )
+            priorities = [
+                priority for priority in PRIORITIES
+                if self._lane_active[priority] < self._lane_limits[priority]
+                and (priority == PRIORITY_INTERACTIVE or background < self._background_limit)
+            ]
+            try:
+                claimed = await asyncio.to_thread(self.queue.claim, self.worker_id, self.lease_seconds, priorities)
+            except Exception:
+                logger.exception("Task queue claim failed")
+                claimed = None
+
+            if claimed is None:
+                await _wait(stop_event, self.poll_interval)
+                continue
+
+            lane = claimed["priority"] if claimed["priority"] in self._lane_active else PRIORITY_INTERACTIVE
+            self._lane_active[lane] += 1
+            try:
+                await self.process(claimed)
+            except Exception as exc:
+                # 결과 기록(SQLite) 실패나 처리 코드 버그가 나도 다른 슬롯과 함께 루프는 계속 돈다
+                logger.exception("Task %s: processing failed", claimed["task_id"])
+                await self._release_failed(claimed["task_id"], f"Worker error: {exc}")
+            finally:
+                self._lane_active[lane] -= 1
+
+    async def process(self, claimed: Dict[str, Any]):
+        """가져온 작업 하나를 처리하고 결과 기록 (리스는 처리하는 동안 계속 연장)"""
+        task_id = claimed["task_id"]
+        with span(
+            "task_queue.process",
+            kind=SPAN_KIND_SERVER,
+            traceparent=claimed.get("traceparent"),
+            **{"task.type": claimed["type"], "task.request_id": task_id, "task.attempt": claimed["attempts"]},
+        ) as current:
+            result: Any = None
+            error: Optional[str] = None
+            heartbeat = asyncio.create_task(self._keep_lease(task_id))
+            try:
+                task = TaskRequest.model_validate(claimed["request"])
+                result = await self.router.dispatch(task)
+            except web.HTTPException as exc:
+                error = exc.text or exc.reason
+            except Exception as exc:
+                error = str(exc)
+            finally:
+                heartbeat.cancel()
+                await asyncio.gather(heartbeat, return_exceptions=True)
+
+            if error is None:
+                recorded = await asyncio.to_thread(self.queue.complete, task_id, self.worker_id, result)
+            else:
+                current.set_error(error)
+                recorded = await asyncio.to_thread(self.queue.fail, task_id, self.worker_id, error)
+
+            if not recorded:
+                # 리스가 만료되어 다른 워커가 가져간 작업 (그쪽 결과가 기록된다)
+                logger.warning("Task %s: lease lost, result discarded", task_id)
+
+    async def _release_failed(self, task_id: str, error: str):
+        """처리 중 예외가 난 작업을 실패로 기록해 리스 반납 (기록도 실패하면 리스 만료 후 다시 시도된다)"""
+        try:
+            await asyncio.to_thread(self.queue.fail, task_id, self.worker_id, error)
+        except Exception:
+            logger.exception("Task %s: could not record failure", task_id)
+
+    async def _keep_lease(self, task_id: str):
+        """처리하는 동안 리스를 주기적으로 연장"""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                owned = await asyncio.to_thread(self.queue.heartbeat, task_id, self.worker_id, self.lease_seconds)
+            except Exception as exc:
+                logger.warning("Task %s: heartbeat failed: %s", task_id, exc)
+                continue
+            if not owned:
+                logger.warning("Task %s: lease lost", task_id)
+                return
+
+    async def _purge_loop(self, stop_event: asyncio.Event):
+        """보관 기간이 지난 작업 결과 삭제"""
+        while not stop_event.is_set():
+            try:
+                await asyncio.to_thread(self.queue.purge, self.retention_seconds)
+            except Exception:
+                logger.exception("Task queue purge failed")
+            await _wait(stop_event, PURGE_INTERVAL_SECONDS)
+
+
+async def _wait(stop_event: asyncio.Event, timeout: float):
+    """timeout 동안 대기 (stop_event가 설정되면 바로 반환)"""
+    try:
+        await asyncio.wait_for(stop_event.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
+def create_worker(router: GoogleTaskRouter, queue: TaskQueue, concurrency: int) -> TaskWorker:
+    """설정값으로 워커 생성"""
+    return TaskWorker(
+        queue,
+        router,
+        concurrency=concurrency,
+        lease_seconds=Config.TASK_QUEUE_LEASE_SECONDS,
+        poll_interval=Config.TASK_QUEUE_POLL_SECONDS,
+        retention_seconds=Config.TASK_QUEUE_RETENTION_SECONDS,
+    )
+
+
+async def _run():
+    queue = TaskQueue(Config.TASK_QUEUE_DB, Config.TASK_QUEUE_MAX_ATTEMPTS)
+    worker = create_worker(GoogleTaskRouter(), queue, Config.TASK_WORKER_CONCURRENCY)
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            # Windows 이벤트 루프는 시그널 핸들러를 지원하지 않는다
+            pass
+
+    logger.info("Task worker %s started (concurrency=%d)", worker.worker_id, worker.concurrency)
+    await worker.run(stop_event)
+    logger.info("Task worker %s stopped", worker.worker_id)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+"""
+경량 분산 추적
+contextvars로 중첩 span을 만들고 W3C traceparent 헤더를 이어받아
+파일(JSON Lines) 또는 OTLP/HTTP(JSON) 수집기로 내보낸다
+"""
+import atexit
+import functools
+import inspect
+import json
+import logging
+import queue
+import secrets
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.config import Config
+
+
+# stdio MCP 모드에서는 stdout이 JSON-RPC 채널이므로 진단 메시지는 logging(기본 stderr)으로만 남긴다
+logger = logging.getLogger(__name__)
+
+
+# OTLP span 종류 / 상태 코드
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    """span 하나 (시작/종료 시각은 Unix epoch 나노초)"""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "kind",
+        "start_ns", "end_ns", "attributes", "status", "status_message"
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = dict(attributes or {})
+        self.status = STATUS_OK
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_error(self, message: str):
+        self.status = STATUS_ERROR
+        self.status_message = message
+
+    @property
+    def traceparent(self) -> str:
+        """이 span을 부모로 하는 W3C traceparent 헤더 값"""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": self.status, "message": self.status_message},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class _NoopSpan:
+    """추적이 꺼져 있을 때 쓰는 빈 span"""
+
+    traceparent = None
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_error(self, message: str):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str]]:
+    """
+    W3C traceparent 헤더 파싱
+
+    Returns:
+        (trace_id, parent_span_id) 또는 형식이 잘못되었으면 None
+    """
+    if not header:
+        return None
+    parts = header.strip().lower().split("-")
+    if len(parts) < 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    trace_id, span_id = parts[1], parts[2]
+    try:
+        int(trace_id, 16)
+        int(span_id, 16)
+    except ValueError:
+        return None
+    if trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return trace_id, span_id
+
+
+class FileSpanExporter:
+    """OTLP JSON 요청 본문을 한 줄씩 파일에 추가"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def export(self, payload: Dict[str, Any]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+
+
+class OtlpHttpSpanExporter:
+    """OTLP/HTTP JSON 수집기(예: http://localhost:4318/v1/traces)로 전송"""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    def export(self, payload: Dict[str, Any]):
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class Tracer:
+    """span 생성기
+
+    끝난 span은 큐에 넣기만 하고, 백그라운드 스레드가 모아서 내보낸다.
+    exporter가 없으면 span을 만들지 않는다.
+    """
+
+    def __init__(
+        self,
+        exporter=None,
+        service_name: str = "law-mate-agent",
+        batch_size: int = 256,
+        flush_interval: float = 2.0
+    ):
+        self.exporter = exporter
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        kind: int = SPAN_KIND_INTERNAL,
+        traceparent: Optional[str] = None,
+        **attributes: Any
+    ) -> Iterator[Any]:
+        """
+        현재 span의 자식 span 실행 컨텍스트
+
+        Args:
+            name: span 이름
+            kind: OTLP span 종류
+            traceparent: 현재 span이 없을 때 이어받을 W3C traceparent 헤더
+            attributes: span 속성
+        """
+        if not self.enabled:
+            yield NOOP_SPAN
+            return
+
+        parent = _current_span.get()
+        if parent is not None:
+            trace_id, parent_id = parent.trace_id, parent.span_id
+        else:
+            trace_id, parent_id = parse_traceparent(traceparent) or (secrets.token_hex(16), None)
+
+        span = Span(name, trace_id, parent_id, kind, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.set_error(f"{type(exc).__name__}: {exc}")
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            self._record(span)
+
+    def _record(self, span: Span):
+        if self._worker is None:
+            with self._worker_lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(target=self._export_loop, name="span-exporter", daemon=True)
+                    self._worker.start()
+                    atexit.register(self.shutdown)
+        self._queue.put(span)
+
+    def _export_loop(self):
+        while True:
+            batch: List[Span] = []
+            stop = False
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+                    while len(batch) < self.batch_size:
+                        item = self._queue.get_nowait()
+                        if item is None:
+                            stop = True
+                            break
+                        batch.append(item)
+            except queue.Empty:
+                pass
+
+            if batch:
+                self._export(batch)
+            if stop:
+                return
+
+    def _export(self, batch: List[Span]):
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "src.tracing"},
+                    "spans": [span.to_otlp() for span in batch],
+                }],
+            }]
+        }
+        try:
+            self.exporter.export(payload)
+        except Exception as exc:
+            # 추적 실패가 요청 처리에 영향을 주지 않도록 한다
+            logger.warning("Span export failed: %s", exc)
+
+    def shutdown(self):
+        """남은 span을 모두 내보내고 종료"""
+        worker = self._worker
+        if worker is None or not worker.is_alive():
+            return
+        self._queue.put(None)
+        worker.join(timeout=5.0)
+
+
+def _exporter_from_config():
+    if Config.TRACING_EXPORTER == "file":
+        return FileSpanExporter(Config.TRACING_FILE)
+    if Config.TRACING_EXPORTER == "otlp":
+        return OtlpHttpSpanExporter(Config.TRACING_OTLP_ENDPOINT)
+    return None
+
+
+tracer = Tracer(_exporter_from_config(), service_name=Config.TRACING_SERVICE_NAME)
+
+
+def current_traceparent() -> Optional[str]:
+    """현재 span의 traceparent (응답 헤더나 하위 요청 전파용, span이 없으면 None)"""
+    current = _current_span.get()
+    return current.traceparent if current is not None else None
+
+
+def span(name: str, **kwargs: Any):
+    """전역 tracer의 span (Tracer.span 참고)"""
+    return tracer.span(name, **kwargs)
+
+
+def traced(name: Optional[str] = None, kind: int = SPAN_KIND_INTERNAL) -> Callable:
+    """함수 실행 전체를 span으로 감싸는 데코레이터 (동기/비동기 함수 모두 지원)"""
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with tracer.span(span_name, kind=kind):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with tracer.span(span_name, kind=kind):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
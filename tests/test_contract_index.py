@@ -0,0 +1,79 @@
+"""
+계약서 메타데이터 인덱스(ContractIndex) 검색 테스트
+"""
+import pytest
+
+from src.contract_index import ContractIndex, join_parties, split_parties
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = ContractIndex(tmp_path / "contracts.db")
+    index.upsert("f1", "임대차 계약서", contract_date="2026-01-15", parties=["Acme Corp", "김철수"])
+    index.upsert("f2", "용역 계약서", contract_date="2026-02-01", parties=["Acme Holdings", "Beta, Inc."])
+    index.upsert("f3", "100% 지분 양도", contract_date="2026-03-10", parties=["Gamma"])
+    index.upsert("f4", "nda_v2", contract_date="2026-03-31", parties=["Gamma"])
+    index.upsert("f5", "ndaxv2", parties=["Delta"])
+    return index
+
+
+def file_ids(result):
+    return sorted(contract["file_id"] for contract in result["contracts"])
+
+
+def test_party_prefix_match_ignores_case_and_spacing(index):
+    assert file_ids(index.search(party="acme")) == ["f1", "f2"]
+    assert file_ids(index.search(party="  ACME   corp ")) == ["f1"]
+    assert file_ids(index.search(party="김")) == ["f1"]
+    # 접두사 일치만 (중간 문자열은 찾지 않는다)
+    assert file_ids(index.search(party="corp")) == []
+
+
+def test_party_names_keep_commas(index):
+    assert file_ids(index.search(party="beta, inc")) == ["f2"]
+    result = index.search(party="beta")
+    assert result["contracts"][0]["parties"] == ["Acme Holdings", "Beta, Inc."]
+
+
+def test_date_range_is_inclusive(index):
+    assert file_ids(index.search(date_from="2026-02-01", date_to="2026-03-10")) == ["f2", "f3"]
+    assert file_ids(index.search(date_from="2026-03-01")) == ["f3", "f4"]
+    # 날짜가 없는 계약서는 날짜 조건에 걸리지 않는다
+    assert file_ids(index.search(date_to="2026-12-31")) == ["f1", "f2", "f3", "f4"]
+
+
+def test_filters_are_combined(index):
+    assert file_ids(index.search(party="gamma", date_to="2026-03-15")) == ["f3"]
+
+
+def test_name_like_escapes_wildcards(index):
+    assert file_ids(index.search(name="100%")) == ["f3"]
+    assert file_ids(index.search(name="%")) == ["f3"]
+    assert file_ids(index.search(name="nda_")) == ["f4"]
+    assert file_ids(index.search(name="_")) == ["f4"]
+    assert file_ids(index.search(name="NDA")) == ["f4", "f5"]
+
+
+def test_upsert_replaces_parties(index):
+    index.upsert("f1", "임대차 계약서", contract_date="2026-01-15", parties=["Omega"])
+    assert file_ids(index.search(party="acme")) == ["f2"]
+    assert file_ids(index.search(party="omega")) == ["f1"]
+
+
+def test_remove(index):
+    index.remove("f3")
+    assert not index.contains("f3")
+    assert file_ids(index.search(party="gamma")) == ["f4"]
+
+
+def test_search_orders_by_date_and_limits(index):
+    result = index.search(limit=2)
+    assert result["count"] == 2
+    assert [contract["file_id"] for contract in result["contracts"]] == ["f4", "f3"]
+
+
+def test_split_parties_round_trip():
+    parties = ["Beta, Inc.", "김철수"]
+    assert split_parties(join_parties(parties)) == parties
+    assert split_parties("Acme, Beta") == ["Acme", "Beta"]
+    assert split_parties(None) == []
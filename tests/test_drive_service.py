@@ -0,0 +1,119 @@
+"""
+DriveService.share_files 테스트
+Google 클라이언트 대신 배치 요청을 흉내 내는 가짜 서비스로 권한 조회/생성 흐름을 확인한다
+"""
+import socket
+
+import pytest
+
+pytest.importorskip("googleapiclient")
+
+from src.google_services.drive_service import DriveService
+
+
+class FakeBatch:
+    def __init__(self, service):
+        self.service = service
+        self.requests = []
+
+    def add(self, request, callback):
+        self.requests.append((request, callback))
+
+    def execute(self):
+        error = self.service.batch_errors.pop(self.requests[0][0][0], None)
+        if error is not None:
+            raise error
+        for request, callback in self.requests:
+            callback(None, self.service.respond(request), None)
+
+
+class FakePermissions:
+    def __init__(self, service):
+        self.service = service
+
+    def list(self, fileId, **kwargs):
+        return ("list", fileId)
+
+    def create(self, fileId, body, **kwargs):
+        return ("create", fileId, body["emailAddress"], body["role"])
+
+
+class FakeDriveApi:
+    """파일 ID -> {이메일: 권한}을 보관하는 Drive API 대역"""
+
+    def __init__(self, permissions):
+        self.permissions_by_file = permissions
+        # 요청 종류("list"/"create") -> 다음 배치 실행에서 낼 오류
+        self.batch_errors = {}
+        self.calls = []
+
+    def new_batch_http_request(self):
+        return FakeBatch(self)
+
+    def permissions(self):
+        return FakePermissions(self)
+
+    def respond(self, request):
+        self.calls.append(request)
+        if request[0] == "list":
+            return {"permissions": [
+                {"emailAddress": email, "role": role}
+                for email, role in self.permissions_by_file.get(request[1], {}).items()
+            ]}
+        _, file_id, email, role = request
+        self.permissions_by_file.setdefault(file_id, {})[email] = role
+        return {"id": f"perm-{file_id}-{email}"}
+
+
+def make_service(permissions, ttl=60.0):
+    service = DriveService.__new__(DriveService)
+    service.service = FakeDriveApi(permissions)
+    service._permission_cache = {}
+    service._permission_loaded_at = {}
+    service.permission_cache_ttl = ttl
+    return service
+
+
+def test_skips_existing_grants():
+    service = make_service({"f1": {"a@example.com": "writer"}})
+
+    results = service.share_files([("f1", "a@example.com", "reader"), ("f1", "b@example.com", "reader")])
+
+    assert results[0]["skipped"] and results[0]["role"] == "writer"
+    assert results[1]["success"] and results[1]["permission_id"] == "perm-f1-b@example.com"
+
+
+def test_transport_error_is_reported_per_grant():
+    service = make_service({"f1": {}, "f2": {}})
+    # 권한 조회 배치는 성공하고 생성 배치에서 연결 시간 초과
+    service.service.batch_errors["create"] = socket.timeout("timed out")
+    grants = [("f1", "a@example.com", "reader"), ("f2", "b@example.com", "reader")]
+
+    results = service.share_files(grants)
+
+    assert [result["success"] for result in results] == [False, False]
+    assert results[0]["file_id"] == "f1" and results[1]["shared_with"] == "b@example.com"
+    assert "timed out" in results[0]["error"]
+
+
+def test_listing_transport_error_is_reported_without_creating():
+    service = make_service({"f1": {}})
+    service.service.batch_errors["list"] = OSError("connection reset")
+
+    results = service.share_files([("f1", "a@example.com", "reader")])
+
+    assert not results[0]["success"]
+    assert "connection reset" in results[0]["error"]
+    assert not [call for call in service.service.calls if call[0] == "create"]
+
+
+def test_expired_permission_cache_is_reloaded():
+    service = make_service({"f1": {"a@example.com": "reader"}}, ttl=0.0)
+    assert service.share_files([("f1", "a@example.com", "reader")])[0]["skipped"]
+
+    # 외부에서 공유를 회수하면 TTL이 지난 뒤에는 다시 조회해 공유한다
+    service.service.permissions_by_file["f1"].clear()
+    results = service.share_files([("f1", "a@example.com", "reader")])
+
+    assert results[0]["success"] and not results[0].get("skipped")
+    assert results[0]["permission_id"] == "perm-f1-a@example.com"
@@ -0,0 +1,79 @@
+"""
+HTTP 게이트웨이 테스트
+drive_download의 저장 경로가 다운로드 디렉토리 밖을 가리키지 못하는지 확인한다
+"""
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("pydantic")
+
+from aiohttp import web
+
+from src.config import Config
+from src.http_server import GoogleTaskRouter, _download_to_path, resolve_download_path
+
+
+@pytest.fixture
+def download_dir(tmp_path, monkeypatch):
+    root = tmp_path / "downloads"
+    root.mkdir()
+    monkeypatch.setattr(Config, "DRIVE_DOWNLOAD_DIR", root)
+    return os.path.realpath(root)
+
+
+def test_relative_path_resolves_inside_download_dir(download_dir):
+    assert resolve_download_path("contracts/lease.pdf") == os.path.join(download_dir, "contracts", "lease.pdf")
+    assert resolve_download_path(os.path.join(download_dir, "a.pdf")) == os.path.join(download_dir, "a.pdf")
+
+
+@pytest.mark.parametrize("destination", ["../escape.pdf", "contracts/../../escape.pdf", "/etc/passwd", ".", ""])
+def test_paths_outside_download_dir_are_rejected(download_dir, destination):
+    with pytest.raises(ValueError):
+        resolve_download_path(destination)
+
+
+def test_symlink_out_of_download_dir_is_rejected(download_dir, tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    os.symlink(outside, os.path.join(download_dir, "link"))
+
+    with pytest.raises(ValueError):
+        resolve_download_path("link/token.json")
+
+
+def test_drive_download_task_rejects_escaping_path(download_dir):
+    async def download_drive_file(*args):
+        raise AssertionError("must not download")
+
+    router = SimpleNamespace(download_drive_file=download_drive_file)
+    with pytest.raises(web.HTTPBadRequest):
+        asyncio.run(GoogleTaskRouter._handle_drive_download(
+            router, {"file_id": "f1", "destination_path": "../../src/http_server.py"}
+        ))
+
+
+def test_download_to_path_keeps_existing_file_on_failure(download_dir):
+    destination = resolve_download_path("lease.pdf")
+    with open(destination, "wb") as f:
+        f.write(b"old")
+
+    class FailingDrive:
+        def download_file(self, file_id, sink):
+            sink.write(b"partial")
+            return {"success": False, "error": "boom"}
+
+    class WorkingDrive:
+        def download_file(self, file_id, sink):
+            sink.write(b"new")
+            return {"success": True, "file_id": file_id}
+
+    assert not _download_to_path(FailingDrive(), "f1", destination)["success"]
+    assert open(destination, "rb").read() == b"old"
+    assert os.listdir(download_dir) == ["lease.pdf"]
+
+    assert _download_to_path(WorkingDrive(), "f1", destination)["saved_path"] == destination
+    assert open(destination, "rb").read() == b"new"
@@ -0,0 +1,45 @@
+"""
+MCP 도구 핸들러 테스트
+Google 호출 대신 서비스 대역으로 핸들러가 넘기는 인자를 확인한다
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("mcp")
+pytest.importorskip("googleapiclient")
+
+from src.config import Config
+from src.google_services.calendar_service import build_event_patch
+from src.mcp_server import GoogleServicesMCPServer
+
+
+class StubCalendarService:
+    """patch_events 인자를 기록하고 만들어질 patch 본문을 돌려준다"""
+
+    def __init__(self):
+        self.calls = []
+
+    def patch_events(self, updates, calendar_id="primary", timezone="Asia/Seoul", progress_callback=None):
+        self.calls.append({"updates": updates, "timezone": timezone})
+        return [
+            {"success": True, "patch": build_event_patch({"all_day": False, **update}, timezone)}
+            for update in updates
+        ]
+
+
+def test_update_events_bulk_uses_default_timezone(monkeypatch):
+    monkeypatch.setattr(Config, "DEFAULT_TIMEZONE", "America/New_York")
+    calendar = StubCalendarService()
+    server = GoogleServicesMCPServer(router=SimpleNamespace(calendar_service=calendar, calendar_mirror=None))
+
+    contents = asyncio.run(server._handle_update_events_bulk({
+        "updates": [{"event_id": "e1", "start_time": "2026-03-02T10:00:00", "end_time": "2026-03-02T11:00:00"}],
+    }))
+
+    assert calendar.calls[0]["timezone"] == "America/New_York"
+    patch = json.loads(contents[0].text)[0]["patch"]
+    assert patch["start"] == {"dateTime": "2026-03-02T10:00:00", "timeZone": "America/New_York"}
+    assert patch["end"]["timeZone"] == "America/New_York"
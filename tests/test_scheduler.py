@@ -0,0 +1,138 @@
+"""
+우선순위 레인 스케줄러(FairScheduler) 테스트
+슬롯 하나를 막아 둔 채 대기열을 채운 뒤 풀어서 슬롯이 배정되는 순서를 확인한다
+"""
+import asyncio
+
+import pytest
+
+from src.scheduler import (
+    DEFAULT_LANES, PRIORITY_BATCH, PRIORITY_INTERACTIVE, PRIORITY_NORMAL, FairScheduler, parse_lanes
+)
+
+
+async def _grant_order(scheduler, waiters):
+    """슬롯을 모두 막아 둔 상태에서 waiters를 대기시키고, 풀었을 때 슬롯을 받은 순서 반환"""
+    order = []
+    gate = asyncio.Event()
+
+    async def hold():
+        async with scheduler.slot(PRIORITY_NORMAL):
+            await gate.wait()
+
+    async def wait_for_slot(index, priority, tenant):
+        async with scheduler.slot(priority, tenant):
+            order.append((priority, tenant, index))
+            await asyncio.sleep(0)
+
+    holders = [asyncio.create_task(hold()) for _ in range(scheduler.max_concurrency)]
+    await asyncio.sleep(0)
+    tasks = [
+        asyncio.create_task(wait_for_slot(index, priority, tenant))
+        for index, (priority, tenant) in enumerate(waiters)
+    ]
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(*holders, *tasks)
+    return order
+
+
+def test_lanes_share_slots_by_weight():
+    waiters = [(PRIORITY_BATCH, "a")] * 10 + [(PRIORITY_INTERACTIVE, "a")] * 20
+    order = asyncio.run(_grant_order(FairScheduler(max_concurrency=1), waiters))
+
+    lanes = [priority for priority, _, _ in order]
+    # 동시에 대기하면 높은 레인이 먼저 받고, 이후 가중치(8:1)대로 나눈다
+    assert lanes[0] == PRIORITY_INTERACTIVE
+    assert lanes[:18].count(PRIORITY_INTERACTIVE) == 16
+    assert lanes[:18].count(PRIORITY_BATCH) == 2
+
+
+def test_low_lane_is_not_starved():
+    waiters = [(PRIORITY_BATCH, "a")] * 3 + [(PRIORITY_INTERACTIVE, "a")] * 100
+    order = asyncio.run(_grant_order(FairScheduler(max_concurrency=1), waiters))
+
+    lanes = [priority for priority, _, _ in order]
+    # interactive가 계속 쌓여 있어도 batch는 가중치만큼의 몫을 받는다
+    assert lanes[:10].count(PRIORITY_BATCH) >= 1
+    assert lanes[:30].count(PRIORITY_BATCH) == 3
+
+
+def test_tenants_in_lane_take_turns():
+    waiters = [(PRIORITY_NORMAL, "a")] * 6 + [(PRIORITY_NORMAL, "b")] * 2
+    order = asyncio.run(_grant_order(FairScheduler(max_concurrency=1), waiters))
+
+    tenants = [tenant for _, tenant, _ in order]
+    # 먼저 많이 쌓은 테넌트가 있어도 나중 테넌트는 번갈아 받는다
+    assert tenants[:4] == ["a", "b", "a", "b"]
+    # 같은 테넌트 안에서는 들어온 순서대로
+    assert [index for _, tenant, index in order if tenant == "a"] == list(range(6))
+
+
+def test_lane_concurrency_limit_leaves_slots_for_other_lanes():
+    lanes = dict(DEFAULT_LANES)
+    lanes[PRIORITY_BATCH] = (1.0, 1)
+    scheduler = FairScheduler(lanes, max_concurrency=4)
+
+    async def scenario():
+        release = asyncio.Event()
+        running = []
+
+        async def work(priority):
+            async with scheduler.slot(priority):
+                running.append(priority)
+                await release.wait()
+
+        tasks = [asyncio.create_task(work(PRIORITY_BATCH)) for _ in range(3)]
+        tasks.append(asyncio.create_task(work(PRIORITY_INTERACTIVE)))
+        await asyncio.sleep(0)
+        stats = scheduler.stats()
+        release.set()
+        await asyncio.gather(*tasks)
+        return running, stats
+
+    running, stats = asyncio.run(scenario())
+    assert sorted(running[:2]) == [PRIORITY_BATCH, PRIORITY_INTERACTIVE]
+    assert stats[PRIORITY_BATCH] == {"active": 1, "waiting": 2}
+    assert stats[PRIORITY_INTERACTIVE] == {"active": 1, "waiting": 0}
+
+
+def test_cancelled_waiter_does_not_take_slot():
+    scheduler = FairScheduler(max_concurrency=1)
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def hold():
+            async with scheduler.slot():
+                await gate.wait()
+
+        async def wait_for_slot():
+            async with scheduler.slot():
+                pass
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(wait_for_slot())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        gate.set()
+        await holder
+
+        # 취소된 대기자 몫이 남지 않아 다음 요청이 바로 슬롯을 받는다
+        await asyncio.wait_for(wait_for_slot(), timeout=1)
+        return scheduler.stats()
+
+    stats = asyncio.run(scenario())
+    assert all(lane == {"active": 0, "waiting": 0} for lane in stats.values())
+
+
+def test_parse_lanes():
+    lanes = parse_lanes("interactive:2:3, batch:0.5:1")
+    assert lanes[PRIORITY_INTERACTIVE] == (2.0, 3)
+    assert lanes[PRIORITY_BATCH] == (0.5, 1)
+    assert lanes[PRIORITY_NORMAL] == DEFAULT_LANES[PRIORITY_NORMAL]
+
+    with pytest.raises(ValueError):
+        parse_lanes("urgent:1:1")
@@ -0,0 +1,97 @@
+"""
+일정 충돌 검사(BusySchedule) 테스트
+구간은 [시작, 종료) 반열린 구간으로 다룬다
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.google_services.scheduling import BusySchedule, require_aware
+
+
+def at(hour, minute=0):
+    return datetime(2026, 3, 2, hour, minute, tzinfo=timezone.utc)
+
+
+MINUTES_30 = timedelta(minutes=30)
+HOUR = timedelta(hours=1)
+
+
+def test_overlapping_and_touching_intervals_are_merged():
+    schedule = BusySchedule([
+        (at(13), at(14)),
+        (at(9), at(10)),
+        (at(9, 30), at(10, 30)),
+        (at(10, 30), at(11)),
+        (at(12), at(12)),  # 길이가 0인 구간은 무시
+    ])
+
+    assert len(schedule) == 2
+    assert schedule.conflicts(at(8), at(15)) == [(at(9), at(11)), (at(13), at(14))]
+
+
+def test_conflicts_use_half_open_boundaries():
+    schedule = BusySchedule([(at(10), at(11))])
+
+    # 바쁜 구간 바로 앞/뒤에 맞닿는 시간은 비어 있다
+    assert schedule.is_free(at(9), at(10))
+    assert schedule.is_free(at(11), at(12))
+    assert schedule.conflicts(at(9), at(10, 1)) == [(at(10), at(11))]
+    assert schedule.conflicts(at(10, 59), at(12)) == [(at(10), at(11))]
+    assert schedule.conflicts(at(10, 15), at(10, 45)) == [(at(10), at(11))]
+
+
+def test_conflicts_between_busy_intervals():
+    schedule = BusySchedule([(at(9), at(10)), (at(11), at(12)), (at(13), at(14))])
+
+    assert schedule.is_free(at(10), at(11))
+    assert schedule.conflicts(at(9, 30), at(13, 30)) == [
+        (at(9), at(10)), (at(11), at(12)), (at(13), at(14)),
+    ]
+    assert BusySchedule().is_free(at(0), at(23))
+
+
+def test_earliest_free_slot_fits_gap_exactly():
+    schedule = BusySchedule([(at(9), at(10)), (at(11), at(12))])
+
+    assert schedule.earliest_free_slot(HOUR, at(9), at(17)) == (at(10), at(11))
+    # 한 시간 반은 10~11시 틈에 들어가지 않는다
+    assert schedule.earliest_free_slot(HOUR + MINUTES_30, at(9), at(17)) == (at(12), at(13, 30))
+
+
+def test_earliest_free_slot_starts_inside_busy_interval():
+    schedule = BusySchedule([(at(9), at(10))])
+
+    assert schedule.earliest_free_slot(MINUTES_30, at(9, 20), at(17)) == (at(10), at(10, 30))
+
+
+def test_earliest_free_slot_aligns_to_step():
+    schedule = BusySchedule([(at(9), at(10, 5))])
+    step = timedelta(minutes=15)
+
+    # 창 시작 기준 15분 단위로 올림
+    assert schedule.earliest_free_slot(MINUTES_30, at(9), at(17), step) == (at(10, 15), at(10, 45))
+    assert schedule.earliest_free_slot(MINUTES_30, at(9), at(17)) == (at(10, 5), at(10, 35))
+
+
+def test_earliest_free_slot_step_past_window_end():
+    schedule = BusySchedule([(at(9), at(10, 5))])
+
+    # 10:05부터는 들어가지만 15분 단위로 올리면 창을 넘는다
+    assert schedule.earliest_free_slot(MINUTES_30, at(9), at(10, 35)) == (at(10, 5), at(10, 35))
+    assert schedule.earliest_free_slot(MINUTES_30, at(9), at(10, 35), timedelta(minutes=15)) is None
+
+
+def test_earliest_free_slot_none_when_window_busy():
+    schedule = BusySchedule([(at(8), at(18))])
+
+    assert schedule.earliest_free_slot(MINUTES_30, at(9), at(17)) is None
+    assert schedule.earliest_free_slot(HOUR, at(9), at(9, 30)) is None
+
+
+def test_require_aware_rejects_naive_datetime():
+    aware = at(9)
+    assert require_aware(aware, "start") is aware
+
+    with pytest.raises(ValueError, match="start"):
+        require_aware(datetime(2026, 3, 2, 9), "start")
@@ -0,0 +1,40 @@
+"""
+진입점 기동 시간 테스트
+src.http_server / src.mcp_server를 새 인터프리터에서 import해 시간 예산을 지키는지,
+지연 로딩해야 할 Google 클라이언트 모듈을 불러오지 않는지 확인한다
+(측정 방식과 예산은 benchmarks.startup과 같다, 느린 CI에서는 STARTUP_BUDGET_SCALE로 완화)
+"""
+import os
+
+import pytest
+
+from benchmarks.startup import IMPORT_BUDGETS, probe
+
+
+# 진입점별로 import에 필요한 서드파티 패키지 (없는 환경에서는 건너뛴다)
+REQUIRED_PACKAGES = {
+    "src.http_server": ("aiohttp", "pydantic", "dotenv"),
+    "src.mcp_server": ("aiohttp", "pydantic", "dotenv", "mcp"),
+}
+
+REPEATS = 3
+
+
+@pytest.fixture(params=sorted(IMPORT_BUDGETS))
+def entry_point(request):
+    for package in REQUIRED_PACKAGES[request.param]:
+        pytest.importorskip(package)
+    return request.param
+
+
+def test_entry_point_does_not_load_lazy_modules(entry_point):
+    assert probe(entry_point)["loaded"] == []
+
+
+def test_entry_point_import_within_budget(entry_point):
+    # 첫 실행은 디스크 캐시/바이트코드 컴파일 워밍업으로 제외하고 최솟값으로 판단
+    probe(entry_point)
+    seconds = min(probe(entry_point)["seconds"] for _ in range(REPEATS))
+    budget = IMPORT_BUDGETS[entry_point] * float(os.getenv("STARTUP_BUDGET_SCALE", "1"))
+
+    assert seconds <= budget, f"{entry_point} import took {seconds * 1000:.1f}ms (budget {budget * 1000:.0f}ms)"
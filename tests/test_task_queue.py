@@ -0,0 +1,142 @@
+"""
+영속 작업 큐(TaskQueue) 테스트
+리스 소유권 검사와 최소 한 번 처리 동작을 확인한다
+"""
+import time
+
+import pytest
+
+from src.task_queue import STATUS_FAILED, STATUS_QUEUED, STATUS_RUNNING, STATUS_SUCCEEDED, TaskQueue
+
+
+REQUEST = {"type": "send_email", "request_id": "t1", "data": {"to": "a@example.com"}}
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return TaskQueue(tmp_path / "tasks.db", max_attempts=3)
+
+
+def test_enqueue_and_claim(queue):
+    queued = queue.enqueue("t1", "send_email", REQUEST, traceparent="00-abc-def-01")
+    assert queued["status"] == STATUS_QUEUED
+    assert queued["attempts"] == 0
+
+    claimed = queue.claim("w1", lease_seconds=60)
+    assert claimed["task_id"] == "t1"
+    assert claimed["type"] == "send_email"
+    assert claimed["request"] == REQUEST
+    assert claimed["traceparent"] == "00-abc-def-01"
+    assert claimed["attempts"] == 1
+    assert queue.get("t1")["status"] == STATUS_RUNNING
+
+    # 리스가 살아 있는 동안에는 다른 워커가 가져가지 않는다
+    assert queue.claim("w2", lease_seconds=60) is None
+
+
+def test_enqueue_same_id_keeps_existing_task(queue):
+    queue.enqueue("t1", "send_email", REQUEST)
+    queue.claim("w1", lease_seconds=60)
+
+    again = queue.enqueue("t1", "send_email", {"other": True})
+    assert again["status"] == STATUS_RUNNING
+    assert queue.claim("w2", lease_seconds=60) is None
+
+
+def test_complete_records_result(queue):
+    queue.enqueue("t1", "send_email", REQUEST)
+    queue.claim("w1", lease_seconds=60)
+
+    assert queue.complete("t1", "w1", {"message_id": "m1"})
+    task = queue.get("t1")
+    assert task["status"] == STATUS_SUCCEEDED
+    assert task["result"] == {"message_id": "m1"}
+    assert task["finished_at"] is not None
+
+
+def test_expired_lease_is_reclaimed(queue):
+    queue.enqueue("t1", "send_email", REQUEST)
+    queue.claim("w1", lease_seconds=0)
+
+    reclaimed = queue.claim("w2", lease_seconds=60)
+    assert reclaimed["task_id"] == "t1"
+    assert reclaimed["attempts"] == 2
+    assert queue.get("t1")["attempts"] == 2
+
+
+def test_stale_owner_is_rejected(queue):
+    queue.enqueue("t1", "send_email", REQUEST)
+    queue.claim("w1", lease_seconds=0)
+    queue.claim("w2", lease_seconds=60)
+
+    assert not queue.heartbeat("t1", "w1", lease_seconds=60)
+    assert not queue.complete("t1", "w1", {"from": "w1"})
+    assert not queue.fail("t1", "w1", "boom")
+    assert queue.get("t1")["status"] == STATUS_RUNNING
+
+    assert queue.heartbeat("t1", "w2", lease_seconds=60)
+    assert queue.complete("t1", "w2", {"from": "w2"})
+    assert queue.get("t1")["result"] == {"from": "w2"}
+
+
+def test_fail_is_not_retried(queue):
+    queue.enqueue("t1", "send_email", REQUEST)
+    queue.claim("w1", lease_seconds=60)
+
+    assert queue.fail("t1", "w1", "boom")
+    task = queue.get("t1")
+    assert task["status"] == STATUS_FAILED
+    assert task["error"] == "boom"
+    assert queue.claim("w2", lease_seconds=0) is None
+
+
+def test_max_attempts_marks_task_failed(tmp_path):
+    queue = TaskQueue(tmp_path / "tasks.db", max_attempts=2)
+    queue.enqueue("t1", "send_email", REQUEST)
+
+    assert queue.claim("w1", lease_seconds=0)["attempts"] == 1
+    assert queue.claim("w2", lease_seconds=0)["attempts"] == 2
+    # 시도 횟수를 모두 쓴 뒤 리스가 만료되면 다시 가져가지 않고 실패로 마감
+    assert queue.claim("w3", lease_seconds=60) is None
+
+    task = queue.get("t1")
+    assert task["status"] == STATUS_FAILED
+    assert task["attempts"] == 2
+    assert task["error"] == "Lease expired after maximum attempts"
+
+
+def test_purge_removes_only_old_finished_tasks(queue):
+    for task_id in ("t1", "t2", "t3", "t4"):
+        queue.enqueue(task_id, "send_email", REQUEST)
+    succeeded, failed, running = (queue.claim("w1", lease_seconds=60)["task_id"] for _ in range(3))
+    queue.complete(succeeded, "w1", {})
+    queue.fail(failed, "w1", "boom")
+
+    # 보관 기간이 남은 작업은 지우지 않는다
+    assert queue.purge(older_than_seconds=3600) == 0
+
+    time.sleep(0.01)
+    assert queue.purge(older_than_seconds=0) == 2
+    assert queue.get(succeeded) is None
+    assert queue.get(failed) is None
+    assert queue.get(running)["status"] == STATUS_RUNNING
+    (queued,) = {"t1", "t2", "t3", "t4"} - {succeeded, failed, running}
+    assert queue.get(queued)["status"] == STATUS_QUEUED
+
+
+def test_get_unknown_task(queue):
+    assert queue.get("missing") is None
+
+
+def test_claim_prefers_higher_lane_and_idle_tenant(queue):
+    queue.enqueue("batch", "bulk_send_emails", REQUEST, priority="batch")
+    queue.enqueue("a1", "send_email", REQUEST, priority="interactive", tenant="a")
+    queue.enqueue("a2", "send_email", REQUEST, priority="interactive", tenant="a")
+    queue.enqueue("b1", "send_email", REQUEST, priority="interactive", tenant="b")
+
+    assert queue.claim("w1", lease_seconds=60)["task_id"] == "a1"
+    # 같은 레인에서는 실행 중인 작업이 적은 테넌트 먼저
+    assert queue.claim("w1", lease_seconds=60)["task_id"] == "b1"
+    assert queue.claim("w1", lease_seconds=60, priorities=["batch"])["task_id"] == "batch"
+    assert queue.claim("w1", lease_seconds=60, priorities=[]) is None
+    assert queue.claim("w1", lease_seconds=60)["task_id"] == "a2"
@@ -0,0 +1,98 @@
+"""
+작업 큐 워커(TaskWorker) 테스트
+처리나 결과 기록 중 예외가 나도 리스를 반납하고 나머지 작업을 계속 처리하는지 확인한다
+"""
+import asyncio
+import sqlite3
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("pydantic")
+
+from src.scheduler import FairScheduler
+from src.task_queue import STATUS_FAILED, STATUS_SUCCEEDED, TaskQueue
+from src.task_worker import TaskWorker
+
+
+class StubRouter:
+    """Google 호출 없이 요청 ID를 돌려주는 라우터"""
+
+    def __init__(self):
+        self.scheduler = FairScheduler()
+
+    async def dispatch(self, task):
+        return {"success": True, "request_id": task.request_id}
+
+
+class FlakyQueue(TaskQueue):
+    """지정한 작업의 결과 기록에서 한 번 SQLite 오류를 내는 큐"""
+
+    def __init__(self, db_path, broken_task_id):
+        super().__init__(db_path)
+        self.broken_task_id = broken_task_id
+
+    def complete(self, task_id, worker_id, result):
+        if task_id == self.broken_task_id:
+            self.broken_task_id = None
+            raise sqlite3.OperationalError("database is locked")
+        return super().complete(task_id, worker_id, result)
+
+
+def _request(task_id):
+    return {"request_id": task_id, "type": "email", "payload": {"to": "a@example.com"}}
+
+
+async def _drain(worker, task_ids, timeout=5.0):
+    """task_ids가 모두 끝날 때까지 워커 실행"""
+    stop_event = asyncio.Event()
+    run = asyncio.create_task(worker.run(stop_event))
+    try:
+        deadline = asyncio.get_running_loop().time() + timeout
+        while any(worker.queue.get(task_id)["status"] not in (STATUS_SUCCEEDED, STATUS_FAILED) for task_id in task_ids):
+            assert not run.done(), "worker stopped before draining the queue"
+            assert asyncio.get_running_loop().time() < deadline, "queue was not drained"
+            await asyncio.sleep(0.01)
+    finally:
+        stop_event.set()
+        await asyncio.wait_for(run, timeout)
+
+
+def test_worker_keeps_draining_after_record_error(tmp_path):
+    queue = FlakyQueue(tmp_path / "tasks.db", broken_task_id="t1")
+    task_ids = ["t1", "t2", "t3"]
+    for task_id in task_ids:
+        queue.enqueue(task_id, "email", _request(task_id))
+
+    worker = TaskWorker(queue, StubRouter(), concurrency=2, poll_interval=0.01)
+    asyncio.run(_drain(worker, task_ids))
+
+    failed = queue.get("t1")
+    assert failed["status"] == STATUS_FAILED
+    assert "database is locked" in failed["error"]
+    for task_id in ("t2", "t3"):
+        task = queue.get(task_id)
+        assert task["status"] == STATUS_SUCCEEDED
+        assert task["result"] == {"success": True, "request_id": task_id}
+
+
+def test_worker_releases_lease_when_process_raises(tmp_path, monkeypatch):
+    queue = TaskQueue(tmp_path / "tasks.db")
+    task_ids = ["t1", "t2"]
+    for task_id in task_ids:
+        queue.enqueue(task_id, "email", _request(task_id))
+
+    worker = TaskWorker(queue, StubRouter(), concurrency=1, poll_interval=0.01)
+    process = worker.process
+
+    async def broken_process(claimed):
+        if claimed["task_id"] == "t1":
+            raise RuntimeError("handler bug")
+        await process(claimed)
+
+    monkeypatch.setattr(worker, "process", broken_process)
+    asyncio.run(_drain(worker, task_ids))
+
+    assert queue.get("t1")["status"] == STATUS_FAILED
+    assert queue.get("t1")["error"] == "Worker error: handler bug"
+    assert queue.get("t2")["status"] == STATUS_SUCCEEDED